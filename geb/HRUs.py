@@ -932,22 +932,27 @@ class Data:
         self.model.domestic_water_consumption_ds = xr.open_dataset(
             self.model.files["forcing"]["water_demand/domestic_water_consumption"],
             engine="zarr",
+            chunks={},
         )
         self.model.domestic_water_demand_ds = xr.open_dataset(
             self.model.files["forcing"]["water_demand/domestic_water_demand"],
             engine="zarr",
+            chunks={},
         )
         self.model.industry_water_consumption_ds = xr.open_dataset(
             self.model.files["forcing"]["water_demand/industry_water_consumption"],
             engine="zarr",
+            chunks={},
         )
         self.model.industry_water_demand_ds = xr.open_dataset(
             self.model.files["forcing"]["water_demand/industry_water_demand"],
             engine="zarr",
+            chunks={},
         )
         self.model.livestock_water_consumption_ds = xr.open_dataset(
             self.model.files["forcing"]["water_demand/livestock_water_consumption"],
             engine="zarr",
+            chunks={},
         )
 
     def to_HRU(self, *, data=None, fn=None):
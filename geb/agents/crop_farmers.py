@@ -1,19 +1,20 @@
 # -*- coding: utf-8 -*-
 import math
 from datetime import datetime
+from functools import lru_cache
 import json
-import copy
 import calendar
+import multiprocessing
 from typing import Tuple, Union
 
-from scipy.stats import genextreme
 from scipy.optimize import curve_fit
 
 # from gplearn.genetic import SymbolicRegressor
 from geb.workflows import TimingModule
 
 import numpy as np
-from numba import njit
+import pandas as pd
+from numba import njit, prange
 
 from ..workflows import balance_check
 
@@ -25,13 +26,359 @@ from ..data import (
     load_crop_data,
     load_economic_data,
 )
-from .decision_module import DecisionModule
+from .decision_module import DecisionModule, DecisionParams
 from .general import AgentBaseClass
 from ..store import DynamicArray
 from ..hydrology.landcover import GRASSLAND_LIKE, NON_PADDY_IRRIGATED, PADDY_IRRIGATED
 from ..HRUs import load_grid
 
 
+# explicit signatures trigger eager compilation at import time, so the first
+# call per process does not pay the JIT warmup; the machine code is cached
+# on disk keyed by signature
+@njit(
+    "float64[:](float32[:], float32[:], float32[:], float32[:])",
+    cache=True,
+    parallel=True,
+)
+def gev_sf(x, shape, loc, scale):
+    """Survival function of the generalized extreme value distribution.
+
+    Closed-form equivalent of `scipy.stats.genextreme.sf`, using SciPy's
+    shape parameter convention, with per-element distribution parameters.
+    Avoids SciPy's generic distribution dispatch and broadcasting overhead.
+    """
+    sf = np.empty(x.size, dtype=np.float64)
+    for i in prange(x.size):
+        z = (x[i] - loc[i]) / scale[i]
+        c = shape[i]
+        if abs(c) < 1e-8:  # Gumbel limit
+            sf[i] = 1.0 - math.exp(-math.exp(-z))
+        else:
+            t = 1.0 - c * z
+            if t > 0:
+                sf[i] = 1.0 - math.exp(-(t ** (1.0 / c)))
+            else:
+                # outside the support: cdf is 1 for c > 0 and 0 for c < 0
+                sf[i] = 0.0 if c > 0 else 1.0
+    return sf
+
+
+def batched_linear_fit(design, y, valid):
+    """Solves a least-squares fit for many groups at once.
+
+    Uses the normal equations so that all groups are solved with a single
+    batched call instead of a Python-level loop over groups. Invalid samples
+    must be zeroed out in both `design` and `y`.
+
+    Args:
+        design: design matrices of shape (n_groups, n_samples, n_params).
+        y: observations of shape (n_groups, n_samples).
+        valid: boolean validity mask of shape (n_groups, n_samples).
+
+    Returns:
+        coefficients: fitted parameters of shape (n_groups, n_params).
+        r_squared: R² per group, NaN for groups with fewer than two valid
+            samples or zero variance.
+    """
+    n_params = design.shape[-1]
+    XTX = np.einsum("gti,gtj->gij", design, design)
+    XTy = np.einsum("gti,gt->gi", design, y)
+    # small ridge term keeps groups with too few samples solvable; their
+    # results are discarded below
+    XTX += np.eye(n_params) * 1e-10
+    coefficients = np.linalg.solve(XTX, XTy[..., np.newaxis])[..., 0]
+
+    y_pred = np.einsum("gti,gi->gt", design, coefficients)
+    ss_res = np.sum((y - y_pred) ** 2, axis=1)
+    counts = valid.sum(axis=1)
+    y_mean = y.sum(axis=1) / np.maximum(counts, 1)
+    ss_tot = np.sum((y - y_mean[:, np.newaxis]) ** 2, axis=1, where=valid)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        r_squared = np.where(ss_tot != 0, 1 - ss_res / ss_tot, np.nan)
+    r_squared[counts < 2] = np.nan
+    return coefficients, r_squared
+
+
+# regression models for the yield-SPEI relation; defined at module level so
+# they can be pickled and dispatched to worker processes
+def yield_spei_linear_model(X, a, b):
+    return a * X + b
+
+
+def yield_spei_exponential_model(X, a, b):
+    return a * np.exp(b * X)
+
+
+def yield_spei_logarithmic_model(X, a, b):
+    return a * np.log(X) + b
+
+
+def yield_spei_quadratic_model(X, a, b, c):
+    return a * X**2 + b * X + c
+
+
+def yield_spei_power_model(X, a, b):
+    return a * X**b
+
+
+# analytic Jacobians for the regression models; these save SciPy the
+# (1 + n_params) extra model evaluations per step needed to estimate the
+# Jacobian numerically
+def yield_spei_linear_jac(X, a, b):
+    return np.stack([X, np.ones_like(X)], axis=1)
+
+
+def yield_spei_exponential_jac(X, a, b):
+    exp_bX = np.exp(b * X)
+    return np.stack([exp_bX, a * X * exp_bX], axis=1)
+
+
+def yield_spei_logarithmic_jac(X, a, b):
+    return np.stack([np.log(X), np.ones_like(X)], axis=1)
+
+
+def yield_spei_quadratic_jac(X, a, b, c):
+    return np.stack([X**2, X, np.ones_like(X)], axis=1)
+
+
+def yield_spei_power_jac(X, a, b):
+    X_pow_b = X**b
+    return np.stack([X_pow_b, a * X_pow_b * np.log(X)], axis=1)
+
+
+# SciPy's default tolerances are tighter than the data warrants; relaxed
+# tolerances and a lower evaluation budget make converging (and diverging)
+# fits cheaper
+CURVE_FIT_FTOL = 1e-5
+CURVE_FIT_XTOL = 1e-5
+CURVE_FIT_MAXFEV = 1000
+
+# below this number of agents the process startup outweighs the fits and the
+# models are fitted serially
+PARALLEL_FIT_THRESHOLD = 128
+
+
+def fit_yield_spei_models(data, warm_start=None):
+    """Fits the five yield-SPEI regression models for a single agent.
+
+    Module-level helper so that calculate_yield_spei_relation_test_solo can
+    dispatch the fits to worker processes.
+
+    Args:
+        data: tuple of the valid SPEI probabilities, yield ratios and
+            log-transformed SPEI probabilities.
+        warm_start: optional initial parameter guesses per model name,
+            typically the previous agent's converged fit.
+
+    Returns:
+        Dictionaries of R² and fitted coefficients per model name.
+    """
+    X_valid, y_valid, X_log = data
+
+    r_squared = {}
+    coefficients = {}
+
+    # The total sum of squares is identical for every model, so compute it
+    # once; np.dot on the residuals avoids the temporary array that
+    # np.sum((...) ** 2) allocates
+    y_centered = y_valid - np.mean(y_valid)
+    ss_tot = np.dot(y_centered, y_centered)
+
+    for model, model_function, jac, X in (
+        ("linear", yield_spei_linear_model, yield_spei_linear_jac, X_log),
+        (
+            "logarithmic",
+            yield_spei_logarithmic_model,
+            yield_spei_logarithmic_jac,
+            X_valid,
+        ),
+        ("quadratic", yield_spei_quadratic_model, yield_spei_quadratic_jac, X_valid),
+    ):
+        try:
+            popt, _ = curve_fit(
+                model_function,
+                X,
+                y_valid,
+                p0=warm_start.get(model) if warm_start else None,
+                jac=jac,
+                check_finite=False,
+                ftol=CURVE_FIT_FTOL,
+                xtol=CURVE_FIT_XTOL,
+                maxfev=CURVE_FIT_MAXFEV,
+            )
+            y_pred = model_function(X, *popt)
+            residuals = y_valid - y_pred
+            ss_res = np.dot(residuals, residuals)
+            r_squared[model] = 1 - ss_res / ss_tot if ss_tot != 0 else np.nan
+            coefficients[model] = tuple(popt)
+        except RuntimeError:
+            r_squared[model] = np.nan
+            coefficients[model] = (np.nan, np.nan)
+
+    # The exponential and power models are log-linear (ln y = ln a + b·X and
+    # ln y = ln a + b·ln X), so instead of paying for an iterative curve_fit
+    # they are solved in closed form on ln(y). R² is still evaluated in the
+    # original space so it remains comparable with the other models.
+    positive_y = y_valid > 0
+    ln_y = np.log(y_valid[positive_y])
+    for model, model_function, jac, X_reg in (
+        (
+            "exponential",
+            yield_spei_exponential_model,
+            yield_spei_exponential_jac,
+            X_valid[positive_y],
+        ),
+        (
+            "power",
+            yield_spei_power_model,
+            yield_spei_power_jac,
+            X_log[positive_y] * np.log(10),
+        ),
+    ):
+        popt = None
+        if len(X_reg) >= 2 and np.ptp(X_reg) > 0:
+            b, ln_a = np.polyfit(X_reg, ln_y, 1)
+            popt = (np.exp(ln_a), b)
+        if popt is None or not np.all(np.isfinite(popt)):
+            # Degenerate data; fall back to the iterative fit
+            try:
+                popt, _ = curve_fit(
+                    model_function,
+                    X_valid,
+                    y_valid,
+                    p0=warm_start.get(model) if warm_start else None,
+                    jac=jac,
+                    check_finite=False,
+                    ftol=CURVE_FIT_FTOL,
+                    xtol=CURVE_FIT_XTOL,
+                    maxfev=CURVE_FIT_MAXFEV,
+                )
+            except RuntimeError:
+                r_squared[model] = np.nan
+                coefficients[model] = (np.nan, np.nan)
+                continue
+        y_pred = model_function(X_valid, *popt)
+        residuals = y_valid - y_pred
+        ss_res = np.dot(residuals, residuals)
+        r_squared[model] = 1 - ss_res / ss_tot if ss_tot != 0 else np.nan
+        coefficients[model] = tuple(popt)
+    return r_squared, coefficients
+
+
+def fit_yield_spei_models_chunk(chunk):
+    """Fits the yield-SPEI models for a sequence of agents.
+
+    Each fit is warm-started with the previous agent's converged parameters,
+    which typically saves a few Levenberg-Marquardt steps since neighbouring
+    agents have similar relations.
+
+    Args:
+        chunk: sequence of (SPEI probabilities, yield ratios) tuples.
+
+    Returns:
+        List of (R², coefficients) dictionary tuples, one per agent.
+    """
+    warm_start = {}
+    results = []
+    for data in chunk:
+        r_squared, coefficients = fit_yield_spei_models(data, warm_start)
+        for model, popt in coefficients.items():
+            if not np.any(np.isnan(popt)):
+                warm_start[model] = popt
+        results.append((r_squared, coefficients))
+    return results
+
+
+@njit(
+    "Tuple((float64[:], float64[:], float64[:]))(float32[:, :], float32[:, :])",
+    cache=True,
+    parallel=True,
+)
+def yield_spei_ols(y_data, X_data):
+    """Fits the per-agent linear yield-SPEI relation in log-transformed X.
+
+    Solves the two-parameter ordinary least-squares problem per agent in one
+    fused parallel pass, without materializing the masked log matrices.
+    Samples with NaN or zero yield or a non-positive SPEI probability are
+    skipped.
+
+    Args:
+        y_data: yearly yield ratios of shape (n_agents, n_years).
+        X_data: yearly SPEI probabilities of the same shape.
+
+    Returns:
+        Tuple of slopes, intercepts and R² per agent, NaN for agents with
+        fewer than two valid years or degenerate data.
+    """
+    n_agents = y_data.shape[0]
+    n_years = y_data.shape[1]
+    a_array = np.full(n_agents, np.nan)
+    b_array = np.full(n_agents, np.nan)
+    r_squared_array = np.full(n_agents, np.nan)
+    for agent_idx in prange(n_agents):
+        n = 0
+        sum_x = 0.0
+        sum_y = 0.0
+        sum_xx = 0.0
+        sum_xy = 0.0
+        sum_yy = 0.0
+        for year in range(n_years):
+            y = y_data[agent_idx, year]
+            X = X_data[agent_idx, year]
+            if not math.isnan(y) and y != 0 and X > 0:
+                x = math.log10(X)
+                n += 1
+                sum_x += x
+                sum_y += y
+                sum_xx += x * x
+                sum_xy += x * y
+                sum_yy += y * y
+        if n < 2:
+            continue
+        denominator = n * sum_xx - sum_x * sum_x
+        if denominator == 0:
+            continue
+        a = (n * sum_xy - sum_x * sum_y) / denominator
+        b = (sum_y - a * sum_x) / n
+        a_array[agent_idx] = a
+        b_array[agent_idx] = b
+
+        ss_res = 0.0
+        for year in range(n_years):
+            y = y_data[agent_idx, year]
+            X = X_data[agent_idx, year]
+            if not math.isnan(y) and y != 0 and X > 0:
+                residual = y - (a * math.log10(X) + b)
+                ss_res += residual * residual
+        ss_tot = sum_yy - sum_y * sum_y / n
+        if ss_tot != 0:
+            r_squared_array[agent_idx] = 1 - ss_res / ss_tot
+    return a_array, b_array, r_squared_array
+
+
+def masked_r_squared(y, y_pred, valid):
+    """Computes the coefficient of determination per group over valid samples.
+
+    Args:
+        y: observations of shape (n_groups, n_samples).
+        y_pred: model predictions of the same shape.
+        valid: boolean validity mask of the same shape.
+
+    Returns:
+        R² per group, NaN for groups with fewer than two valid samples or
+        zero variance.
+    """
+    counts = valid.sum(axis=1)
+    y_mean = np.sum(y, axis=1, where=valid) / np.maximum(counts, 1)
+    ss_res = np.sum((y - y_pred) ** 2, axis=1, where=valid)
+    ss_tot = np.sum((y - y_mean[:, np.newaxis]) ** 2, axis=1, where=valid)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        r_squared = np.where(ss_tot != 0, 1 - ss_res / ss_tot, np.nan)
+    r_squared[counts < 2] = np.nan
+    return r_squared
+
+
 def cumulative_mean(mean, counter, update, mask=None):
     """Calculates the cumulative mean of a series of numbers. This function
     operates in place.
@@ -50,6 +397,43 @@ def cumulative_mean(mean, counter, update, mask=None):
         counter += 1
 
 
+@njit(
+    [
+        "void(float32[:], int32[:], float32[:], int32[:], int32[:], int64)",
+        "void(float32[:], int32[:], float32[:], int64[:], int32[:], int64)",
+    ],
+    cache=True,
+)
+def cumulative_mean_with_reset(
+    mean, counter, update, farmers, generation, current_generation
+):
+    """Updates the cumulative mean for the given farmers, resetting lazily.
+
+    Instead of zeroing the full mean and counter arrays at the start of each
+    season, a per-farmer generation number is compared against the current
+    season generation; stale entries are reset on their next update. This
+    function operates in place.
+
+    Args:
+        mean: The cumulative mean.
+        counter: The number of elements that have been added to the mean.
+        update: The new elements to add to the mean, aligned with `farmers`.
+        farmers: Indices of the farmers to update.
+        generation: Per-farmer season generation, updated in place.
+        current_generation: The current season generation.
+    """
+    for i in range(farmers.size):
+        farmer = farmers[i]
+        if generation[farmer] != current_generation:
+            mean[farmer] = 0.0
+            counter[farmer] = 0
+            generation[farmer] = current_generation
+        mean[farmer] = (mean[farmer] * counter[farmer] + update[i]) / (
+            counter[farmer] + 1
+        )
+        counter[farmer] += 1
+
+
 def shift_and_update(array, update):
     """Shifts the array and updates the first element with the update value.
 
@@ -63,10 +447,10 @@ def shift_and_update(array, update):
 
 def shift_and_reset_matrix(matrix: np.ndarray) -> None:
     """
-    Shifts columns to the right in the matrix and sets the first column to zero.
+    Shifts columns to the right along the last axis and sets the first column to zero.
     """
-    matrix[:, 1:] = matrix[:, 0:-1]  # Shift columns to the right
-    matrix[:, 0] = 0  # Reset the first column to 0
+    matrix[..., 1:] = matrix[..., 0:-1]  # Shift columns to the right
+    matrix[..., 0] = 0  # Reset the first column to 0
 
 
 @njit(cache=True, inline="always")
@@ -762,6 +1146,320 @@ def find_matching_rows(arr, target_row):
     return matches
 
 
+@lru_cache(maxsize=None)
+def annuity_factor(interest_rate: float, loan_duration: int) -> float:
+    """Computes the annuity factor for a loan.
+
+    A = P * [r(1+r)^n] / [(1+r)^n - 1], where P is the principal, r the
+    interest rate and n the loan duration in years. Cached per
+    (interest_rate, loan_duration) pair, as the adaptation and cost methods
+    reuse the same handful of scalar combinations every year.
+
+    Args:
+        interest_rate: Annual interest rate.
+        loan_duration: Loan duration in years.
+
+    Returns:
+        Annual payment per unit of principal.
+    """
+    return (
+        interest_rate
+        * (1 + interest_rate) ** loan_duration
+        / ((1 + interest_rate) ** loan_duration - 1)
+    )
+
+
+def factorize_agent_groups(group_rows):
+    """Assigns a group index to each row of agent attributes.
+
+    Replacement for np.unique(group_rows, axis=0, return_inverse=True) when
+    only the inverse indices and the group count are needed: the columns are
+    packed into a single integer key and factorized with a hash table, which
+    is linear in the number of agents instead of the row-comparator sort of
+    the axis=0 path. Group labels are assigned in order of first appearance
+    rather than in sorted order.
+
+    Args:
+        group_rows: 2D integer array with one row of group attributes per
+            agent.
+
+    Returns:
+        Tuple of the per-agent group indices and the number of groups.
+    """
+    group_rows = np.asarray(group_rows, dtype=np.int64)
+    if group_rows.shape[0] == 0:
+        return np.empty(0, dtype=np.intp), 0
+
+    # Mixed-radix packing of the columns into one int64 key; the columns hold
+    # small labels (crop numbers, elevation bins, farmer classes), so the
+    # packed key comfortably fits 64 bits
+    keys = group_rows[:, 0] - group_rows[:, 0].min()
+    for column in range(1, group_rows.shape[1]):
+        column_values = group_rows[:, column] - group_rows[:, column].min()
+        keys = keys * (column_values.max() + 1) + column_values
+    group_indices, unique_keys = pd.factorize(keys)
+    return group_indices, len(unique_keys)
+
+
+@njit(cache=True, parallel=True)
+def any_both_nonzero(a, b):
+    """Row mask that is True where both arrays have any nonzero entry.
+
+    Fused early-exit equivalent of np.any(a != 0, axis=1) & np.any(b != 0,
+    axis=1) without the two intermediate boolean matrices; like np.any, NaN
+    entries count as nonzero.
+    """
+    n_rows = a.shape[0]
+    out = np.zeros(n_rows, dtype=np.bool_)
+    for row in prange(n_rows):
+        a_nonzero = False
+        b_nonzero = False
+        for column in range(a.shape[1]):
+            a_nonzero = a_nonzero or a[row, column] != 0
+            b_nonzero = b_nonzero or b[row, column] != 0
+            if a_nonzero and b_nonzero:
+                out[row] = True
+                break
+    return out
+
+
+@njit(cache=True, parallel=True)
+def exponential_yield_ratio(probability, params, out):
+    """Evaluates a * exp(b * x) per agent, clipped to [0, 1].
+
+    Writes into the preallocated out buffer of shape (n_agents, n_events)
+    instead of materializing the broadcast temporary the NumPy expression
+    would allocate; NaN coefficients propagate as NaN, as with np.clip.
+
+    Args:
+        probability: Probability of each drought event occurring (n_events).
+        params: Exponential coefficients a and b per agent (n_agents, 2).
+        out: Output buffer for the yield ratios (n_agents, n_events).
+    """
+    for agent_idx in prange(params.shape[0]):
+        a = params[agent_idx, 0]
+        b = params[agent_idx, 1]
+        for event in range(probability.size):
+            yield_ratio = a * np.exp(b * probability[event])
+            if yield_ratio < 0:
+                yield_ratio = 0.0
+            elif yield_ratio > 1:
+                yield_ratio = 1.0
+            out[agent_idx, event] = yield_ratio
+
+
+@njit(cache=True)
+def expire_adaptations(adapted, time_adapted, expired, adaptation_type):
+    """Resets the status columns of expired adaptations in one masked pass.
+
+    Writing both columns while walking the mask once avoids the separate
+    scatter per array that chained fancy-index assignments perform.
+    """
+    for farmer_idx in range(expired.size):
+        if expired[farmer_idx]:
+            adapted[farmer_idx, adaptation_type] = 0
+            time_adapted[farmer_idx, adaptation_type] = -1
+
+
+@njit(cache=True)
+def expire_well_adaptations(
+    adapted, time_adapted, irrigation_source, expired, adaptation_type, no_irrigation
+):
+    """Like expire_adaptations, but also resets the irrigation source."""
+    for farmer_idx in range(expired.size):
+        if expired[farmer_idx]:
+            adapted[farmer_idx, adaptation_type] = 0
+            time_adapted[farmer_idx, adaptation_type] = -1
+            irrigation_source[farmer_idx] = no_irrigation
+
+
+@njit(cache=True, parallel=True)
+def network_has_crop_option(crop_nrs, social_network, target_crop):
+    """Checks per farmer whether any neighbor currently grows the target crop.
+
+    Walks each farmer's neighbors with an early exit instead of materializing
+    the full (n_agents, n_neighbors) comparison matrix that the broadcasting
+    equivalent would allocate.
+    """
+    n_agents = target_crop.size
+    out = np.zeros(n_agents, dtype=np.bool_)
+    for farmer_idx in prange(n_agents):
+        target = target_crop[farmer_idx]
+        for neighbor_idx in range(social_network.shape[1]):
+            if crop_nrs[social_network[farmer_idx, neighbor_idx]] == target:
+                out[farmer_idx] = True
+                break
+    return out
+
+
+def pack_group_rows(group_rows):
+    """Packs the columns of a group table into sortable int64 keys.
+
+    The first column is most significant, so sorting the keys is equivalent
+    to the lexicographic row sort that np.unique(..., axis=0) performs;
+    np.unique over the 1D keys therefore produces the same group order and
+    inverse indices while avoiding the row-comparator sort and its
+    per-comparison column walk.
+
+    Args:
+        group_rows: 2D integer array with one row of group attributes per
+            agent.
+
+    Returns:
+        One int64 key per row.
+    """
+    group_rows = np.asarray(group_rows, dtype=np.int64)
+    if group_rows.shape[0] == 0:
+        return np.empty(0, dtype=np.int64)
+
+    keys = group_rows[:, 0] - group_rows[:, 0].min()
+    for column in range(1, group_rows.shape[1]):
+        column_values = group_rows[:, column] - group_rows[:, column].min()
+        keys = keys * (column_values.max() + 1) + column_values
+    return keys
+
+
+def find_group_rows(unique_groups, target_groups):
+    """Finds the row index of each target row among the unique group rows.
+
+    The rows are packed into scalar keys with the first column most
+    significant; np.unique(axis=0) returns its rows in lexicographic order,
+    so the keys are sorted and every target can be located with one
+    searchsorted instead of a full-row comparison scan per target.
+
+    Args:
+        unique_groups: Unique group rows as returned by np.unique(axis=0).
+        target_groups: Rows to locate, with the same number of columns.
+
+    Returns:
+        Tuple of the per-target row indices and a mask of which targets were
+        found; indices of missing targets are meaningless.
+    """
+    lows = np.minimum(unique_groups.min(axis=0), target_groups.min(axis=0)).astype(
+        np.int64
+    )
+    highs = np.maximum(unique_groups.max(axis=0), target_groups.max(axis=0)).astype(
+        np.int64
+    )
+    radices = highs - lows + 1
+    keys = unique_groups[:, 0].astype(np.int64) - lows[0]
+    target_keys = target_groups[:, 0].astype(np.int64) - lows[0]
+    for column in range(1, unique_groups.shape[1]):
+        keys = keys * radices[column] + (unique_groups[:, column] - lows[column])
+        target_keys = target_keys * radices[column] + (
+            target_groups[:, column] - lows[column]
+        )
+    rows = np.minimum(np.searchsorted(keys, target_keys), keys.size - 1)
+    found = keys[rows] == target_keys
+    return rows, found
+
+
+@njit(cache=True, parallel=True)
+def compute_water_energy_costs(
+    farmer_class,
+    groundwater_depth,
+    average_extraction,
+    average_extraction_speed,
+    total_pump_duration,
+    electricity_costs,
+    water_costs_m3_channel,
+    water_costs_m3_reservoir,
+    water_costs_m3_groundwater,
+    specific_weight_water,
+    pump_efficiency,
+    pump_hours,
+    energy_costs,
+    water_costs,
+):
+    """Fills the water and energy costs per agent in a single fused pass.
+
+    Fuses the power, energy and per-water-source cost arithmetic that would
+    otherwise be one masked N-length NumPy pass per line, branching on the
+    farmer class instead. Only farmers pumping groundwater (class 2) pay
+    energy costs; rainfed farmers (class 3) pay nothing.
+
+    Args:
+        farmer_class: Water source class of each farmer.
+        groundwater_depth: Groundwater depth per farmer (m).
+        average_extraction: Average water extraction per farmer (m³/year).
+        average_extraction_speed: Average extraction speed per farmer (m³/s).
+        total_pump_duration: Pump duration per farmer (days).
+        electricity_costs: Electricity cost rate per farmer (LCU/kWh).
+        water_costs_m3_channel: Water cost for channel water (LCU/m³).
+        water_costs_m3_reservoir: Water cost for reservoir water (LCU/m³).
+        water_costs_m3_groundwater: Water cost for groundwater (LCU/m³).
+        specific_weight_water: Specific weight of water (N/m³).
+        pump_efficiency: Pump efficiency (fraction).
+        pump_hours: Pumping hours per day.
+        energy_costs: Output buffer for the energy costs (LCU/year).
+        water_costs: Output buffer for the water costs (LCU/year).
+    """
+    for farmer_idx in prange(farmer_class.size):
+        water_cost = 0.0
+        energy_cost = 0.0
+        farmer_water_class = farmer_class[farmer_idx]
+        if farmer_water_class == 0:
+            water_cost = average_extraction[farmer_idx] * water_costs_m3_channel
+        elif farmer_water_class == 1:
+            water_cost = average_extraction[farmer_idx] * water_costs_m3_reservoir
+        elif farmer_water_class == 2:
+            water_cost = average_extraction[farmer_idx] * water_costs_m3_groundwater
+            # Power required for groundwater extraction (kW)
+            power = (
+                specific_weight_water
+                * groundwater_depth[farmer_idx]
+                * average_extraction_speed[farmer_idx]
+                / pump_efficiency
+            ) / 1000
+            # Energy consumption (kWh/year) times the energy cost rate
+            energy = power * (total_pump_duration[farmer_idx] * pump_hours)
+            energy_cost = energy * electricity_costs[farmer_idx]
+        water_costs[farmer_idx] = water_cost
+        energy_costs[farmer_idx] = energy_cost
+
+
+@njit(cache=True, parallel=True)
+def network_has_adaptation(adapted, social_network):
+    """Checks per farmer whether any neighbor has undertaken the adaptation.
+
+    Walks each farmer's neighbors with an early exit instead of gathering
+    the full (n_agents, n_neighbors) adaptation matrix through fancy
+    indexing.
+    """
+    n_agents = social_network.shape[0]
+    out = np.zeros(n_agents, dtype=np.bool_)
+    for farmer_idx in prange(n_agents):
+        for neighbor_idx in range(social_network.shape[1]):
+            if adapted[social_network[farmer_idx, neighbor_idx]] == 1:
+                out[farmer_idx] = True
+                break
+    return out
+
+
+@njit(cache=True, parallel=True)
+def expire_loans(loan_tracker, all_loans_annual_cost):
+    """Advances the loan tracker one year and cancels expired loans.
+
+    Decrements every running loan duration, zeroes the annual cost of
+    loans that have expired and returns the cancelled cost per farmer,
+    all in a single pass over the loan arrays. The last loan type of
+    `all_loans_annual_cost` holds the total and is left untouched.
+    """
+    n_agents = loan_tracker.shape[0]
+    total_loan_reduction = np.zeros(n_agents, dtype=np.float32)
+    for farmer_idx in prange(n_agents):
+        total = np.float32(0)
+        for loan_type in range(loan_tracker.shape[1]):
+            for loan in range(loan_tracker.shape[2]):
+                if loan_tracker[farmer_idx, loan_type, loan] != 0:
+                    loan_tracker[farmer_idx, loan_type, loan] -= 1
+                if loan_tracker[farmer_idx, loan_type, loan] == 0:
+                    total += all_loans_annual_cost[farmer_idx, loan_type, loan]
+                    all_loans_annual_cost[farmer_idx, loan_type, loan] = 0
+        total_loan_reduction[farmer_idx] = total
+    return total_loan_reduction
+
+
 @njit(cache=True)
 def find_most_similar_index(target_series, yield_ratios, groups):
     n = groups.size
@@ -926,6 +1624,14 @@ class CropFarmers(AgentBaseClass):
         self.redundancy = reduncancy
         self.decision_module = DecisionModule(self)
 
+        # Caches for arrays that are rebuilt identically on every adaptation
+        # call, see inv_p_droughts and decision_horizon_array
+        self._inv_p_droughts = None
+        self._decision_horizon_arrays = {}
+        self._total_pump_duration = None
+        self._region_value_tables = {}
+        self._elevation_distribution_arrays = {}
+
         super().__init__()
 
         self.inflation_rate = load_economic_data(
@@ -1136,7 +1842,9 @@ class CropFarmers(AgentBaseClass):
             max_n=self.max_n,
             extra_dims=(4,),
             extra_dims_names=("adaptation_type",),
-            dtype=np.int32,
+            # single byte per flag, so the == comparisons in the adaptation
+            # methods read a quarter of the bytes an int32 column would
+            dtype=np.uint8,
             fill_value=0,
         )
         # the time each agent has been paying off their loan
@@ -1264,6 +1972,15 @@ class CropFarmers(AgentBaseClass):
             dtype=np.int32,
             fill_value=0,
         )
+        # per-farmer season generation for the lazy reset of the cumulative
+        # SPEI arrays (see save_yearly_spei)
+        self.var.SPEI_generation = DynamicArray(
+            n=self.n,
+            max_n=self.max_n,
+            dtype=np.int32,
+            fill_value=0,
+        )
+        self.var.SPEI_current_generation = 0
 
         # set no irrigation limit for farmers by default
         self.var.irrigation_limit_m3 = DynamicArray(
@@ -1437,6 +2154,10 @@ class CropFarmers(AgentBaseClass):
             fill_value=0,
         )
 
+        # Rotating index of the next free water/energy loan slot, which avoids
+        # scanning all agents' loans for a free slot every year
+        self.var.next_water_energy_loan_slot = 0
+
         # 0 is surface water / channel-dependent, 1 is reservoir-dependent, 2 is groundwater-dependent, 3 is rainwater-dependent
         self.var.farmer_class = DynamicArray(
             n=self.n, max_n=self.max_n, dtype=np.int32, fill_value=-1
@@ -1450,11 +2171,11 @@ class CropFarmers(AgentBaseClass):
             fill_value=0,
         )
 
-        # Load the why class of agent's aquifer
+        # Load the why class of agent's aquifer; classes 0-3 fit a byte
         self.var.why_class = DynamicArray(
             n=self.n,
             max_n=self.max_n,
-            dtype=np.int32,
+            dtype=np.uint8,
             fill_value=0,
         )
 
@@ -2266,9 +2987,20 @@ class CropFarmers(AgentBaseClass):
         actual_profits = self.var.yearly_profits[
             harvesting_farmers_long, :HISTORICAL_PERIOD
         ]
-        drought_loss_historical[harvesting_farmers_long] = (
-            (potential_profits - actual_profits) / potential_profits
-        ) * 100
+        # compute the loss in place to avoid intermediate arrays and guard the
+        # division so that farmers without potential profits get 0 loss
+        # instead of NaN
+        drought_loss = np.subtract(potential_profits, actual_profits)
+        has_potential_profits = potential_profits > 0
+        np.divide(
+            drought_loss,
+            potential_profits,
+            out=drought_loss,
+            where=has_potential_profits,
+        )
+        drought_loss[~has_potential_profits] = 0
+        drought_loss *= 100
+        drought_loss_historical[harvesting_farmers_long] = drought_loss
 
         # Calculate the current and past average loss percentages
         drought_loss_latest = drought_loss_historical[:, 0]
@@ -2374,7 +3106,13 @@ class CropFarmers(AgentBaseClass):
         )
 
     @staticmethod
-    @njit(cache=True)
+    @njit(
+        [
+            "void(float32[:, :, :], int32[:, :, :], bool_[:], float32[:], int64, int64)",
+            "void(float32[:, :, :], int32[:, :, :], bool_[:], float64[:], int64, int64)",
+        ],
+        cache=True,
+    )
     def set_loans_numba(
         all_loans_annual_cost: np.ndarray,
         loan_tracker: np.ndarray,
@@ -2433,19 +3171,22 @@ class CropFarmers(AgentBaseClass):
         if farmers_selling_land.size > 0:
             self.remove_agents(farmers_selling_land)
 
-        self.HRU.var.crop_map = np.where(
-            plant_map >= 0, plant_map, self.HRU.var.crop_map
-        )
-        self.HRU.var.crop_age_days_map[plant_map >= 0] = 1
+        # compute the planting and crop masks once and reuse them, avoiding
+        # repeated full-size boolean array allocations
+        planted = plant_map >= 0
+        np.copyto(self.HRU.var.crop_map, plant_map, where=planted)
+        self.HRU.var.crop_age_days_map[planted] = 1
 
         assert (self.HRU.var.crop_age_days_map[self.HRU.var.crop_map > 0] >= 0).all()
 
-        self.HRU.var.land_use_type[
-            (self.HRU.var.crop_map >= 0) & (self.field_is_paddy_irrigated)
-        ] = PADDY_IRRIGATED
-        self.HRU.var.land_use_type[
-            (self.HRU.var.crop_map >= 0) & (~self.field_is_paddy_irrigated)
-        ] = NON_PADDY_IRRIGATED
+        has_crop = self.HRU.var.crop_map >= 0
+        field_is_paddy_irrigated = self.field_is_paddy_irrigated
+        self.HRU.var.land_use_type[has_crop & field_is_paddy_irrigated] = (
+            PADDY_IRRIGATED
+        )
+        self.HRU.var.land_use_type[has_crop & ~field_is_paddy_irrigated] = (
+            NON_PADDY_IRRIGATED
+        )
 
     @property
     def field_is_paddy_irrigated(self):
@@ -2504,28 +3245,34 @@ class CropFarmers(AgentBaseClass):
             gt=self.model.data.grid.gt,
         )
 
-        full_size_SPEI_per_farmer = np.zeros_like(
-            self.var.cumulative_SPEI_during_growing_season
-        )
-        full_size_SPEI_per_farmer[harvesting_farmers] = current_SPEI_per_farmer
-
-        cumulative_mean(
-            mean=self.var.cumulative_SPEI_during_growing_season,
-            counter=self.var.cumulative_SPEI_count_during_growing_season,
-            update=full_size_SPEI_per_farmer,
-            mask=harvesting_farmers,
+        cumulative_mean_with_reset(
+            self.var.cumulative_SPEI_during_growing_season.data,
+            self.var.cumulative_SPEI_count_during_growing_season.data,
+            current_SPEI_per_farmer.astype(np.float32, copy=False),
+            harvesting_farmers,
+            self.var.SPEI_generation.data,
+            self.var.SPEI_current_generation,
         )
         print(
             "season SPEI",
-            np.mean(full_size_SPEI_per_farmer[harvesting_farmers]),
+            np.mean(current_SPEI_per_farmer),
         )
 
     def save_yearly_spei(self):
         assert self.model.current_time.month == 1
 
+        # farmers that did not harvest since the last season reset still hold
+        # stale cumulative values; treat them as zero without rewriting the
+        # full arrays
+        cumulative_SPEI = np.where(
+            self.var.SPEI_generation.data == self.var.SPEI_current_generation,
+            self.var.cumulative_SPEI_during_growing_season.data,
+            np.float32(0),
+        )
+
         # calculate the SPEI probability using GEV parameters
-        SPEI_probability = genextreme.sf(
-            self.var.cumulative_SPEI_during_growing_season,
+        SPEI_probability = gev_sf(
+            cumulative_SPEI,
             self.var.GEV_parameters[:, 0],
             self.var.GEV_parameters[:, 1],
             self.var.GEV_parameters[:, 2],
@@ -2537,9 +3284,10 @@ class CropFarmers(AgentBaseClass):
 
         shift_and_update(self.var.yearly_SPEI_probability, (1 - SPEI_probability))
 
-        # Reset the cumulative SPEI array at the beginning of the year
-        self.var.cumulative_SPEI_during_growing_season.fill(0)
-        self.var.cumulative_SPEI_count_during_growing_season.fill(0)
+        # Reset the cumulative SPEI arrays at the beginning of the year by
+        # advancing the season generation; cumulative_mean_with_reset zeroes
+        # each farmer lazily on its next update
+        self.var.SPEI_current_generation += 1
 
     def save_yearly_profits(
         self,
@@ -2595,190 +3343,163 @@ class CropFarmers(AgentBaseClass):
         # Number of agents
         n_agents = self.var.yearly_yield_ratio.shape[0]
 
-        # Define regression models
-        def linear_model(X, a, b):
-            return a * X + b
-
-        def exponential_model(X, a, b):
-            return a * np.exp(b * X)
-
-        def logarithmic_model(X, a, b):
-            return a * np.log(X) + b
-
-        def quadratic_model(X, a, b, c):
-            return a * X**2 + b * X + c
-
-        def power_model(X, a, b):
-            return a * X**b
-
         # Initialize dictionaries for coefficients and R² values
         model_names = ["linear", "exponential", "logarithmic", "quadratic", "power"]
-        r_squared_dict = {model: np.zeros(n_agents) for model in model_names}
-        coefficients_dict = {model: [] for model in model_names}
+        r_squared_dict = {
+            model: np.full(n_agents, np.nan, dtype=np.float32) for model in model_names
+        }
+        # NaN-padded (n_agents, 3) float arrays rather than lists of tuples,
+        # so the results can be consumed without per-element dispatch
+        coefficients_dict = {
+            model: np.full((n_agents, 3), np.nan, dtype=np.float32)
+            for model in model_names
+        }
 
         # Create a folder to save the plots
         output_folder = "plot/relation_test"
         if not os.path.exists(output_folder):
             os.makedirs(output_folder)
 
-        # For each agent, perform regression with different models
+        y_matrix = self.var.yearly_yield_ratio.data  # shape (n_agents, n_years)
+        X_matrix = self.var.yearly_SPEI_probability.data  # shape (n_agents, n_years)
+
+        # Filter out invalid values
+        valid_matrix = (
+            (~np.isnan(X_matrix))
+            & (~np.isnan(y_matrix))
+            & (X_matrix > 0)
+            & (y_matrix != 0)
+        )
+        # Take the log transform once on the full matrix rather than per agent;
+        # invalid entries are masked out below anyway
+        with np.errstate(divide="ignore", invalid="ignore"):
+            X_log_matrix = np.log10(X_matrix)
+
+        # Collect the valid data per agent first, so the fits can be
+        # dispatched to worker processes; plotting stays in the main process
+        agent_data = []
         for agent_idx in range(n_agents):
-            # Get data for the agent
-            y_data = self.var.yearly_yield_ratio[agent_idx, :]  # shape (n_years,)
-            X_data = self.var.yearly_SPEI_probability[agent_idx, :]  # shape (n_years,)
+            valid_mask = valid_matrix[agent_idx]
+            agent_data.append(
+                (
+                    X_matrix[agent_idx, valid_mask],
+                    y_matrix[agent_idx, valid_mask],
+                    X_log_matrix[agent_idx, valid_mask],
+                )
+            )
+
+        # Agents with fewer than two data points keep NaN R² and None
+        # coefficients
+        fit_agents = [
+            agent_idx
+            for agent_idx in range(n_agents)
+            if len(agent_data[agent_idx][0]) >= 2
+        ]
 
-            # Filter out invalid values
-            valid_mask = (
-                (~np.isnan(X_data)) & (~np.isnan(y_data)) & (X_data > 0) & (y_data != 0)
+        # The fits are independent across agents, so for larger models they
+        # are spread over a process pool. Agents are processed in contiguous
+        # chunks so each fit can be warm-started with the previous agent's
+        # converged parameters.
+        if len(fit_agents) >= PARALLEL_FIT_THRESHOLD:
+            n_workers = multiprocessing.cpu_count()
+            chunks = [
+                chunk
+                for chunk in np.array_split(np.array(fit_agents), n_workers * 4)
+                if len(chunk) > 0
+            ]
+            with multiprocessing.Pool(n_workers) as pool:
+                chunk_results = pool.map(
+                    fit_yield_spei_models_chunk,
+                    [
+                        [agent_data[agent_idx] for agent_idx in chunk]
+                        for chunk in chunks
+                    ],
+                )
+            fit_results = [result for chunk in chunk_results for result in chunk]
+        else:
+            fit_results = fit_yield_spei_models_chunk(
+                [agent_data[agent_idx] for agent_idx in fit_agents]
             )
-            X_valid = X_data[valid_mask]
-            y_valid = y_data[valid_mask]
-
-            if len(X_valid) >= 2:
-                # Prepare data
-                X_log = np.log10(X_valid)
-
-                # Model 1: Linear in log-transformed X
-                try:
-                    popt, _ = curve_fit(linear_model, X_log, y_valid, maxfev=10000)
-                    a, b = popt
-                    y_pred = linear_model(X_log, a, b)
-                    ss_res = np.sum((y_valid - y_pred) ** 2)
-                    ss_tot = np.sum((y_valid - np.mean(y_valid)) ** 2)
-                    r_squared = 1 - ss_res / ss_tot if ss_tot != 0 else np.nan
-                    r_squared_dict["linear"][agent_idx] = r_squared
-                    coefficients_dict["linear"].append((a, b))
-                except RuntimeError:
-                    r_squared_dict["linear"][agent_idx] = np.nan
-                    coefficients_dict["linear"].append((np.nan, np.nan))
-
-                # Model 2: Exponential
-                try:
-                    popt, _ = curve_fit(
-                        exponential_model, X_valid, y_valid, maxfev=10000
-                    )
-                    y_pred = exponential_model(X_valid, *popt)
-                    ss_res = np.sum((y_valid - y_pred) ** 2)
-                    ss_tot = np.sum((y_valid - np.mean(y_valid)) ** 2)
-                    r_squared = 1 - ss_res / ss_tot if ss_tot != 0 else np.nan
-                    r_squared_dict["exponential"][agent_idx] = r_squared
-                    coefficients_dict["exponential"].append(popt)
-                except RuntimeError:
-                    r_squared_dict["exponential"][agent_idx] = np.nan
-                    coefficients_dict["exponential"].append((np.nan, np.nan))
-
-                # Model 3: Logarithmic (ensure X > 0)
-                try:
-                    popt, _ = curve_fit(
-                        logarithmic_model, X_valid, y_valid, maxfev=10000
-                    )
-                    y_pred = logarithmic_model(X_valid, *popt)
-                    ss_res = np.sum((y_valid - y_pred) ** 2)
-                    ss_tot = np.sum((y_valid - np.mean(y_valid)) ** 2)
-                    r_squared = 1 - ss_res / ss_tot if ss_tot != 0 else np.nan
-                    r_squared_dict["logarithmic"][agent_idx] = r_squared
-                    coefficients_dict["logarithmic"].append(popt)
-                except RuntimeError:
-                    r_squared_dict["logarithmic"][agent_idx] = np.nan
-                    coefficients_dict["logarithmic"].append((np.nan, np.nan))
-
-                # Model 4: Quadratic
-                try:
-                    popt, _ = curve_fit(quadratic_model, X_valid, y_valid, maxfev=10000)
-                    y_pred = quadratic_model(X_valid, *popt)
-                    ss_res = np.sum((y_valid - y_pred) ** 2)
-                    ss_tot = np.sum((y_valid - np.mean(y_valid)) ** 2)
-                    r_squared = 1 - ss_res / ss_tot if ss_tot != 0 else np.nan
-                    r_squared_dict["quadratic"][agent_idx] = r_squared
-                    coefficients_dict["quadratic"].append(popt)
-                except RuntimeError:
-                    r_squared_dict["quadratic"][agent_idx] = np.nan
-                    coefficients_dict["quadratic"].append((np.nan, np.nan))
-
-                # Model 5: Power
-                try:
-                    popt, _ = curve_fit(power_model, X_valid, y_valid, maxfev=10000)
-                    y_pred = power_model(X_valid, *popt)
-                    ss_res = np.sum((y_valid - y_pred) ** 2)
-                    ss_tot = np.sum((y_valid - np.mean(y_valid)) ** 2)
-                    r_squared = 1 - ss_res / ss_tot if ss_tot != 0 else np.nan
-                    r_squared_dict["power"][agent_idx] = r_squared
-                    coefficients_dict["power"].append(popt)
-                except RuntimeError:
-                    r_squared_dict["power"][agent_idx] = np.nan
-                    coefficients_dict["power"].append((np.nan, np.nan))
-            else:
-                # Not enough data points
-                for model in model_names:
-                    r_squared_dict[model][agent_idx] = np.nan
-                    coefficients_dict[model].append(None)
+
+        for agent_idx, (r_squared, coefficients) in zip(fit_agents, fit_results):
+            for model in model_names:
+                r_squared_dict[model][agent_idx] = r_squared[model]
+                coefficients_dict[model][agent_idx, : len(coefficients[model])] = (
+                    coefficients[model]
+                )
+
+        # Plot the fitted models per agent, reusing a single figure
+        fig, ax = plt.subplots(figsize=(10, 6))
+        for agent_idx in range(n_agents):
+            X_valid, y_valid, _ = agent_data[agent_idx]
 
             # Plotting code for this agent
 
-            # Create a new figure
-            plt.figure(figsize=(10, 6))
+            # Reset the figure for this agent; the figure itself is reused
+            # across agents since setting one up costs far more than the plot
+            ax.clear()
 
             # Plot the data points
-            plt.scatter(X_valid, y_valid, label="Data", color="black")
+            ax.scatter(X_valid, y_valid, label="Data", color="black")
 
-            # Generate x values for plotting fitted curves
+            # Generate x values for plotting fitted curves, including the
+            # positive subset and its log that several models share
             x_min = np.min(X_valid)
             x_max = np.max(X_valid)
             x_plot = np.linspace(x_min, x_max, 100)
+            x_plot_positive = x_plot[x_plot > 0]
+            x_plot_log = np.log10(x_plot_positive)
 
             # Plot each fitted model with R² in the label
             for model in model_names:
                 coeffs = coefficients_dict[model][agent_idx]
                 r_squared = r_squared_dict[model][agent_idx]
 
-                if (
-                    coeffs is not None
-                    and not any([np.isnan(c) for c in np.atleast_1d(coeffs)])
-                    and not np.isnan(r_squared)
-                ):
+                if not np.isnan(r_squared) and not np.isnan(coeffs[:2]).any():
                     # Depending on the model, compute y values for plotting
                     if model == "linear":
-                        a, b = coeffs
-                        x_plot_log = np.log10(x_plot[x_plot > 0])
+                        a, b = coeffs[:2]
                         if len(x_plot_log) > 0:
-                            y_plot = linear_model(x_plot_log, a, b)
-                            plt.plot(
-                                x_plot[x_plot > 0],
+                            y_plot = yield_spei_linear_model(x_plot_log, a, b)
+                            ax.plot(
+                                x_plot_positive,
                                 y_plot,
                                 label=f"{model} (R²={r_squared:.3f})",
                                 linewidth=2,
                             )
                     elif model == "exponential":
-                        y_plot = exponential_model(x_plot, *coeffs)
-                        plt.plot(
+                        y_plot = yield_spei_exponential_model(x_plot, *coeffs[:2])
+                        ax.plot(
                             x_plot,
                             y_plot,
                             label=f"{model} (R²={r_squared:.3f})",
                             linewidth=2,
                         )
                     elif model == "logarithmic":
-                        x_plot_positive = x_plot[x_plot > 0]
                         if len(x_plot_positive) > 0:
-                            y_plot = logarithmic_model(x_plot_positive, *coeffs)
-                            plt.plot(
+                            y_plot = yield_spei_logarithmic_model(
+                                x_plot_positive, *coeffs[:2]
+                            )
+                            ax.plot(
                                 x_plot_positive,
                                 y_plot,
                                 label=f"{model} (R²={r_squared:.3f})",
                                 linewidth=2,
                             )
                     elif model == "quadratic":
-                        y_plot = quadratic_model(x_plot, *coeffs)
-                        plt.plot(
+                        y_plot = yield_spei_quadratic_model(x_plot, *coeffs[:3])
+                        ax.plot(
                             x_plot,
                             y_plot,
                             label=f"{model} (R²={r_squared:.3f})",
                             linewidth=2,
                         )
                     elif model == "power":
-                        x_plot_positive = x_plot[x_plot > 0]
                         if len(x_plot_positive) > 0:
-                            y_plot = power_model(x_plot_positive, *coeffs)
-                            plt.plot(
+                            y_plot = yield_spei_power_model(
+                                x_plot_positive, *coeffs[:2]
+                            )
+                            ax.plot(
                                 x_plot_positive,
                                 y_plot,
                                 label=f"{model} (R²={r_squared:.3f})",
@@ -2788,23 +3509,23 @@ class CropFarmers(AgentBaseClass):
                     continue  # Skip models with invalid coefficients or R²
 
             # Add labels and legend
-            plt.xlabel("SPEI Probability")
-            plt.ylabel("Yield Ratio")
-            plt.title(
+            ax.set_xlabel("SPEI Probability")
+            ax.set_ylabel("Yield Ratio")
+            ax.set_title(
                 f"Agent {agent_idx}, irr class {self.var.farmer_class[agent_idx]}, crop {self.var.crop_calendar[agent_idx, 0, 0]} "
             )
-            plt.legend()
-            plt.grid(True)
+            ax.legend()
+            ax.grid(True)
 
             # Save the plot to a file
             filename = os.path.join(output_folder, f"agent_{agent_idx}.png")
-            plt.savefig(filename)
-            plt.close()
+            fig.savefig(filename, dpi=80)
+
+        plt.close(fig)
 
         # Compute median R² for each model
         for model in model_names:
-            valid_r2 = r_squared_dict[model][~np.isnan(r_squared_dict[model])]
-            median_r2 = np.median(valid_r2) if len(valid_r2) > 0 else np.nan
+            median_r2 = np.nanmedian(r_squared_dict[model])
             print(f"Median R² for {model}: {median_r2}")
 
     def calculate_yield_spei_relation_test_group(self):
@@ -2813,18 +3534,22 @@ class CropFarmers(AgentBaseClass):
 
         matplotlib.use("Agg")
         import matplotlib.pyplot as plt
-        from scipy.optimize import curve_fit
         import numpy as np
 
-        # Create unique groups based on agent properties
+        # Create unique groups based on agent properties; grouping works on
+        # packed scalar keys instead of the slower row-sorting axis=0 path
         crop_elevation_group = self.create_unique_groups(10)
-        unique_crop_combinations, group_indices = np.unique(
-            crop_elevation_group, axis=0, return_inverse=True
+        _, first_occurrence, group_indices = np.unique(
+            pack_group_rows(crop_elevation_group),
+            return_index=True,
+            return_inverse=True,
         )
+        unique_crop_combinations = crop_elevation_group[first_occurrence]
 
         # Mask out empty rows (agents) where data is zero or NaN
-        mask_agents = np.any(self.var.yearly_yield_ratio != 0, axis=1) & np.any(
-            self.var.yearly_SPEI_probability != 0, axis=1
+        mask_agents = any_both_nonzero(
+            self.var.yearly_yield_ratio.data,
+            self.var.yearly_SPEI_probability.data,
         )
 
         # Apply the mask to data and group indices
@@ -2853,203 +3578,232 @@ class CropFarmers(AgentBaseClass):
 
         # Initialize dictionaries for coefficients and R² values
         model_names = ["linear", "exponential", "logarithmic", "quadratic", "power"]
-        r_squared_dict = {model: np.full(n_groups, np.nan) for model in model_names}
-        coefficients_dict = {model: [None] * n_groups for model in model_names}
+        r_squared_dict = {
+            model: np.full(n_groups, np.nan, dtype=np.float32) for model in model_names
+        }
+        # NaN-padded (n_groups, 3) float arrays rather than lists of tuples,
+        # so the results can be consumed without per-element dispatch
+        coefficients_dict = {
+            model: np.full((n_groups, 3), np.nan, dtype=np.float32)
+            for model in model_names
+        }
 
         # Create a folder to save the plots
         output_folder = "plots/relation_test"
         if not os.path.exists(output_folder):
             os.makedirs(output_folder)
 
-        # For each group, perform regression with different models
-        for group_idx in range(n_groups):
-            # Get indices of agents in this group
-            agent_indices = np.where(group_indices == group_idx)[0]
+        n_years = masked_yearly_yield_ratio.shape[1]
+
+        # First pass: compute the per-group mean yield ratio and SPEI
+        # probability. Instead of slicing and nanmean-ing per group (which
+        # copies the group's rows every time), sort the agents by group once
+        # and reduce all groups in a single sweep with np.add.reduceat.
+        # Samples with NaN values or an SPEI probability >= 1 are excluded.
+        if len(group_indices) > 0:
+            order = np.argsort(group_indices, kind="stable")
+            # Transpose to a (years, agents) layout so the per-group
+            # reductions over agents walk contiguous memory instead of the
+            # slow stride of the (agents, years) storage
+            y_sorted = np.ascontiguousarray(masked_yearly_yield_ratio[order].T)
+            X_sorted = np.ascontiguousarray(masked_SPEI_probability[order].T)
+
+            # NaN in X is implicitly excluded since NaN < 1 is False
+            valid_samples = (~np.isnan(y_sorted)) & (X_sorted < 1)
+            y_clean = np.where(valid_samples, y_sorted, np.float32(0))
+            X_clean = np.where(valid_samples, X_sorted, np.float32(0))
+
+            boundaries = np.searchsorted(group_indices[order], np.arange(n_groups))
+            # For trailing empty groups the boundary equals the number of
+            # agents, which reduceat rejects; pad one zero sample so those
+            # boundaries reduce over the padding instead of being clipped
+            # (which would truncate the preceding group's slice)
+            valid_padded = np.pad(valid_samples, ((0, 0), (0, 1)))
+            y_padded = np.pad(y_clean, ((0, 0), (0, 1)))
+            X_padded = np.pad(X_clean, ((0, 0), (0, 1)))
+            counts = np.add.reduceat(
+                valid_padded.astype(np.int64), boundaries, axis=1
+            ).T
+            y_sums = np.add.reduceat(y_padded, boundaries, axis=1).T
+            X_sums = np.add.reduceat(X_padded, boundaries, axis=1).T
+
+            # reduceat yields the single element at the boundary for empty
+            # groups instead of an empty sum; mask those groups out
+            empty_groups = np.bincount(group_indices, minlength=n_groups) == 0
+            counts[empty_groups] = 0
+
+            y_groups = np.where(counts > 0, y_sums / np.maximum(counts, 1), np.nan)
+            X_groups = np.where(counts > 0, X_sums / np.maximum(counts, 1), np.nan)
+        else:
+            y_groups = np.full((n_groups, n_years), np.nan)
+            X_groups = np.full((n_groups, n_years), np.nan)
+
+        # Validity mask per group and year
+        valid = (~np.isnan(y_groups)) & (~np.isnan(X_groups)) & (X_groups > 0)
+
+        # All five models are linear in their parameters, either directly
+        # (linear, logarithmic, quadratic) or after a log-transform of y
+        # (exponential, power), so instead of a per-group curve_fit loop each
+        # model is fitted for all groups at once with a single batched
+        # least-squares solve. Invalid samples are zeroed out in the design
+        # matrices, which makes them drop out of the normal equations.
+        with np.errstate(divide="ignore", invalid="ignore"):
+            X_log = np.where(valid, np.log10(X_groups, where=valid), 0.0)
+            X_ln = np.where(valid, np.log(X_groups, where=valid), 0.0)
+        X_masked = np.where(valid, X_groups, 0.0)
+        y_masked = np.where(valid, y_groups, 0.0)
+        intercept = valid.astype(np.float64)
+
+        linear_coefficients, r_squared_dict["linear"] = batched_linear_fit(
+            np.stack([X_log, intercept], axis=-1), y_masked, valid
+        )
+        logarithmic_coefficients, r_squared_dict["logarithmic"] = batched_linear_fit(
+            np.stack([X_ln, intercept], axis=-1), y_masked, valid
+        )
+        quadratic_coefficients, r_squared_dict["quadratic"] = batched_linear_fit(
+            np.stack([X_masked**2, X_masked, intercept], axis=-1), y_masked, valid
+        )
+
+        # The exponential and power models are fitted on log-transformed y,
+        # which additionally requires y > 0. Their R² is evaluated in the
+        # original space so it remains comparable across models.
+        valid_log_y = valid & (y_groups > 0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            y_ln = np.where(valid_log_y, np.log(y_groups, where=valid_log_y), 0.0)
+        intercept_log_y = valid_log_y.astype(np.float64)
+        X_masked_log_y = np.where(valid_log_y, X_groups, 0.0)
+        X_ln_log_y = np.where(valid_log_y, X_ln, 0.0)
+
+        exponential_fit, _ = batched_linear_fit(
+            np.stack([X_masked_log_y, intercept_log_y], axis=-1), y_ln, valid_log_y
+        )
+        exponential_coefficients = np.column_stack(
+            (np.exp(exponential_fit[:, 1]), exponential_fit[:, 0])
+        )
+        with np.errstate(over="ignore", invalid="ignore"):
+            r_squared_dict["exponential"] = masked_r_squared(
+                y_groups,
+                exponential_coefficients[:, [0]]
+                * np.exp(exponential_coefficients[:, [1]] * X_groups),
+                valid_log_y,
+            )
 
-            if len(agent_indices) == 0:
-                # No data for this group
-                continue
+        power_fit, _ = batched_linear_fit(
+            np.stack([X_ln_log_y, intercept_log_y], axis=-1), y_ln, valid_log_y
+        )
+        power_coefficients = np.column_stack(
+            (np.exp(power_fit[:, 1]), power_fit[:, 0])
+        )
+        with np.errstate(over="ignore", invalid="ignore"):
+            r_squared_dict["power"] = masked_r_squared(
+                y_groups,
+                power_coefficients[:, [0]] * X_groups ** power_coefficients[:, [1]],
+                valid_log_y,
+            )
 
-            # Get data for the group
-            y_data = masked_yearly_yield_ratio[
-                agent_indices, :
-            ]  # shape (num_agents_in_group, num_years)
-            X_data = masked_SPEI_probability[agent_indices, :]  # same shape
-
-            # Remove values where SPEI probability is greater than 1
-            invalid_mask = X_data >= 1
-            y_data[invalid_mask] = np.nan
-            X_data[invalid_mask] = np.nan
-
-            # Compute mean over agents in the group (axis=0 corresponds to years)
-            y_group = np.nanmean(y_data, axis=0)  # shape (num_years,)
-            X_group = np.nanmean(X_data, axis=0)  # same shape
-
-            # Remove any years with NaN values
-            valid_indices = (~np.isnan(y_group)) & (~np.isnan(X_group)) & (X_group > 0)
-            y_group_valid = y_group[valid_indices]
-            X_group_valid = X_group[valid_indices]
+        batched_coefficients = {
+            "linear": linear_coefficients,
+            "exponential": exponential_coefficients,
+            "logarithmic": logarithmic_coefficients,
+            "quadratic": quadratic_coefficients,
+            "power": power_coefficients,
+        }
+        for model in model_names:
+            fitted = ~np.isnan(r_squared_dict[model])
+            n_params = batched_coefficients[model].shape[1]
+            coefficients_dict[model][fitted, :n_params] = batched_coefficients[model][
+                fitted
+            ]
+
+        # For each group, plot the fitted models, reusing a single figure
+        fig, ax = plt.subplots(figsize=(10, 6))
+        for group_idx in range(n_groups):
+            valid_indices = valid[group_idx]
+            y_group_valid = y_groups[group_idx][valid_indices]
+            X_group_valid = X_groups[group_idx][valid_indices]
 
             if len(X_group_valid) >= 2:
-                # Prepare data
-                X_group_log = np.log10(X_group_valid)
+                # Reset the reused figure for this group
+                ax.clear()
+                ax.scatter(X_group_valid, y_group_valid, label="Data", color="black")
 
-                # Model 1: Linear in log-transformed X
-                try:
-                    popt, _ = curve_fit(
-                        linear_model, X_group_log, y_group_valid, maxfev=10000
-                    )
-                    a, b = popt
-                    y_pred = linear_model(X_group_log, a, b)
-                    ss_res = np.sum((y_group_valid - y_pred) ** 2)
-                    ss_tot = np.sum((y_group_valid - np.mean(y_group_valid)) ** 2)
-                    r_squared = 1 - ss_res / ss_tot if ss_tot != 0 else np.nan
-                    r_squared_dict["linear"][group_idx] = r_squared
-                    coefficients_dict["linear"][group_idx] = (a, b)
-                except (RuntimeError, ValueError):
-                    pass  # Keep NaN in R² and None in coefficients
-
-                # Model 2: Exponential
-                try:
-                    popt, _ = curve_fit(
-                        exponential_model, X_group_valid, y_group_valid, maxfev=10000
-                    )
-                    y_pred = exponential_model(X_group_valid, *popt)
-                    ss_res = np.sum((y_group_valid - y_pred) ** 2)
-                    ss_tot = np.sum((y_group_valid - np.mean(y_group_valid)) ** 2)
-                    r_squared = 1 - ss_res / ss_tot if ss_tot != 0 else np.nan
-                    r_squared_dict["exponential"][group_idx] = r_squared
-                    coefficients_dict["exponential"][group_idx] = popt
-                except (RuntimeError, ValueError):
-                    pass
+                # Generate x values for plotting fitted curves, including the
+                # positive subset and its log that several models share
+                x_min = np.min(X_group_valid)
+                x_max = np.max(X_group_valid)
+                x_plot = np.linspace(x_min, x_max, 100)
+                x_plot_positive = x_plot[x_plot > 0]
+                x_plot_log = np.log10(x_plot_positive)
 
-                # Model 3: Logarithmic
-                try:
-                    popt, _ = curve_fit(
-                        logarithmic_model, X_group_valid, y_group_valid, maxfev=10000
-                    )
-                    y_pred = logarithmic_model(X_group_valid, *popt)
-                    ss_res = np.sum((y_group_valid - y_pred) ** 2)
-                    ss_tot = np.sum((y_group_valid - np.mean(y_group_valid)) ** 2)
-                    r_squared = 1 - ss_res / ss_tot if ss_tot != 0 else np.nan
-                    r_squared_dict["logarithmic"][group_idx] = r_squared
-                    coefficients_dict["logarithmic"][group_idx] = popt
-                except (RuntimeError, ValueError):
-                    pass
+                for model in model_names:
+                    coeffs = coefficients_dict[model][group_idx]
+                    r_squared = r_squared_dict[model][group_idx]
 
-                # Model 4: Quadratic
-                try:
-                    popt, _ = curve_fit(
-                        quadratic_model, X_group_valid, y_group_valid, maxfev=10000
-                    )
-                    y_pred = quadratic_model(X_group_valid, *popt)
-                    ss_res = np.sum((y_group_valid - y_pred) ** 2)
-                    ss_tot = np.sum((y_group_valid - np.mean(y_group_valid)) ** 2)
-                    r_squared = 1 - ss_res / ss_tot if ss_tot != 0 else np.nan
-                    r_squared_dict["quadratic"][group_idx] = r_squared
-                    coefficients_dict["quadratic"][group_idx] = popt
-                except (RuntimeError, ValueError):
-                    pass
-
-                # Model 5: Power
-                try:
-                    popt, _ = curve_fit(
-                        power_model, X_group_valid, y_group_valid, maxfev=10000
-                    )
-                    y_pred = power_model(X_group_valid, *popt)
-                    ss_res = np.sum((y_group_valid - y_pred) ** 2)
-                    ss_tot = np.sum((y_group_valid - np.mean(y_group_valid)) ** 2)
-                    r_squared = 1 - ss_res / ss_tot if ss_tot != 0 else np.nan
-                    r_squared_dict["power"][group_idx] = r_squared
-                    coefficients_dict["power"][group_idx] = popt
-                except (RuntimeError, ValueError):
-                    pass
-
-                # Plotting code for this group
-                plt.figure(figsize=(10, 6))
-                plt.scatter(X_group_valid, y_group_valid, label="Data", color="black")
-
-                # Generate x values for plotting fitted curves
-                x_min = np.min(X_group_valid)
-                x_max = np.max(X_group_valid)
-                x_plot = np.linspace(x_min, x_max, 100)
-
-                for model in model_names:
-                    coeffs = coefficients_dict[model][group_idx]
-                    r_squared = r_squared_dict[model][group_idx]
-
-                    if (
-                        coeffs is not None
-                        and not any([np.isnan(c) for c in np.atleast_1d(coeffs)])
-                        and not np.isnan(r_squared)
-                    ):
+                    if not np.isnan(r_squared) and not np.isnan(coeffs[:2]).any():
                         if model == "linear":
-                            a, b = coeffs
-                            x_plot_positive = x_plot[x_plot > 0]
-                            x_plot_log = np.log10(x_plot_positive)
+                            a, b = coeffs[:2]
                             if len(x_plot_log) > 0:
                                 y_plot = linear_model(x_plot_log, a, b)
-                                plt.plot(
+                                ax.plot(
                                     x_plot_positive,
                                     y_plot,
                                     label=f"{model} (R²={r_squared:.3f})",
                                     linewidth=2,
                                 )
                         elif model == "exponential":
-                            y_plot = exponential_model(x_plot, *coeffs)
-                            plt.plot(
+                            y_plot = exponential_model(x_plot, *coeffs[:2])
+                            ax.plot(
                                 x_plot,
                                 y_plot,
                                 label=f"{model} (R²={r_squared:.3f})",
                                 linewidth=2,
                             )
                         elif model == "logarithmic":
-                            x_plot_positive = x_plot[x_plot > 0]
                             if len(x_plot_positive) > 0:
-                                y_plot = logarithmic_model(x_plot_positive, *coeffs)
-                                plt.plot(
+                                y_plot = logarithmic_model(
+                                    x_plot_positive, *coeffs[:2]
+                                )
+                                ax.plot(
                                     x_plot_positive,
                                     y_plot,
                                     label=f"{model} (R²={r_squared:.3f})",
                                     linewidth=2,
                                 )
                         elif model == "quadratic":
-                            y_plot = quadratic_model(x_plot, *coeffs)
-                            plt.plot(
+                            y_plot = quadratic_model(x_plot, *coeffs[:3])
+                            ax.plot(
                                 x_plot,
                                 y_plot,
                                 label=f"{model} (R²={r_squared:.3f})",
                                 linewidth=2,
                             )
                         elif model == "power":
-                            x_plot_positive = x_plot[x_plot > 0]
                             if len(x_plot_positive) > 0:
-                                y_plot = power_model(x_plot_positive, *coeffs)
-                                plt.plot(
+                                y_plot = power_model(x_plot_positive, *coeffs[:2])
+                                ax.plot(
                                     x_plot_positive,
                                     y_plot,
                                     label=f"{model} (R²={r_squared:.3f})",
                                     linewidth=2,
                                 )
                 # Add labels and legend
-                plt.xlabel("SPEI Probability")
-                plt.ylabel("Yield Ratio")
-                plt.title(f"Group {group_idx}")
-                plt.legend()
-                plt.grid(True)
+                ax.set_xlabel("SPEI Probability")
+                ax.set_ylabel("Yield Ratio")
+                ax.set_title(f"Group {group_idx}")
+                ax.legend()
+                ax.grid(True)
 
                 # Save the plot to a file
                 filename = os.path.join(output_folder, f"group_{group_idx}.png")
-                plt.savefig(filename)
-                plt.close()
+                fig.savefig(filename, dpi=80)
             else:
                 # Not enough data points for this group
                 continue
+        plt.close(fig)
 
         # Compute median R² for each model across all groups
         for model in model_names:
-            valid_r2 = r_squared_dict[model][~np.isnan(r_squared_dict[model])]
-            median_r2 = np.median(valid_r2) if len(valid_r2) > 0 else np.nan
+            median_r2 = np.nanmedian(r_squared_dict[model])
             print(f"Median R² for {model}: {median_r2}")
 
         # Assign relations to agents based on their group
@@ -3058,18 +3812,10 @@ class CropFarmers(AgentBaseClass):
         # For simplicity, we'll assign the linear model coefficients to agents
 
         # Example: Assign linear model coefficients to agents
-        a_array = np.full(len(group_indices), np.nan)
-        b_array = np.full(len(group_indices), np.nan)
-
-        for group_idx in range(n_groups):
-            if coefficients_dict["linear"][group_idx] is not None:
-                a, b = coefficients_dict["linear"][group_idx]
-                agent_mask = group_indices == group_idx
-                a_array[agent_mask] = a
-                b_array[agent_mask] = b
+        linear_coefficients_per_agent = coefficients_dict["linear"][group_indices, :2]
 
         # Assign to agents
-        self.var.farmer_yield_probability_relation = np.column_stack((a_array, b_array))
+        self.var.farmer_yield_probability_relation = linear_coefficients_per_agent
 
         # Print overall best-fitting model based on median R²
         median_r2_values = {
@@ -3079,53 +3825,12 @@ class CropFarmers(AgentBaseClass):
         print(f"Best-fitting model overall: {best_model_overall}")
 
     def calculate_yield_spei_relation(self):
-        # Number of agents
-        n_agents = self.var.yearly_yield_ratio.shape[0]
-
-        # Initialize arrays for coefficients and R²
-        a_array = np.zeros(n_agents)
-        b_array = np.zeros(n_agents)
-        r_squared_array = np.zeros(n_agents)
-
-        # Loop over each agent
-        for agent_idx in range(n_agents):
-            # Get data for the agent
-            y_data = self.var.yearly_yield_ratio[agent_idx, :]
-            X_data = self.var.yearly_SPEI_probability[agent_idx, :]
-
-            # Log-transform X_data, handling zeros
-            with np.errstate(divide="ignore"):
-                X_data_log = np.log10(X_data)
-
-            # Mask out zeros and NaNs
-            valid_mask = (
-                (~np.isnan(y_data))
-                & (~np.isnan(X_data_log))
-                & (y_data != 0)
-                & (X_data != 0)
-            )
-            y_valid = y_data[valid_mask]
-            X_valid = X_data_log[valid_mask]
-
-            if len(X_valid) >= 2:
-                # Prepare matrices
-                X_matrix = np.vstack([X_valid, np.ones(len(X_valid))]).T
-                # Perform linear regression
-                coefficients = np.linalg.lstsq(X_matrix, y_valid, rcond=None)[0]
-                a, b = coefficients
-
-                # Calculate R²
-                y_pred = a * X_valid + b
-                ss_res = np.sum((y_valid - y_pred) ** 2)
-                ss_tot = np.sum((y_valid - np.mean(y_valid)) ** 2)
-                r_squared = 1 - ss_res / ss_tot if ss_tot != 0 else np.nan
-            else:
-                # Not enough data points
-                a, b, r_squared = np.nan, np.nan, np.nan
-
-            a_array[agent_idx] = a
-            b_array[agent_idx] = b
-            r_squared_array[agent_idx] = r_squared
+        # Fit the two-parameter regression for all agents in one fused
+        # parallel pass
+        a_array, b_array, r_squared_array = yield_spei_ols(
+            self.var.yearly_yield_ratio.data,
+            self.var.yearly_SPEI_probability.data,
+        )
 
         # Assign relations to agents
         self.var.farmer_yield_probability_relation = np.column_stack((a_array, b_array))
@@ -3135,25 +3840,29 @@ class CropFarmers(AgentBaseClass):
         print("Median R²:", np.median(valid_r2) if len(valid_r2) > 0 else "N/A")
 
     def calculate_yield_spei_relation_group(self):
-        # Create unique groups
+        # Create unique groups; a hash-based factorization replaces the
+        # row-sorting np.unique since only the inverse indices are needed
         crop_elevation_group = self.create_unique_groups(1)
-        unique_crop_combinations, group_indices = np.unique(
-            crop_elevation_group, axis=0, return_inverse=True
-        )
+        group_indices, n_groups = factorize_agent_groups(crop_elevation_group)
 
         # Mask out empty rows (agents) where data is zero or NaN
-        mask_agents = np.any(self.var.yearly_yield_ratio != 0, axis=1) & np.any(
-            self.var.yearly_SPEI_probability != 0, axis=1
+        mask_agents = any_both_nonzero(
+            self.var.yearly_yield_ratio.data,
+            self.var.yearly_SPEI_probability.data,
         )
 
-        # Apply the mask to data
-        masked_yearly_yield_ratio = self.var.yearly_yield_ratio[mask_agents, :]
-        masked_SPEI_probability = self.var.yearly_SPEI_probability[mask_agents, :]
+        # Apply the mask to data. The agent axis is reduced over below, which
+        # for the C-ordered (agents, years) storage is the slow stride, so
+        # transpose the working copies once to a (years, agents) layout where
+        # the reductions walk contiguous memory.
+        masked_yearly_yield_ratio = np.ascontiguousarray(
+            self.var.yearly_yield_ratio[mask_agents, :].T
+        )
+        masked_SPEI_probability = np.ascontiguousarray(
+            self.var.yearly_SPEI_probability[mask_agents, :].T
+        )
         group_indices = group_indices[mask_agents]
 
-        # Number of groups
-        n_groups = unique_crop_combinations.shape[0]
-
         # Initialize arrays for coefficients and R²
         a_array = np.zeros(n_groups)
         b_array = np.zeros(n_groups)
@@ -3163,17 +3872,22 @@ class CropFarmers(AgentBaseClass):
             agent_indices = np.where(group_indices == group_idx)[0]
 
             # Get data for the group
-            y_data = masked_yearly_yield_ratio[agent_indices, :]
-            X_data = masked_SPEI_probability[agent_indices, :]
-
-            # Remove invalid values where SPEI probability >= 1 or yield <= 0
-            mask = (X_data >= 1) | (y_data <= 0)
-            y_data[mask] = np.nan
-            X_data[mask] = np.nan
-
-            # Compute mean over agents (axis=0 corresponds to years)
-            y_group = np.nanmean(y_data, axis=0)  # shape (num_years,)
-            X_group = np.nanmean(X_data, axis=0)  # shape (num_years,)
+            y_data = masked_yearly_yield_ratio[:, agent_indices]
+            X_data = masked_SPEI_probability[:, agent_indices]
+
+            # Valid samples have an SPEI probability < 1 and a positive yield;
+            # NaNs are implicitly excluded since both comparisons are False
+            # for NaN. Reducing with where= avoids the full copy that nanmean
+            # makes and leaves the input arrays untouched.
+            valid_samples = (X_data < 1) & (y_data > 0)
+            counts = valid_samples.sum(axis=1, dtype=np.int32)
+            y_sum = np.add.reduce(y_data, axis=1, where=valid_samples)
+            X_sum = np.add.reduce(X_data, axis=1, where=valid_samples)
+
+            # Compute mean over agents (the remaining axis corresponds to
+            # years)
+            y_group = np.where(counts > 0, y_sum / np.maximum(counts, 1), np.nan)
+            X_group = np.where(counts > 0, X_sum / np.maximum(counts, 1), np.nan)
 
             # Remove any entries with NaN values
             valid_indices = (~np.isnan(y_group)) & (~np.isnan(X_group)) & (y_group > 0)
@@ -3196,8 +3910,10 @@ class CropFarmers(AgentBaseClass):
                 y_pred = a * np.exp(b * X_group_valid)
 
                 # Calculate R²
-                ss_res = np.sum((y_group_valid - y_pred) ** 2)
-                ss_tot = np.sum((y_group_valid - np.mean(y_group_valid)) ** 2)
+                residuals = y_group_valid - y_pred
+                ss_res = np.dot(residuals, residuals)
+                y_centered = y_group_valid - np.mean(y_group_valid)
+                ss_tot = np.dot(y_centered, y_centered)
                 r_squared = 1 - ss_res / ss_tot if ss_tot != 0 else np.nan
             else:
                 # Not enough data points
@@ -3249,68 +3965,55 @@ class CropFarmers(AgentBaseClass):
             self.var.all_loans_annual_cost[:, -1, 0] / self.field_size_per_farmer
         )
 
-        # Construct a dictionary of parameters to pass to the decision module functions
-        decision_params = {
-            "loan_duration": loan_duration,
-            "expenditure_cap": self.var.expenditure_cap,
-            "n_agents": self.n,
-            "sigma": self.var.risk_aversion.data,
-            "p_droughts": 1 / self.var.p_droughts[:-1],
-            "profits_no_event": profits_no_event,
-            "profits_no_event_adaptation": profits_no_event_adaptation,
-            "total_profits": total_profits,
-            "total_profits_adaptation": total_profits_adaptation,
-            "risk_perception": self.var.risk_perception.data,
-            "total_annual_costs": total_annual_costs_m2,
-            "adaptation_costs": annual_cost_empty,
-            "adapted": np.zeros(self.n, dtype=np.int32),
-            "time_adapted": np.full(self.n, 2),
-            "T": np.full(
-                self.n,
-                2,
-            ),
-            "discount_rate": self.var.discount_rate.data,
-            "extra_constraint": extra_constraint,
-        }
+        # Construct the parameters to pass to the decision module functions
+        decision_params = DecisionParams(
+            loan_duration=loan_duration,
+            expenditure_cap=self.var.expenditure_cap,
+            n_agents=self.n,
+            sigma=self.var.risk_aversion.data,
+            p_droughts=self.inv_p_droughts,
+            profits_no_event=profits_no_event,
+            profits_no_event_adaptation=profits_no_event_adaptation,
+            total_profits=total_profits,
+            total_profits_adaptation=total_profits_adaptation,
+            risk_perception=self.var.risk_perception.data,
+            total_annual_costs=total_annual_costs_m2,
+            adaptation_costs=annual_cost_empty,
+            adapted=np.zeros(self.n, dtype=np.int32),
+            time_adapted=np.full(self.n, 2),
+            T=self.decision_horizon_array(2),
+            discount_rate=self.var.discount_rate.data,
+            extra_constraint=extra_constraint,
+        )
 
         # Determine the SEUT of the current crop
-        SEUT_do_nothing = self.decision_module.calcEU_do_nothing(**decision_params)
+        SEUT_do_nothing = self.decision_module.calcEU_do_nothing(decision_params)
 
-        # Determine the SEUT of the other crop options
-        SEUT_crop_options = np.full(
-            (self.n, len(unique_crop_calendars)), 0, dtype=np.float32
+        # Determine the SEUT of all other crop options in one batched call.
+        # Determine the cost difference between old and potential new crops
+        cultivation_cost_new_crops = cultivation_cost[
+            self.var.region_id[:, np.newaxis], new_crop_nr
+        ]
+        cost_difference_adaptation = np.ascontiguousarray(
+            (cultivation_cost_new_crops - cultivation_cost_current_crop[:, np.newaxis]).T
         )
-        for crop_option in range(len(unique_crop_calendars)):
-            # Determine the cost difference between old and potential new crop
-            new_crop_nr_option = new_crop_nr[:, crop_option]
-            cultivation_cost_new_crop = cultivation_cost[
-                self.var.region_id, new_crop_nr_option
-            ]
-            cost_difference_adaptation = (
-                cultivation_cost_new_crop - cultivation_cost_current_crop
-            )
 
-            decision_params_option = copy.deepcopy(decision_params)
-            decision_params_option.update(
-                {
-                    "total_profits_adaptation": total_profits_adaptation[
-                        crop_option, :, :
-                    ],
-                    "profits_no_event_adaptation": profits_no_event_adaptation[
-                        crop_option, :
-                    ],
-                    "adaptation_costs": cost_difference_adaptation,
-                }
-            )
-            SEUT_crop_options[:, crop_option] = self.decision_module.calcEU_adapt(
-                **decision_params_option
-            )
+        # Only the three option-specific fields change; the remaining arrays
+        # are shared, as the decision module does not mutate its inputs
+        decision_params_options = decision_params._replace(
+            total_profits_adaptation=total_profits_adaptation,
+            profits_no_event_adaptation=profits_no_event_adaptation,
+            adaptation_costs=cost_difference_adaptation,
+        )
+        SEUT_crop_options = self.decision_module.calcEU_adapt_batched(
+            decision_params_options
+        )
 
         assert np.any(SEUT_do_nothing != -1) or np.any(SEUT_crop_options != -1)
 
         # Determine the best adaptation option
-        best_option_SEUT = np.max(SEUT_crop_options, axis=1)
-        chosen_option = np.argmax(SEUT_crop_options, axis=1)
+        best_option_SEUT = np.max(SEUT_crop_options, axis=0)
+        chosen_option = np.argmax(SEUT_crop_options, axis=0)
 
         # Determine the crop of the best option
         row_indices = np.arange(new_crop_nr.shape[0])
@@ -3322,14 +4025,14 @@ class CropFarmers(AgentBaseClass):
             (best_option_SEUT > (SEUT_do_nothing)) & (new_id_temp != -1)
         )  # Filter out crops chosen due to small diff in do_nothing and adapt SEUT calculation
 
-        # Adjust the intention threshold based on whether neighbors already have similar crop
-        # Check for each farmer which crops their neighbors are cultivating
-        social_network_crops = self.var.crop_calendar[self.var.social_network, 0, 0]
-
-        # Check whether adapting agents have adaptation type in their network and create mask
-        network_has_crop = np.any(
-            social_network_crops == new_crop_nr_temp[:, None],
-            axis=1,
+        # Adjust the intention threshold based on whether neighbors already
+        # have a similar crop. The kernel gathers each neighbor's crop on the
+        # fly and exits early on the first match, instead of materializing the
+        # full (n_agents, n_neighbors) crop and comparison matrices.
+        network_has_crop = network_has_crop_option(
+            np.ascontiguousarray(self.var.crop_calendar.data[:, 0, 0]),
+            self.var.social_network.data,
+            new_crop_nr_temp,
         )
 
         # Increase intention factor if someone in network has crop
@@ -3380,8 +4083,7 @@ class CropFarmers(AgentBaseClass):
         # Constants
         adaptation_type = 1
 
-        groundwater_depth = self.groundwater_depth
-        groundwater_depth[groundwater_depth < 0] = 0
+        groundwater_depth = np.maximum(self.groundwater_depth, 0)
 
         annual_cost, well_depth = self.calculate_well_costs_global(
             groundwater_depth, average_extraction_speed
@@ -3391,12 +4093,16 @@ class CropFarmers(AgentBaseClass):
         # This cost is the cost if the farmer would adapt, plus its current costs of previous
         # adaptations
 
+        # field_size_per_farmer is recomputed on every access and division is
+        # slower than multiplication, so take its reciprocal once
+        inverse_field_size = 1 / self.field_size_per_farmer
+
         total_annual_costs_m2 = (
             annual_cost + self.var.all_loans_annual_cost[:, -1, 0]
-        ) / self.field_size_per_farmer
+        ) * inverse_field_size
 
         # Solely the annual cost of the adaptation
-        annual_cost_m2 = annual_cost / self.field_size_per_farmer
+        annual_cost_m2 = annual_cost * inverse_field_size
 
         loan_duration = self.model.config["agent_settings"]["farmers"][
             "expected_utility"
@@ -3407,10 +4113,13 @@ class CropFarmers(AgentBaseClass):
         expired_adaptations = (
             self.var.time_adapted[:, adaptation_type] == self.var.lifespan_well
         ) | (groundwater_depth > self.var.well_depth)
-        self.var.adapted[expired_adaptations, adaptation_type] = 0
-        self.var.time_adapted[expired_adaptations, adaptation_type] = -1
-        self.var.irrigation_source[expired_adaptations] = (
-            self.var.irrigation_source_key["no"]
+        expire_well_adaptations(
+            self.var.adapted.data,
+            self.var.time_adapted.data,
+            self.var.irrigation_source.data,
+            expired_adaptations,
+            adaptation_type,
+            self.var.irrigation_source_key["no"],
         )
 
         # Define extra constraints (farmers' wells must reach groundwater)
@@ -3418,7 +4127,7 @@ class CropFarmers(AgentBaseClass):
         extra_constraint = well_reaches_groundwater
 
         # To determine the benefit of irrigation, those who have a well are adapted
-        adapted = np.where((self.var.adapted[:, 1] == 1), 1, 0)
+        adapted = self.var.adapted[:, 1] == 1
 
         (
             energy_diff,
@@ -3437,35 +4146,34 @@ class CropFarmers(AgentBaseClass):
             profits_no_event_adaptation + energy_diff + water_diff
         )
 
-        # Construct a dictionary of parameters to pass to the decision module functions
-        decision_params = {
-            "loan_duration": loan_duration,
-            "expenditure_cap": self.var.expenditure_cap,
-            "n_agents": self.n,
-            "sigma": self.var.risk_aversion.data,
-            "p_droughts": 1 / self.var.p_droughts[:-1],
-            "total_profits_adaptation": total_profits_adaptation,
-            "profits_no_event": profits_no_event,
-            "profits_no_event_adaptation": profits_no_event_adaptation,
-            "total_profits": total_profits,
-            "risk_perception": self.var.risk_perception.data,
-            "total_annual_costs": total_annual_costs_m2,
-            "adaptation_costs": annual_cost_m2,
-            "adapted": adapted,
-            "time_adapted": self.var.time_adapted[:, adaptation_type],
-            "T": np.full(
-                self.n,
+        # Construct the parameters to pass to the decision module functions
+        decision_params = DecisionParams(
+            loan_duration=loan_duration,
+            expenditure_cap=self.var.expenditure_cap,
+            n_agents=self.n,
+            sigma=self.var.risk_aversion.data,
+            p_droughts=self.inv_p_droughts,
+            total_profits_adaptation=total_profits_adaptation,
+            profits_no_event=profits_no_event,
+            profits_no_event_adaptation=profits_no_event_adaptation,
+            total_profits=total_profits,
+            risk_perception=self.var.risk_perception.data,
+            total_annual_costs=total_annual_costs_m2,
+            adaptation_costs=annual_cost_m2,
+            adapted=adapted,
+            time_adapted=self.var.time_adapted[:, adaptation_type],
+            T=self.decision_horizon_array(
                 self.model.config["agent_settings"]["farmers"]["expected_utility"][
                     "adaptation_well"
-                ]["decision_horizon"],
+                ]["decision_horizon"]
             ),
-            "discount_rate": self.var.discount_rate.data,
-            "extra_constraint": extra_constraint,
-        }
+            discount_rate=self.var.discount_rate.data,
+            extra_constraint=extra_constraint,
+        )
 
         # Calculate the EU of not adapting and adapting respectively
-        SEUT_do_nothing = self.decision_module.calcEU_do_nothing(**decision_params)
-        SEUT_adapt = self.decision_module.calcEU_adapt(**decision_params)
+        SEUT_do_nothing = self.decision_module.calcEU_do_nothing(decision_params)
+        SEUT_adapt = self.decision_module.calcEU_adapt(decision_params)
 
         assert (SEUT_do_nothing != -1).any or (SEUT_adapt != -1).any()
 
@@ -3490,9 +4198,7 @@ class CropFarmers(AgentBaseClass):
 
         # Print the percentage of adapted households
         percentage_adapted = round(
-            np.sum(self.var.adapted[:, adaptation_type])
-            / len(self.var.adapted[:, adaptation_type])
-            * 100,
+            np.count_nonzero(self.var.adapted[:, adaptation_type]) / self.n * 100,
             2,
         )
         print("Irrigation well farms:", percentage_adapted, "(%)")
@@ -3517,27 +4223,30 @@ class CropFarmers(AgentBaseClass):
             "expected_utility"
         ]["adaptation_sprinkler"]["loan_duration"]
 
+        # field_size_per_farmer is recomputed on every access, so fetch it
+        # once and keep its reciprocal for the per-m² costs below
+        field_size = self.field_size_per_farmer
+        inverse_field_size = 1 / field_size
+
         # Placeholder
         # 0.5 because they first decide to irrigate half their field
-        costs_irrigation_system = 1 * self.field_size_per_farmer * 0.5
+        costs_irrigation_system = 1 * field_size * 0.5
 
         # interest_rate = self.get_value_per_farmer_from_region_id(
         #     self.var.lending_rate, self.model.current_time
         # )
         interest_rate = 0.05
 
-        annual_cost = costs_irrigation_system * (
-            interest_rate
-            * (1 + interest_rate) ** loan_duration
-            / ((1 + interest_rate) ** loan_duration - 1)
+        annual_cost = costs_irrigation_system * annuity_factor(
+            interest_rate, loan_duration
         )
 
         total_annual_costs_m2 = (
             annual_cost + self.var.all_loans_annual_cost[:, -1, 0]
-        ) / self.field_size_per_farmer
+        ) * inverse_field_size
 
         # Solely the annual cost of the adaptation
-        annual_cost_m2 = annual_cost / self.field_size_per_farmer
+        annual_cost_m2 = annual_cost * inverse_field_size
 
         # Create mask for those who have access to irrigation water
         has_irrigation_access = ~np.all(
@@ -3549,11 +4258,15 @@ class CropFarmers(AgentBaseClass):
         expired_adaptations = (
             self.var.time_adapted[:, adaptation_type] == self.var.lifespan_irrigation
         ) | has_irrigation_access
-        self.var.adapted[expired_adaptations, adaptation_type] = 0
-        self.var.time_adapted[expired_adaptations, adaptation_type] = -1
+        expire_adaptations(
+            self.var.adapted.data,
+            self.var.time_adapted.data,
+            expired_adaptations,
+            adaptation_type,
+        )
 
         # To determine the benefit of irrigation, those who have above 90% irrigation efficiency have adapted
-        adapted = np.where((self.var.adapted[:, adaptation_type] == 1), 1, 0)
+        adapted = self.var.adapted[:, adaptation_type] == 1
 
         (
             energy_diff,
@@ -3572,35 +4285,34 @@ class CropFarmers(AgentBaseClass):
             profits_no_event_adaptation + energy_diff + water_diff
         )
 
-        # Construct a dictionary of parameters to pass to the decision module functions
-        decision_params = {
-            "loan_duration": loan_duration,
-            "expenditure_cap": self.var.expenditure_cap,
-            "n_agents": self.n,
-            "sigma": self.var.risk_aversion.data,
-            "p_droughts": 1 / self.var.p_droughts[:-1],
-            "total_profits_adaptation": total_profits_adaptation,
-            "profits_no_event": profits_no_event,
-            "profits_no_event_adaptation": profits_no_event_adaptation,
-            "total_profits": total_profits,
-            "risk_perception": self.var.risk_perception.data,
-            "total_annual_costs": total_annual_costs_m2,
-            "adaptation_costs": annual_cost_m2,
-            "adapted": adapted,
-            "time_adapted": self.var.time_adapted[:, adaptation_type],
-            "T": np.full(
-                self.n,
+        # Construct the parameters to pass to the decision module functions
+        decision_params = DecisionParams(
+            loan_duration=loan_duration,
+            expenditure_cap=self.var.expenditure_cap,
+            n_agents=self.n,
+            sigma=self.var.risk_aversion.data,
+            p_droughts=self.inv_p_droughts,
+            total_profits_adaptation=total_profits_adaptation,
+            profits_no_event=profits_no_event,
+            profits_no_event_adaptation=profits_no_event_adaptation,
+            total_profits=total_profits,
+            risk_perception=self.var.risk_perception.data,
+            total_annual_costs=total_annual_costs_m2,
+            adaptation_costs=annual_cost_m2,
+            adapted=adapted,
+            time_adapted=self.var.time_adapted[:, adaptation_type],
+            T=self.decision_horizon_array(
                 self.model.config["agent_settings"]["farmers"]["expected_utility"][
                     "adaptation_sprinkler"
-                ]["decision_horizon"],
+                ]["decision_horizon"]
             ),
-            "discount_rate": self.var.discount_rate.data,
-            "extra_constraint": has_irrigation_access,
-        }
+            discount_rate=self.var.discount_rate.data,
+            extra_constraint=has_irrigation_access,
+        )
 
         # Calculate the EU of not adapting and adapting respectively
-        SEUT_do_nothing = self.decision_module.calcEU_do_nothing(**decision_params)
-        SEUT_adapt = self.decision_module.calcEU_adapt(**decision_params)
+        SEUT_do_nothing = self.decision_module.calcEU_do_nothing(decision_params)
+        SEUT_adapt = self.decision_module.calcEU_adapt(decision_params)
 
         assert (SEUT_do_nothing != -1).any or (SEUT_adapt != -1).any()
 
@@ -3618,9 +4330,7 @@ class CropFarmers(AgentBaseClass):
 
         # Print the percentage of adapted households
         percentage_adapted = round(
-            np.sum(self.var.adapted[:, adaptation_type])
-            / len(self.var.adapted[:, adaptation_type])
-            * 100,
+            np.count_nonzero(self.var.adapted[:, adaptation_type]) / self.n * 100,
             2,
         )
         print("Irrigation efficient farms:", percentage_adapted, "(%)")
@@ -3635,20 +4345,22 @@ class CropFarmers(AgentBaseClass):
 
         # If the farmers have drip/sprinkler irrigation, they would also have additional costs of expanding that
         # Costs are less than the initial expansion
-        adapted_irr_eff = np.where((self.var.adapted[:, 2] == 1), 1, 0)
+        adapted_irr_eff = self.var.adapted[:, 2] == 1
+
+        # field_size_per_farmer is recomputed on every access, so fetch it
+        # once and keep its reciprocal for the per-m² costs below
+        field_size = self.field_size_per_farmer
+        inverse_field_size = 1 / field_size
+
         total_costs = np.zeros(self.n, dtype=np.float32)
-        total_costs[adapted_irr_eff] = 2 * self.field_size_per_farmer * 0.5
+        total_costs[adapted_irr_eff] = 2 * field_size[adapted_irr_eff] * 0.5
 
         # interest_rate = self.get_value_per_farmer_from_region_id(
         #     self.var.lending_rate, self.model.current_time
         # )
         interest_rate = 0.05
 
-        annual_cost = total_costs * (
-            interest_rate
-            * (1 + interest_rate) ** loan_duration
-            / ((1 + interest_rate) ** loan_duration - 1)
-        )
+        annual_cost = total_costs * annuity_factor(interest_rate, loan_duration)
 
         # Farmers will have the same yearly water costs added if they expand
         annual_cost += energy_cost
@@ -3659,11 +4371,12 @@ class CropFarmers(AgentBaseClass):
 
         total_annual_costs_m2 = (
             annual_cost + self.var.all_loans_annual_cost[:, -1, 0]
-        ) / self.field_size_per_farmer
+        ) * inverse_field_size
 
-        annual_cost_m2 = annual_cost / self.field_size_per_farmer
+        annual_cost_m2 = annual_cost * inverse_field_size
 
-        # Create mask for those who have access to irrigation water
+        # Create mask for those who have access to irrigation water; the same
+        # scan also feeds the expiry condition below
         has_irrigation_access = np.all(
             self.var.yearly_abstraction_m3_by_farmer[:, 3, :] == 0, axis=1
         )
@@ -3672,11 +4385,15 @@ class CropFarmers(AgentBaseClass):
         # or who's never had access to irrigation water
         expired_adaptations = (
             self.var.time_adapted[:, adaptation_type] == self.var.lifespan_irrigation
-        ) | np.all(self.var.yearly_abstraction_m3_by_farmer[:, 3, :] == 0, axis=1)
-        self.var.adapted[expired_adaptations, adaptation_type] = 0
-        self.var.time_adapted[expired_adaptations, adaptation_type] = -1
+        ) | has_irrigation_access
+        expire_adaptations(
+            self.var.adapted.data,
+            self.var.time_adapted.data,
+            expired_adaptations,
+            adaptation_type,
+        )
 
-        adapted = np.where((self.var.adapted[:, adaptation_type] == 1), 1, 0)
+        adapted = self.var.adapted[:, adaptation_type] == 1
 
         (
             total_profits,
@@ -3685,35 +4402,34 @@ class CropFarmers(AgentBaseClass):
             profits_no_event_adaptation,
         ) = self.profits_SEUT(adaptation_type, adapted)
 
-        # Construct a dictionary of parameters to pass to the decision module functions
-        decision_params = {
-            "loan_duration": loan_duration,
-            "expenditure_cap": self.var.expenditure_cap,
-            "n_agents": self.n,
-            "sigma": self.var.risk_aversion.data,
-            "p_droughts": 1 / self.var.p_droughts[:-1],
-            "total_profits_adaptation": total_profits_adaptation,
-            "profits_no_event": profits_no_event,
-            "profits_no_event_adaptation": profits_no_event_adaptation,
-            "total_profits": total_profits,
-            "risk_perception": self.var.risk_perception.data,
-            "total_annual_costs": total_annual_costs_m2,
-            "adaptation_costs": annual_cost_m2,
-            "adapted": adapted,
-            "time_adapted": self.var.time_adapted[:, adaptation_type],
-            "T": np.full(
-                self.n,
+        # Construct the parameters to pass to the decision module functions
+        decision_params = DecisionParams(
+            loan_duration=loan_duration,
+            expenditure_cap=self.var.expenditure_cap,
+            n_agents=self.n,
+            sigma=self.var.risk_aversion.data,
+            p_droughts=self.inv_p_droughts,
+            total_profits_adaptation=total_profits_adaptation,
+            profits_no_event=profits_no_event,
+            profits_no_event_adaptation=profits_no_event_adaptation,
+            total_profits=total_profits,
+            risk_perception=self.var.risk_perception.data,
+            total_annual_costs=total_annual_costs_m2,
+            adaptation_costs=annual_cost_m2,
+            adapted=adapted,
+            time_adapted=self.var.time_adapted[:, adaptation_type],
+            T=self.decision_horizon_array(
                 self.model.config["agent_settings"]["farmers"]["expected_utility"][
                     "adaptation_sprinkler"
-                ]["decision_horizon"],
+                ]["decision_horizon"]
             ),
-            "discount_rate": self.var.discount_rate.data,
-            "extra_constraint": has_irrigation_access,
-        }
+            discount_rate=self.var.discount_rate.data,
+            extra_constraint=has_irrigation_access,
+        )
 
         # Calculate the EU of not adapting and adapting respectively
-        SEUT_do_nothing = self.decision_module.calcEU_do_nothing(**decision_params)
-        SEUT_adapt = self.decision_module.calcEU_adapt(**decision_params)
+        SEUT_do_nothing = self.decision_module.calcEU_do_nothing(decision_params)
+        SEUT_adapt = self.decision_module.calcEU_adapt(decision_params)
 
         assert (SEUT_do_nothing != -1).any or (SEUT_adapt != -1).any()
 
@@ -3731,9 +4447,7 @@ class CropFarmers(AgentBaseClass):
 
         # Print the percentage of adapted households
         percentage_adapted = round(
-            np.sum(self.var.adapted[:, adaptation_type])
-            / len(self.var.adapted[:, adaptation_type])
-            * 100,
+            np.count_nonzero(self.var.adapted[:, adaptation_type]) / self.n * 100,
             2,
         )
         print("Irrigation expanded farms:", percentage_adapted, "(%)")
@@ -3750,14 +4464,15 @@ class CropFarmers(AgentBaseClass):
         # Compare EU values for those who haven't adapted yet and get boolean results
         SEUT_adaptation_decision = SEUT_adapt > SEUT_do_nothing
 
-        social_network_adaptation = adapted[self.var.social_network]
-
-        # Check whether adapting agents have adaptation type in their network and create mask
-        network_has_adaptation = np.any(social_network_adaptation == 1, axis=1)
+        # Check whether adapting agents have the adaptation in their network,
+        # scanning each farmer's neighbors with early exit
+        network_adaptation_mask = network_has_adaptation(
+            adapted, self.var.social_network.data
+        )
 
         # Increase intention factor if someone in network has crop
         intention_factor_adjusted = self.var.intention_factor.copy()
-        intention_factor_adjusted[network_has_adaptation] += 0.3
+        intention_factor_adjusted[network_adaptation_mask] += 0.3
 
         # Determine whether it passed the intention threshold
         random_values = np.random.rand(*intention_factor_adjusted.shape)
@@ -3768,11 +4483,12 @@ class CropFarmers(AgentBaseClass):
         # Update the adaptation status
         self.var.adapted[SEUT_adaptation_decision, adaptation_type] = 1
 
-        # Reset the timer for newly adapting farmers and update timers for others
-        self.var.time_adapted[SEUT_adaptation_decision, adaptation_type] = 0
-        self.var.time_adapted[
-            self.var.time_adapted[:, adaptation_type] != -1, adaptation_type
-        ] += 1
+        # Reset the timer for newly adapting farmers and update timers for
+        # others; newly adapting farmers end up at 1, as before the masked
+        # in-place add they were reset to 0 and incremented with the rest
+        time_adapted = self.var.time_adapted[:, adaptation_type]
+        np.add(time_adapted, 1, out=time_adapted, where=time_adapted != -1)
+        time_adapted[SEUT_adaptation_decision] = 1
 
         # Update annual costs and disposable income for adapted farmers
         self.var.all_loans_annual_cost[
@@ -3816,19 +4532,22 @@ class CropFarmers(AgentBaseClass):
         energy_costs = np.zeros(self.n, dtype=np.float32)
         water_costs = np.zeros(self.n, dtype=np.float32)
 
-        # Compute total pump duration per agent (average over crops)
-        total_pump_duration = np.mean(self.var.total_crop_age, axis=1)
+        # Total pump duration per agent (average over crops), shared with
+        # calculate_well_costs_global via the per-timestep cache
+        total_pump_duration = self.total_pump_duration
 
         # Get groundwater depth per agent and ensure non-negative values
-        groundwater_depth = self.groundwater_depth.copy()
-        groundwater_depth[groundwater_depth < 0] = 0
+        groundwater_depth = np.maximum(self.groundwater_depth, 0)
 
-        # Create unique groups based on crop combinations and elevation
+        # Create unique groups based on crop combinations and elevation,
+        # grouping on packed scalar keys
         crop_elevation_group = self.create_unique_groups()
-        unique_crop_groups = np.unique(crop_elevation_group, axis=0)
-
-        # Initialize array to store average extraction per unique group
-        average_extraction_array = np.full(len(unique_crop_groups), 0, dtype=np.float32)
+        _, first_occurrence, group_inverse = np.unique(
+            pack_group_rows(crop_elevation_group),
+            return_index=True,
+            return_inverse=True,
+        )
+        unique_crop_groups = crop_elevation_group[first_occurrence]
 
         # Compute yearly water abstraction per m² per agent
         yearly_abstraction_m3_per_m2 = (
@@ -3836,35 +4555,33 @@ class CropFarmers(AgentBaseClass):
             / self.field_size_per_farmer[..., None, None]
         )
 
-        # Loop over each unique crop group to compute average extraction
-        for idx, crop_combination in enumerate(unique_crop_groups):
-            # Find agents belonging to the current unique crop group
-            unique_farmer_group = np.where(
-                (crop_elevation_group == crop_combination[None, ...]).all(axis=1)
-            )[0]
-
-            # Extract the abstraction values for the group, excluding zeros
-            extraction_values = yearly_abstraction_m3_per_m2[unique_farmer_group, :3, :]
-            non_zero_extractions = extraction_values[extraction_values != 0]
-
-            # Compute average extraction for the group if there are non-zero values
-            if non_zero_extractions.size > 0:
-                average_extraction = np.mean(non_zero_extractions)  # m³ per m² per year
-            else:
-                average_extraction = 0.0
+        # Average extraction per unique group over its non-zero abstraction
+        # entries, computed with one bincount-based reduction instead of a
+        # Python loop that masks the agents of every group separately
+        extraction_values = yearly_abstraction_m3_per_m2[:, :3, :].reshape(self.n, -1)
+        non_zero_extractions = extraction_values != 0
+        extraction_sums = np.bincount(
+            group_inverse,
+            weights=extraction_values.sum(axis=1, where=non_zero_extractions),
+            minlength=len(unique_crop_groups),
+        )
+        extraction_counts = np.bincount(
+            group_inverse,
+            weights=non_zero_extractions.sum(axis=1),
+            minlength=len(unique_crop_groups),
+        )
+        average_extraction_array = np.where(
+            extraction_counts > 0,
+            extraction_sums / np.maximum(extraction_counts, 1),
+            0,
+        ).astype(np.float32)  # m³ per m² per year
 
-            # If the farmer is not rainfed (farmer_class != 3), store the average extraction
-            if crop_combination[-1] != 3:
-                average_extraction_array[idx] = average_extraction
+        # Rainfed farmers (farmer_class == 3) do not abstract water
+        average_extraction_array[unique_crop_groups[:, -1] == 3] = 0
 
-        # Map each agent to their corresponding average extraction value
-        positions_agent = np.array(
-            [
-                np.where((unique_crop_groups == group).all(axis=1))[0][0]
-                for group in crop_elevation_group
-            ]
-        )
-        average_extraction_m2 = average_extraction_array[positions_agent]
+        # Map each agent to their corresponding average extraction value via
+        # the inverse indices that np.unique already produced
+        average_extraction_m2 = average_extraction_array[group_inverse]
 
         # Compute average extraction per agent (m³/year)
         average_extraction = average_extraction_m2 * self.field_size_per_farmer
@@ -3874,65 +4591,40 @@ class CropFarmers(AgentBaseClass):
             average_extraction / 365 / self.var.pump_hours / 3600
         )  # Convert from m³/year to m³/s
 
-        # Create boolean masks for different types of water sources
-        mask_channel = self.var.farmer_class == 0
-        mask_reservoir = self.var.farmer_class == 1
-        mask_groundwater = self.var.farmer_class == 2
-
-        # Compute power required for groundwater extraction per agent (kW)
-        power = (
-            self.var.specific_weight_water
-            * groundwater_depth[mask_groundwater]
-            * average_extraction_speed[mask_groundwater]
-            / self.var.pump_efficiency
-        ) / 1000  # Convert from W to kW
-
-        # Compute energy consumption per agent (kWh/year)
-        energy = power * (total_pump_duration[mask_groundwater] * self.var.pump_hours)
-
-        # Get energy cost rate per agent (LCU per kWh)
-        energy_cost_rate = electricity_costs[mask_groundwater]
-
-        # Compute energy costs per agent (LCU/year)
-        energy_costs[mask_groundwater] = energy * energy_cost_rate
-
-        # Compute water costs for agents using channel water (LCU/year)
-        water_costs[mask_channel] = (
-            average_extraction[mask_channel] * self.var.water_costs_m3_channel
-        )
-
-        # Compute water costs for agents using reservoir water (LCU/year)
-        water_costs[mask_reservoir] = (
-            average_extraction[mask_reservoir] * self.var.water_costs_m3_reservoir
-        )
-
-        # Compute water costs for agents using groundwater (LCU/year)
-        water_costs[mask_groundwater] = (
-            average_extraction[mask_groundwater] * self.var.water_costs_m3_groundwater
+        # Fill the water and energy costs per agent in one fused pass over
+        # the agents instead of one masked N-length write per water source
+        compute_water_energy_costs(
+            self.var.farmer_class.data,
+            groundwater_depth,
+            average_extraction,
+            average_extraction_speed,
+            total_pump_duration,
+            electricity_costs,
+            self.var.water_costs_m3_channel,
+            self.var.water_costs_m3_reservoir,
+            self.var.water_costs_m3_groundwater,
+            self.var.specific_weight_water,
+            self.var.pump_efficiency,
+            self.var.pump_hours,
+            energy_costs,
+            water_costs,
         )
 
         # Assume minimal interest rate as farmers pay directly
         interest_rate_farmer = 0.0001  # Annual interest rate
         loan_duration = 2  # Loan duration in years
 
-        # Compute annual cost of water and energy using annuity formula
-        # A = P * [r(1+r)^n] / [(1+r)^n -1], where P is principal, r is interest rate, n is loan duration
-        annuity_factor = (
-            interest_rate_farmer
-            * (1 + interest_rate_farmer) ** loan_duration
-            / ((1 + interest_rate_farmer) ** loan_duration - 1)
-        )
-        annual_cost_water_energy = (water_costs + energy_costs) * annuity_factor
-
-        # Update loan records with the annual cost of water and energy
-        for i in range(4):
-            # Find the first available loan slot
-            if np.all(self.var.all_loans_annual_cost.data[:, 5, i] == 0):
-                self.var.all_loans_annual_cost.data[:, 5, i] = annual_cost_water_energy
-                self.var.loan_tracker[annual_cost_water_energy > 0, 5, i] = (
-                    loan_duration
-                )
-                break
+        # Compute annual cost of water and energy using the annuity formula
+        annual_cost_water_energy = water_costs + energy_costs
+        annual_cost_water_energy *= annuity_factor(interest_rate_farmer, loan_duration)
+
+        # Update loan records with the annual cost of water and energy. Slots
+        # are filled in rotation; with a loan duration of 2 years and 4 slots
+        # the next slot has always expired by the time it is reused
+        i = self.var.next_water_energy_loan_slot
+        self.var.all_loans_annual_cost.data[:, 5, i] = annual_cost_water_energy
+        self.var.loan_tracker[annual_cost_water_energy > 0, 5, i] = loan_duration
+        self.var.next_water_energy_loan_slot = (i + 1) % 4
 
         # Add the annual cost to the total loan annual costs
         self.var.all_loans_annual_cost.data[:, -1, 0] += annual_cost_water_energy
@@ -3970,19 +4662,17 @@ class CropFarmers(AgentBaseClass):
             self.why_30, self.model.current_time
         )
 
-        # Initialize the well unit cost array with zeros
-        well_unit_cost = np.zeros_like(self.var.why_class, dtype=np.float32)
-
-        # Assign unit costs to each agent based on their well class using boolean indexing
-        well_unit_cost[self.var.why_class == 1] = well_cost_class_1[
-            self.var.why_class == 1
-        ]
-        well_unit_cost[self.var.why_class == 2] = well_cost_class_2[
-            self.var.why_class == 2
-        ]
-        well_unit_cost[self.var.why_class == 3] = well_cost_class_3[
-            self.var.why_class == 3
-        ]
+        # Gather the unit cost per agent from its well class in a single pass;
+        # agents without a well class (0) keep a unit cost of zero
+        costs_by_class = np.stack(
+            (
+                np.zeros(self.n, dtype=np.float32),
+                well_cost_class_1,
+                well_cost_class_2,
+                well_cost_class_3,
+            )
+        )
+        well_unit_cost = costs_by_class[self.var.why_class.data, np.arange(self.n)]
 
         # Get electricity costs per agent based on their region and current time
         electricity_costs = self.get_value_per_farmer_from_region_id(
@@ -3999,8 +4689,8 @@ class CropFarmers(AgentBaseClass):
         # Calculate maintenance cost per agent (as a fraction of the installation cost)
         maintenance_cost = self.var.maintenance_factor * install_cost
 
-        # Calculate the total pump duration per agent (average over crops)
-        total_pump_duration = np.mean(self.var.total_crop_age, axis=1)  # days
+        # Total pump duration per agent (average over crops), cached per timestep
+        total_pump_duration = self.total_pump_duration  # days
 
         # Calculate the power required per agent for pumping groundwater (in kilowatts)
         # specific_weight_water (N/m³), groundwater_depth (m), average_extraction_speed (m³/s), pump_efficiency (%)
@@ -4027,18 +4717,13 @@ class CropFarmers(AgentBaseClass):
         ]["adaptation_well"]
         loan_duration = loan_config["loan_duration"]  # Loan duration in years
 
-        # Calculate annuity factor for loan repayment using the annuity formula
-        # A = P * [r(1+r)^n] / [(1+r)^n -1], where:
-        # A = annual payment, P = principal amount (install_cost), r = interest rate, n = loan duration
         interest_rate = 0.05
 
-        n = loan_duration
-        annuity_factor = (interest_rate * (1 + interest_rate) ** n) / (
-            (1 + interest_rate) ** n - 1
-        )
-
-        # Calculate the annual cost per agent (local currency units per year)
-        annual_cost = (install_cost * annuity_factor) + energy_cost + maintenance_cost
+        # Calculate the annual cost per agent (local currency units per year),
+        # accumulating in place to avoid extra full-length temporaries
+        annual_cost = install_cost * annuity_factor(interest_rate, loan_duration)
+        annual_cost += energy_cost
+        annual_cost += maintenance_cost
 
         return annual_cost, potential_well_length
 
@@ -4074,7 +4759,7 @@ class CropFarmers(AgentBaseClass):
 
         # Create an array filled with NaNs for reference data
         nan_array = np.full_like(
-            self.var.crop_calendar[:, :, 0], fill_value=np.nan, dtype=float
+            self.var.crop_calendar[:, :, 0], fill_value=np.nan, dtype=np.float32
         )
 
         # Compute profits without adaptation
@@ -4087,8 +4772,10 @@ class CropFarmers(AgentBaseClass):
             gains_adaptation = self.adaptation_yield_ratio_difference(
                 adapted, yield_ratios
             )
-            # Adjust yield ratios with adaptation gains
-            yield_ratios_adaptation = np.clip(yield_ratios + gains_adaptation, 0, 1)
+            # Adjust yield ratios with adaptation gains, clipping in place to
+            # avoid a second full-size temporary
+            yield_ratios_adaptation = yield_ratios + gains_adaptation
+            np.clip(yield_ratios_adaptation, 0, 1, out=yield_ratios_adaptation)
             # Compute profits with adaptation
             total_profits_adaptation = self.compute_total_profits(
                 yield_ratios_adaptation, crops_mask, nan_array
@@ -4136,7 +4823,7 @@ class CropFarmers(AgentBaseClass):
 
         # Create an array filled with NaNs for reference data
         nan_array = np.full_like(
-            self.var.crop_calendar[:, :, 0], fill_value=np.nan, dtype=float
+            self.var.crop_calendar[:, :, 0], fill_value=np.nan, dtype=np.float32
         )
 
         # Compute profits without adaptation
@@ -4145,9 +4832,13 @@ class CropFarmers(AgentBaseClass):
 
         crop_elevation_group = self.create_unique_groups()
 
-        unique_crop_groups, group_indices = np.unique(
-            crop_elevation_group, axis=0, return_inverse=True
+        # Group on packed scalar keys instead of the axis=0 row sort
+        _, first_occurrence, group_indices = np.unique(
+            pack_group_rows(crop_elevation_group),
+            return_index=True,
+            return_inverse=True,
         )
+        unique_crop_groups = crop_elevation_group[first_occurrence]
 
         # Calculate the yield gains for crop switching for different farmers
         (
@@ -4164,39 +4855,29 @@ class CropFarmers(AgentBaseClass):
             p_droughts=self.var.p_droughts,
         )
 
-        total_profits_adaptation = np.full(
-            (len(unique_crop_calendars), len(self.var.p_droughts[:-1]), self.n),
-            0.0,
-            dtype=np.float32,
-        )
-        profits_no_event_adaptation = np.full(
-            (len(unique_crop_calendars), self.n),
-            0.0,
-            dtype=np.float32,
-        )
-
-        for crop_option in range(len(unique_crop_calendars)):
-            yield_gains_option = yield_gains[:, crop_option, :]
-            # Adjust yield ratios with adaptation gains
-            yield_ratios_adaptation_option = np.clip(
-                yield_ratios + yield_gains_option, 0, 1
-            )
+        # All crop options share the same reference profit, so the adjusted
+        # yield ratios and profits for every option are computed in a single
+        # batched broadcast instead of one compute_total_profits call per
+        # option
+        reference_profit_m2 = self.reference_profit_per_m2(crops_mask, nan_array)
 
-            # Compute profits with adaptation options
-            total_profits_adaptation_option = self.compute_total_profits(
-                yield_ratios_adaptation_option, crops_mask, nan_array
-            )
-            (
-                total_profits_adaptation_option,
-                profits_no_event_adaptation_option,
-            ) = self.format_results(total_profits_adaptation_option)
+        # Adjust yield ratios with adaptation gains, clipping in place;
+        # shape (n_options, n_agents, n_scenarios)
+        yield_ratios_adaptation = yield_ratios[np.newaxis, :, :] + yield_gains.transpose(
+            1, 0, 2
+        )
+        np.clip(yield_ratios_adaptation, 0, 1, out=yield_ratios_adaptation)
+        profits_adaptation = (
+            yield_ratios_adaptation * reference_profit_m2[np.newaxis, :, np.newaxis]
+        ).transpose(0, 2, 1)
 
-            total_profits_adaptation[crop_option, :, :] = (
-                total_profits_adaptation_option
-            )
-            profits_no_event_adaptation[crop_option, :] = (
-                profits_no_event_adaptation_option
-            )
+        # As in format_results, the last scenario is the no-event case
+        total_profits_adaptation = np.ascontiguousarray(
+            profits_adaptation[:, :-1, :], dtype=np.float32
+        )
+        profits_no_event_adaptation = np.ascontiguousarray(
+            profits_adaptation[:, -1, :], dtype=np.float32
+        )
 
         return (
             total_profits,
@@ -4221,12 +4902,11 @@ class CropFarmers(AgentBaseClass):
         Returns:
             np.ndarray: Total profits for agents under each drought scenario.
         """
-        total_profits = np.zeros((self.n, yield_ratios.shape[1]))
-        for col in range(yield_ratios.shape[1]):
-            total_profits[:, col] = self.yield_ratio_to_profit(
-                yield_ratios[:, col], crops_mask, nan_array
-            )
-        return total_profits
+        # The reference profit per m² does not depend on the scenario, so it
+        # is computed once and broadcast over all scenario columns instead of
+        # being rebuilt for every column
+        reference_profit_m2 = self.reference_profit_per_m2(crops_mask, nan_array)
+        return yield_ratios * reference_profit_m2[:, np.newaxis]
 
     def format_results(
         self, total_profits: np.ndarray
@@ -4260,33 +4940,15 @@ class CropFarmers(AgentBaseClass):
             - Adjusts yield ratios to be non-negative and capped at 1.0.
         """
 
-        def logarithmic_function(probability, params):
-            a = params[:, 0]
-            b = params[:, 1]
-            x = probability[:, np.newaxis]
-            return a * np.log10(x) + b
-
-        def exponential_function(probability, params):
-            # Extract parameters
-            a = params[:, 0]  # Shape: (num_agents,)
-            b = params[:, 1]  # Shape: (num_agents,)
-            x = probability  # Shape: (num_events,)
-
-            # Reshape arrays for broadcasting
-            a = a[:, np.newaxis]  # Shape: (num_agents, 1)
-            b = b[:, np.newaxis]  # Shape: (num_agents, 1)
-            x = x[np.newaxis, :]  # Shape: (1, num_events)
-
-            # Compute the exponential function
-            return a * np.exp(b * x)  # Shape: (num_agents, num_events)
-
-        yield_ratios = exponential_function(
-            1 / self.var.p_droughts, self.var.farmer_yield_probability_relation
+        # Evaluate the exponential relation and clip to [0, 1] in one pass;
+        # float32 to keep the profit pipeline single precision
+        yield_ratios = np.empty((self.n, self.var.p_droughts.size), dtype=np.float32)
+        exponential_yield_ratio(
+            1 / self.var.p_droughts,
+            np.asarray(self.var.farmer_yield_probability_relation),
+            yield_ratios,
         )
 
-        # Adjust the yield ratios to lie between 0 and 1
-        yield_ratios = np.clip(yield_ratios, 0, 1)
-
         # Store the results in a global variable
         self.var.yield_ratios_drought_event = yield_ratios[:]
 
@@ -4302,25 +4964,35 @@ class CropFarmers(AgentBaseClass):
         Returns:
         numpy.ndarray: Merged array with crop calendar and elevation distribution groups.
         """
-        # Calculating the thresholds for the N groups
-        percentiles = [100 * i / N for i in range(1, N)]
-        basin_elevation_thresholds = np.percentile(self.var.elevation.data, percentiles)
+        # The elevation of the farmers does not change, so the group labels
+        # are computed once per number of groups and reused; a cached array
+        # is rebuilt when the number of agents has changed
+        distribution_array = self._elevation_distribution_arrays.get(N)
+        if distribution_array is None or distribution_array.size != self.n:
+            # Calculating the thresholds for the N groups
+            percentiles = [100 * i / N for i in range(1, N)]
+            basin_elevation_thresholds = np.percentile(
+                self.var.elevation.data, percentiles
+            )
 
-        # assign group labels
-        distribution_array = np.digitize(
-            self.var.elevation.data, bins=basin_elevation_thresholds, right=False
-        )
+            # assign group labels
+            distribution_array = np.searchsorted(
+                basin_elevation_thresholds, self.var.elevation.data, side="right"
+            ).astype(np.int8)
+            self._elevation_distribution_arrays[N] = distribution_array
 
-        # Merging crop calendar and distribution array
-        crop_elevation_group = np.hstack(
-            (
-                self.var.crop_calendar[:, :, 0],
-                distribution_array.reshape(-1, 1),
-                self.var.farmer_class.reshape(-1, 1),
-            )
+        # Merging crop calendar and distribution array; all characteristics
+        # are small integers, so the table is built as int8 to keep the
+        # group keys cheap to pack and sort
+        crop_calendar = self.var.crop_calendar[:, :, 0]
+        crop_elevation_group = np.empty(
+            (self.n, crop_calendar.shape[1] + 2), dtype=np.int8
         )
+        crop_elevation_group[:, :-2] = crop_calendar
+        crop_elevation_group[:, -2] = distribution_array
+        crop_elevation_group[:, -1] = self.var.farmer_class.data
 
-        return crop_elevation_group.astype(np.int32)
+        return crop_elevation_group
 
     def adaptation_yield_ratio_difference(
         self, adapted: np.ndarray, yield_ratios
@@ -4342,45 +5014,43 @@ class CropFarmers(AgentBaseClass):
 
         crop_elevation_group = self.create_unique_groups()
 
-        # Initialize array to store relative yield ratio improvement for unique groups
-        unique_yield_ratio_gain_relative = np.zeros(
-            (len(np.unique(crop_elevation_group, axis=0)), len(self.var.p_droughts)),
-            dtype=np.float32,
+        # Get unique groups and group indices from the packed scalar keys
+        _, first_occurrence, group_indices = np.unique(
+            pack_group_rows(crop_elevation_group),
+            return_index=True,
+            return_inverse=True,
+        )
+        unique_groups = crop_elevation_group[first_occurrence]
+        n_groups = len(unique_groups)
+
+        # Mean yield ratio per group over past years; sorting the agents by
+        # group makes each group a contiguous slice, so one reduceat call
+        # sums all drought events for all groups at once
+        counts = np.bincount(group_indices, minlength=n_groups)
+        order = np.argsort(group_indices, kind="stable")
+        group_starts = np.zeros(n_groups, dtype=np.int64)
+        np.cumsum(counts[:-1], out=group_starts[1:])
+        group_mean_yield_ratio = np.add.reduceat(
+            np.ascontiguousarray(yield_ratios[order], dtype=np.float32),
+            group_starts,
+            axis=0,
+        ) / counts[:, np.newaxis].astype(np.float32)
+
+        # Groups compare yield between those who have a well (2) and those
+        # that don't; groups without an adapted counterpart keep a gain of 0
+        adapted_combinations = unique_groups.copy()
+        adapted_combinations[:, -1] = 2
+        adapted_rows, has_adapted_counterpart = find_group_rows(
+            unique_groups, adapted_combinations
         )
 
-        # Get unique groups and group indices
-        unique_groups, group_indices = np.unique(
-            crop_elevation_group, axis=0, return_inverse=True
+        unique_yield_ratio_gain_relative = np.zeros(
+            (n_groups, len(self.var.p_droughts)), dtype=np.float32
+        )
+        unique_yield_ratio_gain_relative[has_adapted_counterpart] = (
+            group_mean_yield_ratio[adapted_rows[has_adapted_counterpart]]
+            - group_mean_yield_ratio[has_adapted_counterpart]
         )
-
-        # Loop over each unique group of farmers to determine their average yield ratio
-        for idx, unique_combination in enumerate(unique_groups):
-            unique_farmer_groups = (
-                crop_elevation_group == unique_combination[None, ...]
-            ).all(axis=1)
-
-            # Groups compare yield between those who have well (2) and those that dont
-            unique_combination_adapted = unique_combination.copy()
-            unique_combination_adapted[-1] = 2
-            unique_farmer_groups_adapted = (
-                crop_elevation_group == unique_combination_adapted[None, ...]
-            ).all(axis=1)
-
-            if (
-                np.count_nonzero(unique_farmer_groups) != 0
-                and np.count_nonzero(unique_farmer_groups_adapted) != 0
-            ):
-                # Calculate mean yield ratio over past years for both adapted and unadapted groups
-                unadapted_yield_ratio = np.mean(
-                    yield_ratios[unique_farmer_groups, :], axis=0
-                )
-                adapted_yield_ratio = np.mean(
-                    yield_ratios[unique_farmer_groups_adapted, :], axis=0
-                )
-
-                yield_ratio_gain = adapted_yield_ratio - unadapted_yield_ratio
-
-                unique_yield_ratio_gain_relative[idx, :] = yield_ratio_gain
 
         # Convert group-based results into agent-specific results
         gains_adaptation = unique_yield_ratio_gain_relative[group_indices, :]
@@ -4410,47 +5080,44 @@ class CropFarmers(AgentBaseClass):
         # Create unique groups based on elevation data
         crop_elevation_group = self.create_unique_groups()
 
-        # Get unique groups and group indices
-        unique_groups, group_indices = np.unique(
-            crop_elevation_group, axis=0, return_inverse=True
+        # Get the group indices from the packed scalar keys; the group rows
+        # themselves are not needed here
+        unique_keys, group_indices = np.unique(
+            pack_group_rows(crop_elevation_group), return_inverse=True
         )
 
-        n_groups = unique_groups.shape[0]
-
-        # Initialize arrays to store gains per group
-        unique_water_cost_gain = np.zeros(n_groups, dtype=np.float32)
-        unique_energy_cost_gain = np.zeros(n_groups, dtype=np.float32)
-
-        # For each group, compute gains
-        for g in range(n_groups):
-            # Agents in the current group
-            group_members = group_indices == g
-
-            # Split agents into adapted and unadapted within the group
-            unadapted_agents = group_members & (adapted == 0)
-            adapted_agents = group_members & (adapted == 1)
-
-            # Check if both adapted and unadapted agents are present
-            if np.any(unadapted_agents) and np.any(adapted_agents):
-                # Calculate mean water and energy costs for unadapted agents
-                unadapted_water_cost = np.mean(water_cost[unadapted_agents], axis=0)
-                unadapted_energy_cost = np.mean(energy_cost[unadapted_agents], axis=0)
-
-                # Calculate mean water and energy costs for adapted agents
-                adapted_water_cost = np.mean(water_cost[adapted_agents], axis=0)
-                adapted_energy_cost = np.mean(energy_cost[adapted_agents], axis=0)
+        n_groups = unique_keys.size
 
-                # Calculate gains
-                water_cost_gain = adapted_water_cost - unadapted_water_cost
-                energy_cost_gain = adapted_energy_cost - unadapted_energy_cost
+        # Split each group into its unadapted and adapted halves by offsetting
+        # the adapted agents' group index, so one bincount per variable gives
+        # both halves' sums; rows 0 are unadapted, rows 1 adapted
+        group_split_adapted = group_indices + n_groups * (adapted == 1)
+        counts = np.bincount(group_split_adapted, minlength=2 * n_groups).reshape(2, -1)
+        water_cost_sums = (
+            np.bincount(group_split_adapted, weights=water_cost, minlength=2 * n_groups)
+            .reshape(2, -1)
+            .astype(np.float32)
+        )
+        energy_cost_sums = (
+            np.bincount(
+                group_split_adapted, weights=energy_cost, minlength=2 * n_groups
+            )
+            .reshape(2, -1)
+            .astype(np.float32)
+        )
 
-                # Store gains for the group
-                unique_water_cost_gain[g] = water_cost_gain
-                unique_energy_cost_gain[g] = energy_cost_gain
-            else:
-                # If not enough data, set gains to zero or np.nan
-                unique_water_cost_gain[g] = 0  # or np.nan
-                unique_energy_cost_gain[g] = 0  # or np.nan
+        # Gains are the difference between the adapted and unadapted mean;
+        # groups missing either half keep a gain of zero
+        both_present = (counts > 0).all(axis=0)
+        safe_counts = np.maximum(counts, 1).astype(np.float32)
+        water_cost_means = water_cost_sums / safe_counts
+        energy_cost_means = energy_cost_sums / safe_counts
+        unique_water_cost_gain = np.where(
+            both_present, water_cost_means[1] - water_cost_means[0], np.float32(0)
+        )
+        unique_energy_cost_gain = np.where(
+            both_present, energy_cost_means[1] - energy_cost_means[0], np.float32(0)
+        )
 
         # Map gains back to agents using group indices
         water_cost_adaptation_gain = unique_water_cost_gain[group_indices]
@@ -4458,24 +5125,23 @@ class CropFarmers(AgentBaseClass):
 
         return energy_cost_adaptation_gain, water_cost_adaptation_gain
 
-    def yield_ratio_to_profit(
-        self, yield_ratios: np.ndarray, crops_mask: np.ndarray, nan_array: np.ndarray
+    def reference_profit_per_m2(
+        self, crops_mask: np.ndarray, nan_array: np.ndarray
     ) -> np.ndarray:
         """
-        Convert yield ratios to monetary profit values.
+        Compute the reference profit per square meter for each agent.
 
-        This function computes the profit values for each crop based on given yield ratios.
-        The profit is calculated by multiplying the crop yield in kilograms per sqr. meter with
-        the average crop price. The function leverages various data inputs, such as current crop
-        prices and reference yields.
+        The reference profit is calculated by multiplying the reference crop yield in
+        kilograms per sqr. meter with the average crop price. The function leverages
+        various data inputs, such as current crop prices and reference yields.
+        Multiplying it with a yield ratio gives the monetary profit per m².
 
         Args:
-            yield_ratios: The array of yield ratios for the crops.
             crops_mask: A mask that denotes valid crops, based on certain conditions.
-            array_with_reference: An array initialized with NaNs, later used to store reference yields and crop prices.
+            nan_array: An array initialized with NaNs, later used to store reference yields and crop prices.
 
         Returns:
-            An array representing the profit values for each crop based on the given yield ratios.
+            An array with the reference profit per m² for each agent.
 
         Note:
             - It assumes that the crop prices are non-NaN for the current model time.
@@ -4494,34 +5160,21 @@ class CropFarmers(AgentBaseClass):
         ]
 
         if price_frequency == "monthly":
-            total_price = 0
-            month_count = 0
+            assert self.crop_prices[0] is not None, "behavior needs crop prices to work"
 
-            # Ending date and start date set to one year prior
+            # Average the prices of every month from January of the previous
+            # year up to the current month, resolving all month starts with a
+            # single searchsorted instead of one date lookup per month
             end_date = self.model.current_time
-            start_date = datetime(end_date.year - 1, 1, 1)
-
-            # Loop through each month from start_date to end_date to get the sum of crop costs over the past year
-            current_date = start_date
-            while current_date <= end_date:
-                assert self.crop_prices[0] is not None, (
-                    "behavior needs crop prices to work"
-                )
-                monthly_price = self.crop_prices[1][
-                    self.crop_prices[0].get(current_date)
+            n_months = 12 + end_date.month
+            month_starts = np.array(
+                [
+                    datetime(end_date.year - 1 + month // 12, month % 12 + 1, 1)
+                    for month in range(n_months)
                 ]
-                total_price += monthly_price
-                # Move to the next month
-                if current_date.month == 12:
-                    current_date = datetime(current_date.year + 1, 1, 1)
-                else:
-                    current_date = datetime(
-                        current_date.year, current_date.month + 1, 1
-                    )
-                month_count += 1
-
-            # Calculate the average price over the last year
-            crop_prices = total_price / month_count
+            )
+            price_indices = self.crop_prices[0].get(month_starts)
+            crop_prices = self.crop_prices[1][price_indices].mean(axis=0)
 
         else:
             crop_prices = self.agents.market.crop_prices[self.var.region_id]
@@ -4547,56 +5200,67 @@ class CropFarmers(AgentBaseClass):
             reference_profit_m2 >= 0
         ).all()  # Ensure all crop yields are non-negative
 
-        # Calculate profit by multiplying yield with price
-        profit_m2 = yield_ratios * reference_profit_m2
-
-        return profit_m2
+        return reference_profit_m2
 
     def update_loans(self) -> None:
-        # Subtract 1 off each loan duration, except if that loan is at 0
-        self.var.loan_tracker -= self.var.loan_tracker != 0
-        # If the loan tracker is at 0, cancel the loan amount and subtract it of the total
-        expired_loan_mask = self.var.loan_tracker == 0
-
-        # Add a column to make it the same shape as the loan amount array
-        new_column = np.full((self.n, 1, 5), False)
-        expired_loan_mask = np.column_stack((expired_loan_mask, new_column))
-
-        # Sum the expired loan amounts
-        ending_loans = expired_loan_mask * self.var.all_loans_annual_cost
-        total_loan_reduction = np.sum(ending_loans, axis=(1, 2))
-
-        # Subtract it from the total loans and set expired loans to 0
+        # Advance all loan durations one year, cancel the loans that have
+        # expired and subtract their annual cost from the total
+        total_loan_reduction = expire_loans(
+            self.var.loan_tracker.data, self.var.all_loans_annual_cost.data
+        )
         self.var.all_loans_annual_cost[:, -1, 0] -= total_loan_reduction
-        self.var.all_loans_annual_cost[expired_loan_mask] = 0
 
         # Adjust for inflation in separate array for export
-        # Calculate the cumulative inflation from the start year to the current year for each farmer
-        inflation_arrays = [
-            self.get_value_per_farmer_from_region_id(
-                self.inflation_rate, datetime(year, 1, 1)
-            )
+        # Calculate the cumulative inflation from the start year to the
+        # current year for each farmer as one product over the (farmers,
+        # years) slice of the cached inflation table
+        date_index, _ = self.inflation_rate
+        year_indices = [
+            date_index.get(datetime(year, 1, 1))
             for year in range(
                 self.model.config["general"]["spinup_time"].year,
                 self.model.current_time.year + 1,
             )
         ]
-
-        cum_inflation = np.ones_like(inflation_arrays[0])
-        for inflation in inflation_arrays:
-            cum_inflation *= inflation
+        region_ids, value_table = self.region_value_table(self.inflation_rate)
+        rows = np.searchsorted(region_ids, self.var.region_id.data)
+        cum_inflation = value_table[rows[:, np.newaxis], year_indices].prod(axis=1)
 
         self.var.adjusted_annual_loan_cost = (
             self.var.all_loans_annual_cost / cum_inflation[..., None, None]
         )
 
+    def region_value_table(self, data) -> Tuple[np.ndarray, np.ndarray]:
+        """Gets the cached (regions, time) value table of an economic dataset.
+
+        The per-region time series are materialized as one table on first
+        use, so value lookups are a single fancy index instead of a Python
+        loop with a dict lookup per region.
+
+        Args:
+            data: Economic dataset as loaded by load_economic_data.
+
+        Returns:
+            Tuple of the sorted region ids and the value table.
+        """
+        cached = self._region_value_tables.get(id(data))
+        if cached is None:
+            region_ids = np.array(sorted(data[1]))
+            value_table = np.stack(
+                [
+                    np.asarray(data[1][region_id], dtype=np.float32)
+                    for region_id in region_ids
+                ]
+            )
+            cached = (region_ids, value_table)
+            self._region_value_tables[id(data)] = cached
+        return cached
+
     def get_value_per_farmer_from_region_id(self, data, time) -> np.ndarray:
         index = data[0].get(time)
-        unique_region_ids, inv = np.unique(self.var.region_id, return_inverse=True)
-        values = np.full_like(unique_region_ids, np.nan, dtype=np.float32)
-        for i, region_id in enumerate(unique_region_ids):
-            values[i] = data[1][region_id][index]
-        return values[inv]
+        region_ids, value_table = self.region_value_table(data)
+        rows = np.searchsorted(region_ids, self.var.region_id.data)
+        return value_table[rows, index]
 
     @staticmethod
     @njit(cache=True)
@@ -4638,6 +5302,76 @@ class CropFarmers(AgentBaseClass):
             self.HRU.var.cellArea,
         )
 
+    @property
+    def inv_p_droughts(self) -> np.ndarray:
+        """Gets the inverse drought return periods, excluding the 'no drought' class.
+
+        Returns:
+            inv_p_droughts: Probability of each drought event occurring in a given year.
+        """
+        if self._inv_p_droughts is None:
+            self._inv_p_droughts = 1 / self.var.p_droughts[:-1]
+        return self._inv_p_droughts
+
+    @property
+    def total_pump_duration(self) -> np.ndarray:
+        """Gets the mean crop age per farmer, used as the yearly pump duration.
+
+        Cached per timestep so that the water and well cost calculations
+        share a single pass over total_crop_age; the cache is invalidated
+        at the start of step().
+
+        Returns:
+            total_pump_duration: Pump duration per farmer in days.
+        """
+        if self._total_pump_duration is None:
+            self._total_pump_duration = np.mean(self.var.total_crop_age, axis=1)
+        return self._total_pump_duration
+
+    def decision_horizon_array(self, decision_horizon: int) -> np.ndarray:
+        """Gets a length-n array filled with the given decision horizon.
+
+        Arrays are cached per horizon so the adaptation methods do not
+        reallocate them every call; a cached array is rebuilt when the
+        number of agents has changed.
+
+        Args:
+            decision_horizon: Decision horizon in years.
+
+        Returns:
+            decision_horizon_array: Decision horizon for each farmer.
+        """
+        cached = self._decision_horizon_arrays.get(decision_horizon)
+        if cached is None or cached.size != self.n:
+            cached = np.full(self.n, decision_horizon)
+            self._decision_horizon_arrays[decision_horizon] = cached
+        return cached
+
+    @staticmethod
+    @njit(cache=True, parallel=True)
+    def irrigated_fields_numba(
+        land_owners: np.ndarray,
+        irrigation_source: np.ndarray,
+        no_irrigation_key: int,
+    ) -> np.ndarray:
+        """Gets whether each field is irrigated.
+
+        Args:
+            land_owners: Landowner for each HRU, -1 if not owned by a farmer.
+            irrigation_source: Irrigation source for each farmer.
+            no_irrigation_key: Key in the irrigation source map for no irrigation.
+
+        Returns:
+            is_irrigated: Whether each field is irrigated.
+        """
+        is_irrigated = np.empty(land_owners.size, dtype=np.bool_)
+        for field in prange(land_owners.size):
+            land_owner = land_owners[field]
+            is_irrigated[field] = (
+                land_owner != -1 and irrigation_source[land_owner] != no_irrigation_key
+            )
+        return is_irrigated
+
     @property
     def irrigated_fields(self) -> np.ndarray:
         """Gets the indices of fields that are irrigated.
@@ -4645,12 +5379,11 @@ class CropFarmers(AgentBaseClass):
         Returns:
             irrigated_fields: Indices of fields that are irrigated.
         """
-        is_irrigated = np.take(
-            self.var.irrigation_source != self.var.irrigation_source_key["no"],
+        return self.irrigated_fields_numba(
             self.HRU.var.land_owners,
+            self.var.irrigation_source.data,
+            self.var.irrigation_source_key["no"],
         )
-        is_irrigated[self.HRU.var.land_owners == -1] = False
-        return is_irrigated
 
     @property
     def groundwater_depth(self):
@@ -4666,10 +5399,12 @@ class CropFarmers(AgentBaseClass):
         return groundwater_depth
 
     def create_agent_classes(self, *characteristics):
-        agent_classes = np.unique(
-            np.stack(characteristics), axis=1, return_inverse=True
-        )[1]
-        return agent_classes
+        keys = pack_group_rows(np.stack(characteristics, axis=1))
+        unique_keys, agent_classes = np.unique(keys, return_inverse=True)
+        assert unique_keys.size <= np.iinfo(np.int8).max, (
+            "Agent classes no longer fit in int8."
+        )
+        return agent_classes.astype(np.int8)
 
     def step(self) -> None:
         """
@@ -4677,143 +5412,176 @@ class CropFarmers(AgentBaseClass):
 
         Then, farmers harvest and plant crops.
         """
+        # Invalidate the per-timestep pump duration cache, as harvesting
+        # updates the crop ages it is derived from
+        self._total_pump_duration = None
 
         self.harvest()
         self.plant()
         self.water_abstraction_sum()
 
-        ## yearly actions
-        if self.model.current_time.month == 1 and self.model.current_time.day == 1:
-            # Set yearly yield ratio based on the difference between saved actual and potential profit
-            self.var.yearly_yield_ratio = (
-                self.var.yearly_profits / self.var.yearly_potential_profits
-            )
+        if self.model.is_new_year:
+            self.annual_update()
+        # if self.model.current_timestep == 100:
+        #     self.add_agent(indices=(np.array([310, 309]), np.array([69, 69])))
+        # if self.model.current_timestep == 105:
+        #     self.remove_agent(farmer_idx=1000)
 
-            self.save_yearly_spei()
+    def annual_update(self) -> None:
+        """Yearly farmer bookkeeping and adaptation, run on January 1st."""
+        # Set yearly yield ratio based on the difference between saved actual and potential profit
+        self.var.yearly_yield_ratio = (
+            self.var.yearly_profits / self.var.yearly_potential_profits
+        )
 
-            # reset the irrigation limit, but only if a full year has passed already. Otherwise
-            # the cumulative water deficit is not year completed.
-            if self.model.current_time.year - 1 > self.model.spinup_start.year:
-                self.var.remaining_irrigation_limit_m3[:] = (
-                    self.var.irrigation_limit_m3[:]
-                )
+        self.save_yearly_spei()
 
-            # Set to 0 if channel abstraction is bigger than reservoir and groundwater, 1 for reservoir, 2 for groundwater and 3 no abstraction
-            main_irrigation_source = np.argmax(
-                self.var.yearly_abstraction_m3_by_farmer[:, :3, 0], axis=1
+        # reset the irrigation limit, but only if a full year has passed already. Otherwise
+        # the cumulative water deficit is not year completed.
+        if self.model.current_time.year - 1 > self.model.spinup_start.year:
+            self.var.remaining_irrigation_limit_m3[:] = (
+                self.var.irrigation_limit_m3[:]
             )
-            # Set to 3 for precipitation if there is no abstraction
-            main_irrigation_source[
-                self.var.yearly_abstraction_m3_by_farmer[:, :3, 0].sum(axis=1) == 0
-            ] = 3
 
-            self.var.farmer_class[:] = self.create_agent_classes(
-                main_irrigation_source, self.farmer_command_area
-            )
+        # Set to 0 if channel abstraction is bigger than reservoir and groundwater,
+        # 1 for reservoir, 2 for groundwater and 3 for precipitation if there is
+        # no abstraction
+        yearly_abstraction = self.var.yearly_abstraction_m3_by_farmer[:, :3, 0]
+        main_irrigation_source = np.where(
+            yearly_abstraction.sum(axis=1) == 0,
+            np.int8(3),
+            yearly_abstraction.argmax(axis=1).astype(np.int8),
+        )
 
-            print(
-                "well",
-                np.mean(self.var.yearly_yield_ratio[self.var.farmer_class == 2, 1]),
-                "no well",
-                np.mean(self.var.yearly_yield_ratio[self.var.farmer_class == 3, 1]),
-                "total_mean",
-                np.mean(self.var.yearly_yield_ratio[:, 1]),
-            )
+        self.var.farmer_class[:] = self.create_agent_classes(
+            main_irrigation_source, self.farmer_command_area
+        )
 
-            timer = TimingModule("crop_farmers")
+        print(
+            "well",
+            np.mean(self.var.yearly_yield_ratio[self.var.farmer_class == 2, 1]),
+            "no well",
+            np.mean(self.var.yearly_yield_ratio[self.var.farmer_class == 3, 1]),
+            "total_mean",
+            np.mean(self.var.yearly_yield_ratio[:, 1]),
+        )
 
-            energy_cost, water_cost, average_extraction_speed = (
-                self.calculate_water_costs()
-            )
+        timer = TimingModule("crop_farmers")
 
-            timer.new_split("water & energy costs")
+        energy_cost, water_cost, average_extraction_speed = (
+            self.calculate_water_costs()
+        )
 
-            if (
-                not self.model.spinup
-                and "ruleset" in self.config
-                and not self.config["ruleset"] == "no-adaptation"
-            ):
-                # Determine the relation between drought probability and yield
-                # self.calculate_yield_spei_relation()
-                self.calculate_yield_spei_relation_group()
-                # self.calculate_yield_spei_relation_test_group()
-                timer.new_split("yield-spei relation")
-
-                # These adaptations can only be done if there is a yield-probability relation
-                if not np.all(self.var.farmer_yield_probability_relation == 0):
-                    if (
-                        not self.config["expected_utility"]["adaptation_well"][
-                            "ruleset"
-                        ]
-                        == "no-adaptation"
-                    ):
-                        self.adapt_irrigation_well(
-                            average_extraction_speed, energy_cost, water_cost
-                        )
-                        timer.new_split("irr well")
-                    if (
-                        not self.config["expected_utility"]["adaptation_sprinkler"][
-                            "ruleset"
-                        ]
-                        == "no-adaptation"
-                    ):
-                        self.adapt_irrigation_efficiency(energy_cost, water_cost)
-                        timer.new_split("irr efficiency")
-                    if (
-                        not self.config["expected_utility"][
-                            "adaptation_irrigation_expansion"
-                        ]["ruleset"]
-                        == "no-adaptation"
-                    ):
-                        self.adapt_irrigation_expansion(energy_cost, water_cost)
-                        timer.new_split("irr expansion")
-                    if (
-                        not self.config["expected_utility"]["crop_switching"]["ruleset"]
-                        == "no-adaptation"
-                    ):
-                        self.adapt_crops()
-                        timer.new_split("adapt crops")
-                    # self.switch_crops_neighbors()
-                else:
-                    raise AssertionError(
-                        "Cannot adapt without yield - probability relation"
+        timer.new_split("water & energy costs")
+
+        if (
+            not self.model.spinup
+            and "ruleset" in self.config
+            and not self.config["ruleset"] == "no-adaptation"
+        ):
+            # Determine the relation between drought probability and yield
+            # self.calculate_yield_spei_relation()
+            self.calculate_yield_spei_relation_group()
+            # self.calculate_yield_spei_relation_test_group()
+            timer.new_split("yield-spei relation")
+
+            # These adaptations can only be done if there is a yield-probability relation
+            if not np.all(self.var.farmer_yield_probability_relation == 0):
+                if (
+                    not self.config["expected_utility"]["adaptation_well"][
+                        "ruleset"
+                    ]
+                    == "no-adaptation"
+                ):
+                    self.adapt_irrigation_well(
+                        average_extraction_speed, energy_cost, water_cost
                     )
+                    timer.new_split("irr well")
+                if (
+                    not self.config["expected_utility"]["adaptation_sprinkler"][
+                        "ruleset"
+                    ]
+                    == "no-adaptation"
+                ):
+                    self.adapt_irrigation_efficiency(energy_cost, water_cost)
+                    timer.new_split("irr efficiency")
+                if (
+                    not self.config["expected_utility"][
+                        "adaptation_irrigation_expansion"
+                    ]["ruleset"]
+                    == "no-adaptation"
+                ):
+                    self.adapt_irrigation_expansion(energy_cost, water_cost)
+                    timer.new_split("irr expansion")
+                if (
+                    not self.config["expected_utility"]["crop_switching"]["ruleset"]
+                    == "no-adaptation"
+                ):
+                    self.adapt_crops()
+                    timer.new_split("adapt crops")
+                # self.switch_crops_neighbors()
+            else:
+                raise AssertionError(
+                    "Cannot adapt without yield - probability relation"
+                )
 
-            print(timer)
-            advance_crop_rotation_year(
-                current_crop_calendar_rotation_year_index=self.var.current_crop_calendar_rotation_year_index,
-                crop_calendar_rotation_years=self.var.crop_calendar_rotation_years,
-            )
+        print(timer)
+        advance_crop_rotation_year(
+            current_crop_calendar_rotation_year_index=self.var.current_crop_calendar_rotation_year_index,
+            crop_calendar_rotation_years=self.var.crop_calendar_rotation_years,
+        )
 
-            # Update loans
-            self.update_loans()
+        # Update loans
+        self.update_loans()
 
-            # Reset total crop age
-            shift_and_update(self.var.total_crop_age, self.var.total_crop_age[:, 0])
+        # Reset total crop age
+        shift_and_update(self.var.total_crop_age, self.var.total_crop_age[:, 0])
 
-            for i in range(len(self.var.yearly_abstraction_m3_by_farmer[0, :, 0])):
-                shift_and_reset_matrix(
-                    self.var.yearly_abstraction_m3_by_farmer[:, i, :]
-                )
+        shift_and_reset_matrix(self.var.yearly_abstraction_m3_by_farmer.data)
 
-            # Shift the potential and yearly profits forward
-            shift_and_reset_matrix(self.var.yearly_profits)
-            shift_and_reset_matrix(self.var.yearly_potential_profits)
-        # if self.model.current_timestep == 100:
-        #     self.add_agent(indices=(np.array([310, 309]), np.array([69, 69])))
-        # if self.model.current_timestep == 105:
-        #     self.remove_agent(farmer_idx=1000)
+        # Shift the potential and yearly profits forward
+        shift_and_reset_matrix(self.var.yearly_profits)
+        shift_and_reset_matrix(self.var.yearly_potential_profits)
 
     def remove_agents(
         self, farmer_indices: list[int], land_use_type: int
     ) -> np.ndarray:
-        farmer_indices = np.array(farmer_indices)
-        if farmer_indices.size > 0:
-            farmer_indices = np.sort(farmer_indices)[::-1]
-            HRUs_with_removed_farmers = []
-            for idx in farmer_indices:
-                HRUs_with_removed_farmers.append(self.remove_agent(idx, land_use_type))
-        return np.concatenate(HRUs_with_removed_farmers)
+        farmer_indices = np.unique(np.asarray(farmer_indices, dtype=np.int64))
+        if farmer_indices.size == 0:
+            return np.array([], dtype=np.int64)
+        assert farmer_indices[0] >= 0, "Farmer indices must be positive."
+        assert farmer_indices[-1] < self.n, (
+            "Farmer indices must be less than the number of agents."
+        )
+
+        land_owners = self.HRU.var.land_owners
+        HRUs_with_removed_farmers = np.where(np.isin(land_owners, farmer_indices))[0]
+
+        # disown the removed farmers.
+        land_owners[HRUs_with_removed_farmers] = -1
+        self.HRU.var.crop_map[HRUs_with_removed_farmers] = -1
+        self.HRU.var.crop_age_days_map[HRUs_with_removed_farmers] = -1
+        self.HRU.var.crop_harvest_age_days[HRUs_with_removed_farmers] = -1
+        self.HRU.var.land_use_type[HRUs_with_removed_farmers] = land_use_type
+
+        # compact the data of the remaining agents, keeping their relative order.
+        keep_mask = np.ones(self.n, dtype=bool)
+        keep_mask[farmer_indices] = False
+        n_remaining = self.n - farmer_indices.size
+        for agent_array in self.agent_arrays.values():
+            agent_array[:n_remaining] = agent_array.data[keep_mask]
+            agent_array.n = n_remaining
+        self.n = n_remaining
+
+        # remap the fields of the remaining agents to their new indices.
+        new_index = np.cumsum(keep_mask) - 1
+        owned = land_owners != -1
+        land_owners[owned] = new_index[land_owners[owned]]
+
+        self.update_field_indices()
+
+        assert (self.HRU.var.land_owners[HRUs_with_removed_farmers] == -1).all()
+        return HRUs_with_removed_farmers
 
     def remove_agent(self, farmer_idx: int, land_use_type: int) -> np.ndarray:
         assert farmer_idx >= 0, "Farmer index must be positive."
@@ -4823,7 +5591,10 @@ class CropFarmers(AgentBaseClass):
         last_farmer_HRUs = get_farmer_HRUs(
             self.var.field_indices, self.var.field_indices_by_farmer.data, -1
         )
-        last_farmer_field_size = self.field_size_per_farmer[-1]  # for testing only
+        if __debug__:
+            # for testing only; sum the last farmer's cell areas directly
+            # rather than running the field size kernel over all farmers
+            last_farmer_field_size = self.HRU.var.cellArea[last_farmer_HRUs].sum()
 
         # disown the farmer.
         HRUs_farmer_to_be_removed = get_farmer_HRUs(
@@ -4878,7 +5649,13 @@ class CropFarmers(AgentBaseClass):
             )
             assert math.isclose(
                 last_farmer_field_size,
-                self.field_size_per_farmer[farmer_idx],
+                self.HRU.var.cellArea[
+                    get_farmer_HRUs(
+                        self.var.field_indices,
+                        self.var.field_indices_by_farmer.data,
+                        farmer_idx,
+                    )
+                ].sum(),
                 abs_tol=1,
             )
 
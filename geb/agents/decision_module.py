@@ -1,5 +1,33 @@
 import numpy as np
 from numba import njit, prange
+from typing import NamedTuple
+
+
+class DecisionParams(NamedTuple):
+    """Parameters for the expected-utility calculations.
+
+    Built once per adaptation decision and passed to the calcEU_* methods as
+    a single struct, so the calculations share one set of inputs instead of
+    rebuilding and unpacking a large kwargs dict per call.
+    """
+
+    loan_duration: int
+    expenditure_cap: float
+    n_agents: int
+    sigma: np.ndarray
+    p_droughts: np.ndarray
+    profits_no_event: np.ndarray
+    profits_no_event_adaptation: np.ndarray
+    total_profits: np.ndarray
+    total_profits_adaptation: np.ndarray
+    risk_perception: np.ndarray
+    total_annual_costs: np.ndarray
+    adaptation_costs: np.ndarray
+    adapted: np.ndarray
+    time_adapted: np.ndarray
+    T: np.ndarray
+    discount_rate: np.ndarray
+    extra_constraint: np.ndarray
 
 
 class DecisionModule:
@@ -68,35 +96,25 @@ class DecisionModule:
         return NPV_summed
 
     def calcEU_do_nothing(
-        self,
-        n_agents: int,
-        risk_perception: np.ndarray,
-        total_profits: np.ndarray,
-        profits_no_event: np.ndarray,
-        p_droughts: np.ndarray,
-        T: np.ndarray,
-        discount_rate: float,
-        sigma: float,
-        subjective: bool = True,
-        **kwargs,
+        self, params: DecisionParams, subjective: bool = True
     ) -> np.ndarray:
         """This function calculates the time discounted subjective utility of not undertaking any action.
 
         Args:
-            n_agents: number of agents in the floodplain.
-            wealth: array containing the wealth of each household.
-            income: array containing the income of each household.
-            risk_perception: array containing the risk perception of each household (see manuscript for details).
-            expected_damages: array expected damages for each flood event for each agent under no implementation of dry flood proofing.
-            adapted: array containing the adaptation status of each agent (1 = adapted, 0 = not adapted).
-            p_droughts: array containing the exceedance probabilities of each flood event included in the analysis.
-            T: array containing the decision horizon of each agent.
-            r: time discounting factor.
-            sigma: risk aversion setting.
+            params: parameters of the expected-utility calculation.
+            subjective: whether to weight the event probabilities by the agents' risk perception.
 
         Returns:
             EU_do_nothing_array: array containing the time discounted subjective utility of doing nothing for each agent.
         """
+        n_agents = params.n_agents
+        risk_perception = params.risk_perception
+        total_profits = params.total_profits
+        profits_no_event = params.profits_no_event
+        p_droughts = params.p_droughts
+        T = params.T
+        discount_rate = params.discount_rate
+        sigma = params.sigma
 
         # Ensure p floods is in increasing order
         indices = np.argsort(p_droughts)
@@ -162,9 +180,75 @@ class DecisionModule:
 
         return EU_do_nothing_array
 
+    def calcEU_adapt(self, params: DecisionParams) -> np.ndarray:
+        """Calculates the discounted subjective utility of adapting for each agent.
+
+        Thin wrapper that expands the parameter struct into positional
+        arguments for the numba kernel.
+
+        Args:
+            params: parameters of the expected-utility calculation.
+
+        Returns:
+            EU_adapt: array containing the time-discounted subjective utility of adapting for each agent.
+        """
+        return self.calcEU_adapt_numba(
+            params.expenditure_cap,
+            params.loan_duration,
+            params.n_agents,
+            params.sigma,
+            params.profits_no_event,
+            params.total_profits_adaptation,
+            params.profits_no_event_adaptation,
+            params.p_droughts,
+            params.risk_perception,
+            params.adaptation_costs,
+            params.total_annual_costs,
+            params.time_adapted,
+            params.adapted,
+            params.T,
+            params.discount_rate,
+            params.extra_constraint,
+            params.total_profits,
+        )
+
+    def calcEU_adapt_batched(self, params: DecisionParams) -> np.ndarray:
+        """Calculates the discounted subjective utility of several adaptation options at once.
+
+        Thin wrapper that expands the parameter struct into positional
+        arguments for the numba kernel.
+
+        Args:
+            params: parameters of the expected-utility calculation, where
+                total_profits_adaptation, profits_no_event_adaptation and
+                adaptation_costs carry a leading option axis.
+
+        Returns:
+            EU_adapt: (n_options, n_agents) array containing the time-discounted subjective utility of each option for each agent.
+        """
+        return self.calcEU_adapt_batched_numba(
+            params.expenditure_cap,
+            params.loan_duration,
+            params.n_agents,
+            params.sigma,
+            params.profits_no_event,
+            params.total_profits_adaptation,
+            params.profits_no_event_adaptation,
+            params.p_droughts,
+            params.risk_perception,
+            params.adaptation_costs,
+            params.total_annual_costs,
+            params.time_adapted,
+            params.adapted,
+            params.T,
+            params.discount_rate,
+            params.extra_constraint,
+            params.total_profits,
+        )
+
     @staticmethod
     @njit(cache=True, parallel=True)
-    def calcEU_adapt(
+    def calcEU_adapt_numba(
         expenditure_cap: float,
         loan_duration: int,
         n_agents: int,
@@ -310,6 +394,167 @@ class DecisionModule:
 
         return EU_adapt
 
+    @staticmethod
+    @njit(cache=True, parallel=True)
+    def calcEU_adapt_batched_numba(
+        expenditure_cap: float,
+        loan_duration: int,
+        n_agents: int,
+        sigma: np.ndarray,
+        profits_no_event: np.ndarray,
+        total_profits_adaptation: np.ndarray,
+        profits_no_event_adaptation: np.ndarray,
+        p_droughts: np.ndarray,
+        risk_perception: np.ndarray,
+        adaptation_costs: np.ndarray,
+        total_annual_costs: np.ndarray,
+        time_adapted: np.ndarray,
+        adapted: np.ndarray,
+        T: np.ndarray,
+        discount_rate: np.ndarray,
+        extra_constraint: np.ndarray,
+        total_profits: np.ndarray,
+    ) -> np.ndarray:
+        """Batched version of calcEU_adapt that evaluates several adaptation options at once.
+
+        The option-specific inputs (total_profits_adaptation, profits_no_event_adaptation
+        and adaptation_costs) carry a leading option axis; all other inputs are shared
+        between options. All option-agent pairs are processed in a single parallel sweep,
+        which avoids one full dispatch per option.
+
+        Args:
+            expenditure_cap: expenditure cap for dry flood proofing investments.
+            loan_duration: loan duration of the dry flood proofing investment.
+            n_agents: number of agents present in the current floodplain.
+            sigma: array of risk aversion settings for the agents.
+            profits_no_event: array containing the profits of each agent without any drought events.
+            total_profits_adaptation: 3D array containing the total profits of adaptation for each option, drought event and agent.
+            profits_no_event_adaptation: 2D array containing the profits of each agent without any drought events for each option.
+            p_droughts: array containing the probabilities of each drought event.
+            risk_perception: array containing the risk perception of each agent.
+            adaptation_costs: 2D array of annual implementation costs of each option for each agent.
+            total_annual_costs: array containing total annual costs for each agent.
+            time_adapted: array containing the time each agent has been paying off their adaptation loan.
+            adapted: array containing the adaptation status of each agent (1 = adapted, 0 = not adapted).
+            T: array containing the decision horizon of each agent.
+            discount_rate: array of time discounting factors for each agent.
+            extra_constraint: array of boolean values representing extra constraints for each agent.
+            total_profits: array containing total profits for each agent.
+
+        Returns:
+            EU_adapt: (n_options, n_agents) array containing the time-discounted subjective utility of each option for each agent.
+        """
+        n_options = total_profits_adaptation.shape[0]
+
+        # Preallocate arrays
+        EU_adapt = np.full((n_options, n_agents), -np.inf, dtype=np.float32)
+
+        # Ensure p_droughts is in increasing order
+        indices = np.argsort(p_droughts)
+        p_droughts = p_droughts[indices]
+        n_events = p_droughts.size
+        total_profits_adaptation_sorted = np.empty_like(total_profits_adaptation)
+        for option in range(n_options):
+            for event in range(n_events):
+                total_profits_adaptation_sorted[option, event] = (
+                    total_profits_adaptation[option, indices[event]]
+                )
+
+        # Identify agents able to afford the adaptation and that have not yet
+        # adapted; the affordability constraint does not depend on the option
+        unconstrained_mask = (
+            (profits_no_event * expenditure_cap > total_annual_costs)
+            & (adapted == 0)
+            & extra_constraint
+        )
+
+        # Iterate only through agents who can afford to adapt
+        unconstrained_indices = np.where(unconstrained_mask)[0]
+        n_unconstrained = unconstrained_indices.size
+
+        for task in prange(n_options * n_unconstrained):
+            option = task // n_unconstrained
+            i = unconstrained_indices[task % n_unconstrained]
+
+            # Loan payment years remaining
+            payment_remainder = max(loan_duration - time_adapted[i], 0)
+
+            # Decision horizon for the agent
+            T_i = T[i]
+            t_agent = np.arange(T_i, dtype=np.int32)
+
+            # NPV under no drought event after adaptation
+            NPV_adapt_no_flood = np.full(
+                T_i, profits_no_event_adaptation[option, i], dtype=np.float32
+            )
+
+            # Subtract adaptation costs during payment period
+            for t in range(T_i):
+                if t < payment_remainder:
+                    NPV_adapt_no_flood[t] -= adaptation_costs[option, i]
+
+            # Ensure NPVs are at least a small positive number to prevent NaNs
+            NPV_adapt_no_flood = np.maximum(NPV_adapt_no_flood, 1e-6)
+
+            # Time-discounted NPVs
+            discount_factors = (1 + discount_rate[i]) ** t_agent
+            NPV_adapt_no_flood_discounted = NPV_adapt_no_flood / discount_factors
+            NPV_adapt_no_flood_summed = np.sum(NPV_adapt_no_flood_discounted)
+
+            # Apply utility function to NPVs
+            NPV_adapt_no_flood_summed = max(
+                NPV_adapt_no_flood_summed, 1e-6
+            )  # Ensure positive
+            EU_adapt_no_flood = (NPV_adapt_no_flood_summed ** (1 - sigma[i])) / (
+                1 - sigma[i]
+            )
+
+            # Calculate NPVs for each drought event
+            NPV_adapt = np.empty((n_events, T_i), dtype=np.float32)
+            total_profits_adaptation_i = total_profits_adaptation_sorted[option, :, i]
+
+            for j in range(n_events):
+                NPV_event = np.full(
+                    T_i, total_profits_adaptation_i[j], dtype=np.float32
+                )
+                for t in range(T_i):
+                    if t < payment_remainder:
+                        NPV_event[t] -= adaptation_costs[option, i]
+                NPV_event = np.maximum(NPV_event, 1e-6)  # Ensure positive
+                NPV_event_discounted = NPV_event / discount_factors
+                NPV_adapt[j, :] = NPV_event_discounted
+
+            NPV_adapt_summed = np.sum(NPV_adapt, axis=1)
+            NPV_adapt_summed = np.maximum(NPV_adapt_summed, 1e-6)  # Ensure positive
+
+            # Calculate expected utilities for each event
+            EU_adapt_flood = (NPV_adapt_summed ** (1 - sigma[i])) / (1 - sigma[i])
+
+            # Prepare arrays for integration
+            EU_adapt_dict = np.zeros(n_events + 3, dtype=np.float32)
+            p_all_events = np.zeros(n_events + 3, dtype=np.float32)
+
+            EU_adapt_dict[1 : n_events + 1] = EU_adapt_flood
+            EU_adapt_dict[n_events + 1 : n_events + 3] = EU_adapt_no_flood
+            EU_adapt_dict[0] = EU_adapt_flood[0]
+
+            # Adjust for perceived risk
+            p_all_events[1 : n_events + 1] = risk_perception[i] * p_droughts
+            p_all_events[n_events + 1] = (
+                p_all_events[n_events] + 0.001
+            )  # Small increment
+            p_all_events[n_events + 2] = 1.0  # Ensure total probability sums to 1
+            p_all_events[0] = 0.0
+
+            # Integrate EU over probabilities using trapezoidal rule
+            EU_adapt[option, i] = np.trapz(EU_adapt_dict, p_all_events)
+
+            # Ensure no NaNs
+            if np.isnan(EU_adapt[option, i]):
+                EU_adapt[option, i] = -np.inf
+
+        return EU_adapt
+
     @staticmethod
     def calcEU_adapt_vectorized(
         *,
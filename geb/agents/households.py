@@ -1,7 +1,9 @@
 import numpy as np
 import geopandas as gpd
 import calendar
-from .general import downscale_volume, AgentBaseClass
+from concurrent.futures import ThreadPoolExecutor
+from numba import njit
+from .general import downscale_volume_pair, AgentBaseClass
 from ..store import DynamicArray
 from ..hydrology.landcover import (
     SEALED,
@@ -12,29 +14,75 @@ from os.path import join
 from damagescanner.core import object_scanner
 import json
 import rioxarray
-from rasterio.features import shapes
-from shapely.geometry import shape
+import shapely
+
+
+@njit(cache=True)
+def extract_mask_runs(mask):
+    """Extracts contiguous True runs per scanline of a boolean raster mask.
+
+    Returns:
+        rows: Row index of each run.
+        col_start: First column of each run.
+        col_end: One past the last column of each run.
+    """
+    rows = []
+    col_start = []
+    col_end = []
+    for y in range(mask.shape[0]):
+        x = 0
+        while x < mask.shape[1]:
+            if mask[y, x]:
+                start = x
+                while x < mask.shape[1] and mask[y, x]:
+                    x += 1
+                rows.append(y)
+                col_start.append(start)
+                col_end.append(x)
+            else:
+                x += 1
+    return (
+        np.array(rows, dtype=np.int64),
+        np.array(col_start, dtype=np.int64),
+        np.array(col_end, dtype=np.int64),
+    )
 
 
 def from_landuse_raster_to_polygon(mask, transform, crs):
     """
-    Convert raster data into separate GeoDataFrames for specified land use values.
+    Convert a boolean land use raster into a GeoDataFrame of covering polygons.
+
+    The mask is decomposed into per-scanline pixel runs with a single numba
+    pass and the runs are turned into axis-aligned rectangles through
+    shapely's vectorized constructors, avoiding a Python-level loop that
+    builds one geometry per raster feature. The rectangles jointly cover
+    exactly the True cells of the mask.
 
     Parameters:
-    - landuse: An xarray DataArray or similar with land use data and 'x' and 'y' coordinates.
-    - values_to_extract: List of integer values to extract (e.g., [0, 1] for forest and agriculture).
+    - mask: Boolean 2D array of the pixels to polygonize.
+    - transform: Affine transform of the raster.
+    - crs: CRS of the raster.
 
     Returns:
     - Geodataframe
     """
+    assert transform.b == 0 and transform.d == 0, "Rotated rasters are not supported"
 
-    shapes_gen = shapes(mask.astype(np.uint8), mask=mask, transform=transform)
+    rows, col_start, col_end = extract_mask_runs(np.ascontiguousarray(mask))
 
-    polygons = []
-    for geom, _ in shapes_gen:
-        polygons.append(shape(geom))
+    x_left = transform.c + transform.a * col_start
+    x_right = transform.c + transform.a * col_end
+    y_top = transform.f + transform.e * rows
+    y_bottom = transform.f + transform.e * (rows + 1)
 
-    gdf = gpd.GeoDataFrame({"geometry": polygons}, crs=crs)
+    boxes = shapely.box(
+        np.minimum(x_left, x_right),
+        np.minimum(y_top, y_bottom),
+        np.maximum(x_left, x_right),
+        np.maximum(y_top, y_bottom),
+    )
+
+    gdf = gpd.GeoDataFrame({"geometry": boxes}, crs=crs)
 
     return gdf
 
@@ -47,9 +95,44 @@ class Households(AgentBaseClass):
         self.agents = agents
         self.reduncancy = reduncancy
 
+        # Cache for the static asset layers reprojected to a flood map CRS,
+        # so repeated flood() calls (e.g. multiple return periods) do not
+        # redo the same reprojections
+        self._assets_by_crs = {}
+        # Per-timestep cache for the polygonized land use layers, which
+        # follow the current land use and are therefore reset in step()
+        self._landuse_polygons = {}
+
         if self.model.spinup:
             self.spinup()
 
+    def assets_in_crs(self, crs):
+        """Gets the static asset layers reprojected to the given CRS.
+
+        Buildings, building centroids, roads and rail do not change during
+        a run, so their reprojections are cached per CRS. The land-use
+        derived layers (agriculture, forest) are not cached as they follow
+        the current land use.
+
+        Args:
+            crs: CRS of the flood map.
+
+        Returns:
+            assets: Dictionary with the reprojected buildings,
+                buildings_centroid, roads and rail GeoDataFrames.
+        """
+        key = str(crs)
+        assets = self._assets_by_crs.get(key)
+        if assets is None:
+            assets = {
+                "buildings": self.var.buildings.to_crs(crs),
+                "buildings_centroid": self.var.buildings_centroid.to_crs(crs),
+                "roads": self.var.roads.to_crs(crs),
+                "rail": self.var.rail.to_crs(crs),
+            }
+            self._assets_by_crs[key] = assets
+        return assets
+
     def spinup(self):
         self.var = self.model.store.create_bucket("agents.households.var")
 
@@ -72,163 +155,104 @@ class Households(AgentBaseClass):
         self.var.rail = gpd.read_file(self.model.files["geoms"]["assets/rails"])
         self.var.rail["object_type"] = "rail"
 
-        # Load maximum damages
-        with open(
-            self.model.files["dict"][
-                "damage_parameters/flood/buildings/structure/maximum_damage"
-            ],
-            "r",
-        ) as f:
-            self.var.max_dam_buildings_structure = float(json.load(f)["maximum_damage"])
+        road_types = [
+            "residential",
+            "unclassified",
+            "tertiary",
+            "primary",
+            "primary_link",
+            "secondary",
+            "secondary_link",
+            "motorway",
+            "motorway_link",
+            "trunk",
+            "trunk_link",
+        ]
+
+        # Load all maximum damages and vulnerability curves in one parallel
+        # batch, so the per-file filesystem round trips overlap instead of
+        # running as ~30 sequential reads
+        max_damage_keys = [
+            ("buildings_structure", "damage_parameters/flood/buildings/structure"),
+            ("buildings_content", "damage_parameters/flood/buildings/content"),
+            ("rail", "damage_parameters/flood/rail/main"),
+            ("forest", "damage_parameters/flood/land_use/forest"),
+            ("agriculture", "damage_parameters/flood/land_use/agriculture"),
+        ] + [
+            (road_type, f"damage_parameters/flood/road/{road_type}")
+            for road_type in road_types
+        ]
+
+        def load_maximum_damage(path):
+            with open(path, "r") as f:
+                return float(json.load(f)["maximum_damage"])
+
+        with ThreadPoolExecutor() as executor:
+            max_damage = dict(
+                zip(
+                    (name for name, _ in max_damage_keys),
+                    executor.map(
+                        load_maximum_damage,
+                        (
+                            self.model.files["dict"][f"{path}/maximum_damage"]
+                            for _, path in max_damage_keys
+                        ),
+                    ),
+                )
+            )
+            curves = dict(
+                zip(
+                    (name for name, _ in max_damage_keys),
+                    executor.map(
+                        pd.read_parquet,
+                        (
+                            self.model.files["table"][f"{path}/curve"]
+                            for _, path in max_damage_keys
+                        ),
+                    ),
+                )
+            )
+
+        self.var.max_dam_buildings_structure = max_damage["buildings_structure"]
         self.var.buildings["maximum_damage"] = self.var.max_dam_buildings_structure
 
-        with open(
-            self.model.files["dict"][
-                "damage_parameters/flood/buildings/content/maximum_damage"
-            ],
-            "r",
-        ) as f:
-            max_dam_buildings_content = json.load(f)
-        self.var.max_dam_buildings_content = float(
-            max_dam_buildings_content["maximum_damage"]
-        )
+        self.var.max_dam_buildings_content = max_damage["buildings_content"]
         self.var.buildings_centroid["maximum_damage"] = (
             self.var.max_dam_buildings_content
         )
 
-        with open(
-            self.model.files["dict"][
-                "damage_parameters/flood/rail/main/maximum_damage"
-            ],
-            "r",
-        ) as f:
-            self.var.max_dam_rail = float(json.load(f)["maximum_damage"])
+        self.var.max_dam_rail = max_damage["rail"]
         self.var.rail["maximum_damage"] = self.var.max_dam_rail
 
-        self.var.max_dam_road = {}
-        road_types = [
-            ("residential", "damage_parameters/flood/road/residential/maximum_damage"),
-            (
-                "unclassified",
-                "damage_parameters/flood/road/unclassified/maximum_damage",
-            ),
-            ("tertiary", "damage_parameters/flood/road/tertiary/maximum_damage"),
-            ("primary", "damage_parameters/flood/road/primary/maximum_damage"),
-            (
-                "primary_link",
-                "damage_parameters/flood/road/primary_link/maximum_damage",
-            ),
-            ("secondary", "damage_parameters/flood/road/secondary/maximum_damage"),
-            (
-                "secondary_link",
-                "damage_parameters/flood/road/secondary_link/maximum_damage",
-            ),
-            ("motorway", "damage_parameters/flood/road/motorway/maximum_damage"),
-            (
-                "motorway_link",
-                "damage_parameters/flood/road/motorway_link/maximum_damage",
-            ),
-            ("trunk", "damage_parameters/flood/road/trunk/maximum_damage"),
-            ("trunk_link", "damage_parameters/flood/road/trunk_link/maximum_damage"),
-        ]
-
-        for road_type, path in road_types:
-            with open(self.model.files["dict"][path], "r") as f:
-                max_damage = json.load(f)
-            self.var.max_dam_road[road_type] = max_damage["maximum_damage"]
-
+        self.var.max_dam_road = {
+            road_type: max_damage[road_type] for road_type in road_types
+        }
         self.var.roads["maximum_damage"] = self.var.roads["object_type"].map(
             self.var.max_dam_road
         )
 
-        with open(
-            self.model.files["dict"][
-                "damage_parameters/flood/land_use/forest/maximum_damage"
-            ],
-            "r",
-        ) as f:
-            self.var.max_dam_forest = float(json.load(f)["maximum_damage"])
-
-        with open(
-            self.model.files["dict"][
-                "damage_parameters/flood/land_use/agriculture/maximum_damage"
-            ],
-            "r",
-        ) as f:
-            self.var.max_dam_agriculture = float(json.load(f)["maximum_damage"])
-
-        # Load vulnerability curves
-        road_curves = []
-        road_types = [
-            ("residential", "damage_parameters/flood/road/residential/curve"),
-            ("unclassified", "damage_parameters/flood/road/unclassified/curve"),
-            ("tertiary", "damage_parameters/flood/road/tertiary/curve"),
-            ("primary", "damage_parameters/flood/road/primary/curve"),
-            ("primary_link", "damage_parameters/flood/road/primary_link/curve"),
-            ("secondary", "damage_parameters/flood/road/secondary/curve"),
-            ("secondary_link", "damage_parameters/flood/road/secondary_link/curve"),
-            ("motorway", "damage_parameters/flood/road/motorway/curve"),
-            ("motorway_link", "damage_parameters/flood/road/motorway_link/curve"),
-            ("trunk", "damage_parameters/flood/road/trunk/curve"),
-            ("trunk_link", "damage_parameters/flood/road/trunk_link/curve"),
-        ]
-
-        severity_column = None
-        for road_type, path in road_types:
-            df = pd.read_parquet(self.model.files["table"][path])
-
-            if severity_column is None:
-                severity_column = df["severity"]
-
-            df = df.rename(columns={"damage_ratio": road_type})
+        self.var.max_dam_forest = max_damage["forest"]
+        self.var.max_dam_agriculture = max_damage["agriculture"]
 
-            road_curves.append(df[[road_type]])
+        def object_curve(name, column):
+            return (
+                curves[name]
+                .set_index("severity")
+                .rename(columns={"damage_ratio": column})
+            )
 
-        self.var.road_curves = pd.concat([severity_column] + road_curves, axis=1)
-        self.var.road_curves.set_index("severity", inplace=True)
-
-        self.var.forest_curve = pd.read_parquet(
-            self.model.files["table"]["damage_parameters/flood/land_use/forest/curve"]
-        )
-        self.var.forest_curve.set_index("severity", inplace=True)
-        self.var.forest_curve = self.var.forest_curve.rename(
-            columns={"damage_ratio": "forest"}
-        )
-        self.var.agriculture_curve = pd.read_parquet(
-            self.model.files["table"][
-                "damage_parameters/flood/land_use/agriculture/curve"
-            ]
-        )
-        self.var.agriculture_curve.set_index("severity", inplace=True)
-        self.var.agriculture_curve = self.var.agriculture_curve.rename(
-            columns={"damage_ratio": "agriculture"}
-        )
-
-        self.var.buildings_structure_curve = pd.read_parquet(
-            self.model.files["table"][
-                "damage_parameters/flood/buildings/structure/curve"
-            ]
-        )
-        self.var.buildings_structure_curve.set_index("severity", inplace=True)
-        self.var.buildings_structure_curve = self.var.buildings_structure_curve.rename(
-            columns={"damage_ratio": "building_structure"}
-        )
-
-        self.var.buildings_content_curve = pd.read_parquet(
-            self.model.files["table"]["damage_parameters/flood/buildings/content/curve"]
-        )
-        self.var.buildings_content_curve.set_index("severity", inplace=True)
-        self.var.buildings_content_curve = self.var.buildings_content_curve.rename(
-            columns={"damage_ratio": "building_content"}
+        self.var.road_curves = pd.concat(
+            [object_curve(road_type, road_type) for road_type in road_types], axis=1
         )
-
-        self.var.rail_curve = pd.read_parquet(
-            self.model.files["table"]["damage_parameters/flood/rail/main/curve"]
+        self.var.forest_curve = object_curve("forest", "forest")
+        self.var.agriculture_curve = object_curve("agriculture", "agriculture")
+        self.var.buildings_structure_curve = object_curve(
+            "buildings_structure", "building_structure"
         )
-        self.var.rail_curve.set_index("severity", inplace=True)
-        self.var.rail_curve = self.var.rail_curve.rename(
-            columns={"damage_ratio": "rail"}
+        self.var.buildings_content_curve = object_curve(
+            "buildings_content", "building_content"
         )
+        self.var.rail_curve = object_curve("rail", "rail")
 
         super().__init__()
 
@@ -246,6 +270,38 @@ class Households(AgentBaseClass):
         sizes = np.load(self.model.files["binary"]["agents/households/sizes"])["data"]
         self.var.sizes = DynamicArray(sizes, max_n=self.max_n)
 
+    def landuse_polygons(self, object_type, mask, maximum_damage, crs):
+        """Gets a polygonized land use layer in the given CRS.
+
+        Polygonizing and reprojecting a land use mask is expensive, while
+        flood() is typically called several times per event (one call per
+        return period) against an unchanged land use. The layers are
+        therefore cached per object type and CRS and the cache is cleared
+        every timestep, when the land use may change.
+
+        Args:
+            object_type: Object type the damage scanner should use.
+            mask: Boolean mask of the land use class on the decompressed HRU grid.
+            maximum_damage: Maximum damage per m2 for this land use class.
+            crs: CRS of the flood map.
+
+        Returns:
+            landuse: GeoDataFrame of the polygonized land use class.
+        """
+        key = (object_type, str(crs))
+        landuse = self._landuse_polygons.get(key)
+        if landuse is None:
+            landuse = from_landuse_raster_to_polygon(
+                mask,
+                self.model.data.HRU.transform,
+                self.model.crs,
+            )
+            landuse["object_type"] = object_type
+            landuse["maximum_damage"] = maximum_damage
+            landuse = landuse.to_crs(crs)
+            self._landuse_polygons[key] = landuse
+        return landuse
+
     def flood(self, flood_map, simulation_root, return_period=None):
         if return_period is not None:
             flood_path = join(simulation_root, f"hmax RP {int(return_period)}.tif")
@@ -253,17 +309,17 @@ class Households(AgentBaseClass):
             flood_path = join(simulation_root, "hmax.tif")
 
         print(f"using this flood map: {flood_path}")
-        flood_map = rioxarray.open_rasterio(flood_path)
+        # Load the flood map into memory up front: it is sampled by six
+        # object_scanner passes below, which would otherwise each re-decode
+        # blocks of the GeoTIFF through the lazy rasterio backend
+        flood_map = rioxarray.open_rasterio(flood_path).load()
 
-        agriculture = from_landuse_raster_to_polygon(
+        agriculture = self.landuse_polygons(
+            "agriculture",
             self.model.data.HRU.decompress(self.model.data.HRU.var.land_owners != -1),
-            self.model.data.HRU.transform,
-            self.model.crs,
+            self.var.max_dam_agriculture,
+            flood_map.rio.crs,
         )
-        agriculture["object_type"] = "agriculture"
-        agriculture["maximum_damage"] = self.var.max_dam_agriculture
-
-        agriculture = agriculture.to_crs(flood_map.rio.crs)
 
         damages_agriculture = object_scanner(
             objects=agriculture,
@@ -274,17 +330,14 @@ class Households(AgentBaseClass):
         print(f"damages to agriculture are: {total_damages_agriculture}")
 
         # Load landuse and make turn into polygons
-        forest = from_landuse_raster_to_polygon(
+        forest = self.landuse_polygons(
+            "forest",
             self.model.data.HRU.decompress(
                 self.model.data.HRU.var.land_use_type == FOREST
             ),
-            self.model.data.HRU.transform,
-            self.model.crs,
+            self.var.max_dam_forest,
+            flood_map.rio.crs,
         )
-        forest["object_type"] = "forest"
-        forest["maximum_damage"] = self.var.max_dam_forest
-
-        forest = forest.to_crs(flood_map.rio.crs)
 
         damages_forest = object_scanner(
             objects=forest, hazard=flood_map, curves=self.var.forest_curve
@@ -292,36 +345,34 @@ class Households(AgentBaseClass):
         total_damages_forest = damages_forest.sum()
         print(f"damages to forest are: {total_damages_forest}")
 
-        buildings = self.var.buildings.to_crs(flood_map.rio.crs)
+        assets = self.assets_in_crs(flood_map.rio.crs)
+
         damages_buildings_structure = object_scanner(
-            objects=buildings,
+            objects=assets["buildings"],
             hazard=flood_map,
             curves=self.var.buildings_structure_curve,
         )
         total_damage_structure = damages_buildings_structure.sum()
         print(f"damages to building structure are: {total_damage_structure}")
 
-        buildings_centroid = self.var.buildings_centroid.to_crs(flood_map.rio.crs)
         damages_buildings_content = object_scanner(
-            objects=buildings_centroid,
+            objects=assets["buildings_centroid"],
             hazard=flood_map,
             curves=self.var.buildings_content_curve,
         )
         total_damages_content = damages_buildings_content.sum()
         print(f"damages to building content are: {total_damages_content}")
 
-        roads = self.var.roads.to_crs(flood_map.rio.crs)
         damages_roads = object_scanner(
-            objects=roads,
+            objects=assets["roads"],
             hazard=flood_map,
             curves=self.var.road_curves,
         )
         total_damages_roads = damages_roads.sum()
         print(f"damages to roads are: {total_damages_roads} ")
 
-        rail = self.var.rail.to_crs(flood_map.rio.crs)
         damages_rail = object_scanner(
-            objects=rail,
+            objects=assets["rail"],
             hazard=flood_map,
             curves=self.var.rail_curve,
         )
@@ -360,16 +411,6 @@ class Households(AgentBaseClass):
             shape=self.model.data.grid.shape,
             transform=self.model.data.grid.transform,
         )
-        water_demand = downscale_volume(
-            water_demand.rio.transform().to_gdal(),
-            self.model.data.grid.gt,
-            water_demand.values,
-            self.model.data.grid.mask,
-            self.model.data.grid_to_HRU_uncompressed,
-            downscale_mask,
-            self.model.data.HRU.var.land_use_ratio,
-        )
-        water_demand = self.model.data.HRU.M3toM(water_demand)
 
         water_consumption = (
             self.model.domestic_water_consumption_ds.sel(
@@ -383,21 +424,27 @@ class Households(AgentBaseClass):
             shape=self.model.data.grid.shape,
             transform=self.model.data.grid.transform,
         )
-        water_consumption = downscale_volume(
-            water_consumption.rio.transform().to_gdal(),
+
+        # Both rasters live on the same reprojected grid, so they are
+        # downscaled together in one pass over the grid-to-HRU mapping
+        assert water_demand.rio.transform() == water_consumption.rio.transform()
+        water_demand, water_consumption = downscale_volume_pair(
+            water_demand.rio.transform().to_gdal(),
             self.model.data.grid.gt,
+            water_demand.values,
             water_consumption.values,
             self.model.data.grid.mask,
             self.model.data.grid_to_HRU_uncompressed,
             downscale_mask,
             self.model.data.HRU.var.land_use_ratio,
         )
+        water_demand = self.model.data.HRU.M3toM(water_demand)
         water_consumption = self.model.data.HRU.M3toM(water_consumption)
 
         efficiency = np.divide(
             water_consumption,
             water_demand,
-            out=np.zeros_like(water_consumption, dtype=float),
+            out=np.zeros_like(water_consumption, dtype=np.float32),
             where=water_demand != 0,
         )
 
@@ -412,6 +459,7 @@ class Households(AgentBaseClass):
         if (
             np.datetime64(self.model.current_time, "ns")
             in self.model.domestic_water_consumption_ds.time
+            and self.var.last_water_demand_update != self.model.current_time
         ):
             water_demand, efficiency = self.update_water_demand()
             self.var.current_water_demand = water_demand
@@ -426,6 +474,9 @@ class Households(AgentBaseClass):
         return self.var.current_water_demand, self.var.current_efficiency
 
     def step(self) -> None:
+        # The land use may change from one timestep to the next, so the
+        # polygonized land use layers cannot be kept across timesteps
+        self._landuse_polygons.clear()
         return None
 
     @property
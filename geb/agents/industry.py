@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 import calendar
 import numpy as np
-from .general import downscale_volume, AgentBaseClass
+from .general import downscale_volume_pair, AgentBaseClass
 from ..hydrology.landcover import SEALED
 
 
@@ -51,16 +51,6 @@ class Industry(AgentBaseClass):
             shape=self.model.data.grid.shape,
             transform=self.model.data.grid.transform,
         )
-        water_demand = downscale_volume(
-            water_demand.rio.transform().to_gdal(),
-            self.model.data.grid.gt,
-            water_demand.values,
-            self.model.data.grid.mask,
-            self.model.data.grid_to_HRU_uncompressed,
-            downscale_mask,
-            self.HRU.var.land_use_ratio,
-        )
-        water_demand = self.HRU.M3toM(water_demand)
 
         water_consumption = (
             self.model.industry_water_consumption_ds.sel(
@@ -74,22 +64,27 @@ class Industry(AgentBaseClass):
             shape=self.model.data.grid.shape,
             transform=self.model.data.grid.transform,
         )
-        water_consumption = downscale_volume(
-            water_consumption.rio.transform().to_gdal(),
+
+        # Both rasters live on the same reprojected grid, so they are
+        # downscaled together in one pass over the grid-to-HRU mapping
+        assert water_demand.rio.transform() == water_consumption.rio.transform()
+        water_demand, water_consumption = downscale_volume_pair(
+            water_demand.rio.transform().to_gdal(),
             self.model.data.grid.gt,
+            water_demand.values,
             water_consumption.values,
             self.model.data.grid.mask,
             self.model.data.grid_to_HRU_uncompressed,
             downscale_mask,
             self.HRU.var.land_use_ratio,
         )
-
+        water_demand = self.HRU.M3toM(water_demand)
         water_consumption = self.HRU.M3toM(water_consumption)
 
         efficiency = np.divide(
             water_consumption,
             water_demand,
-            out=np.zeros_like(water_consumption, dtype=float),
+            out=np.zeros_like(water_consumption, dtype=np.float32),
             where=water_demand != 0,
         )
 
@@ -104,6 +99,7 @@ class Industry(AgentBaseClass):
         if (
             np.datetime64(self.model.current_time, "ns")
             in self.model.industry_water_consumption_ds.time
+            and self.var.last_water_demand_update != self.model.current_time
         ):
             water_demand, efficiency = self.update_water_demand()
             self.var.current_water_demand = water_demand
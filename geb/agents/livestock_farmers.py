@@ -83,6 +83,7 @@ class LiveStockFarmers(AgentBaseClass):
         if (
             np.datetime64(self.model.current_time, "ns")
             in self.model.livestock_water_consumption_ds.time
+            and self.var.last_water_demand_update != self.model.current_time
         ):
             water_demand, efficiency = self.update_water_demand()
             self.var.current_water_demand = water_demand
@@ -60,8 +60,9 @@ def get_observed_well_ratio(config):
 
 	region_mask = gpd.read_file(os.path.join(config['general']['input_folder'], 'areamaps', 'region.geojson')).to_crs(3857)
 	assert len(region_mask) == 1
-	# get overlapping areas of observed_irrigation_sources and region_mask
-	observed_irrigation_sources['area_in_region_mask'] = (gpd.overlay(observed_irrigation_sources, region_mask, how='intersection').area / observed_irrigation_sources.area.values).values
+	# get overlapping areas of observed_irrigation_sources and region_mask; the mask is
+	# a single polygon, so a vectorized intersection replaces the pairwise overlay
+	observed_irrigation_sources['area_in_region_mask'] = (observed_irrigation_sources.geometry.intersection(region_mask.geometry.iloc[0]).area / observed_irrigation_sources.area).values
 
 	# ANALYSIS_THRESHOLD = 0.5
 
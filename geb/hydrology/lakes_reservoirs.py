@@ -406,9 +406,7 @@ class LakesReservoirs(object):
         Dynamic part set lakes and reservoirs for each year
         """
         # if first timestep, or beginning of new year
-        if self.model.current_timestep == 1 or (
-            self.model.current_time.month == 1 and self.model.current_time.day == 1
-        ):
+        if self.model.current_timestep == 1 or self.model.is_new_year:
             # - 3 = reservoirs and lakes (used as reservoirs but before the year of construction as lakes
             # - 2 = reservoirs (regulated discharge)
             # - 1 = lakes (weirFormula)
@@ -260,6 +260,15 @@ class GEBModel(HazardDriver, ABM, Hydrology):
         """
         return self.current_time.timetuple().tm_yday
 
+    @property
+    def is_new_year(self) -> bool:
+        """Gets whether the current timestep is the first day of a year.
+
+        Returns:
+            is_new_year: True on January 1st, False otherwise.
+        """
+        return self.current_time.month == 1 and self.current_time.day == 1
+
     @property
     def simulation_root(self) -> Path:
         """Gets the simulation root.
@@ -4042,6 +4042,18 @@ class GEBModel(GridModel):
         regions_grid = self.region_subgrid["areamaps/region_subgrid"].compute()
         cell_area = self.region_subgrid["areamaps/region_cell_area_subgrid"].compute()
 
+        # cultivated cell counts and areas for all regions in one pass over
+        # the subgrid instead of one masked scan per region
+        cultivated_region_ids = regions_grid.values[cultivated_land.values]
+        cultivated_cell_areas = cell_area.values[cultivated_land.values]
+        region_ids_present, cultivated_region_index = np.unique(
+            cultivated_region_ids, return_inverse=True
+        )
+        cultivated_cells_by_region = np.bincount(cultivated_region_index)
+        cultivated_area_by_region = np.bincount(
+            cultivated_region_index, weights=cultivated_cell_areas
+        )
+
         regions_shapes = self.geoms["areamaps/regions"]
         if data_source == "lowder":
             assert country_iso3_column in regions_shapes.columns, (
@@ -4098,23 +4110,21 @@ class GEBModel(GridModel):
 
             self.logger.debug(f"Processing region {UID}")
 
-            cultivated_land_region_total_cells = (
-                ((regions_grid == UID) & (cultivated_land)).sum().compute()
-            )
-            total_cultivated_land_area_lu = (
-                (((regions_grid == UID) & (cultivated_land)) * cell_area)
-                .sum()
-                .compute()
-            )
+            region_index = np.searchsorted(region_ids_present, UID)
             if (
-                total_cultivated_land_area_lu == 0
+                region_index == region_ids_present.size
+                or region_ids_present[region_index] != UID
             ):  # when no agricultural area, just continue as there will be no farmers. Also avoiding some division by 0 errors.
                 continue
 
+            cultivated_land_region_total_cells = cultivated_cells_by_region[
+                region_index
+            ].item()
+            total_cultivated_land_area_lu = cultivated_area_by_region[
+                region_index
+            ].item()
             average_cell_area_region = (
-                cell_area.where(((regions_grid == UID) & (cultivated_land)))
-                .mean()
-                .compute()
+                total_cultivated_land_area_lu / cultivated_land_region_total_cells
             )
 
             if data_source == "lowder":
@@ -4261,7 +4271,7 @@ class GEBModel(GridModel):
                 )
             )
             n_cells_to_add = sorted(index, key=lambda x: x[1], reverse=True)[
-                : n_missing_cells.compute().item()
+                :n_missing_cells
             ]
             whole_cells_per_size_class.loc[[p[0] for p in n_cells_to_add]] += 1
 
@@ -1,4 +1,5 @@
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from operator import attrgetter
 import json
 from datetime import datetime
@@ -7,9 +8,16 @@ import geopandas as gpd
 
 import numpy as np
 
+# shared by all arrays without extra dimensions, so that creating many
+# small DynamicArrays does not allocate an empty names array each time
+EMPTY_EXTRA_DIMS_NAMES = np.array([], dtype=str)
+
 
 class DynamicArray:
-    __slots__ = ["_data", "_n", "_extra_dims_names"]
+    __slots__ = ["_data", "_n", "_extra_dims_names", "_view"]
+
+    # _view is a derived cache of _data[:_n] and is not saved to disk
+    _serialized_slots = ("_data", "_n", "_extra_dims_names")
 
     def __init__(
         self,
@@ -20,8 +28,12 @@ class DynamicArray:
         extra_dims_names=[],
         dtype=None,
         fill_value=None,
+        order="C",
     ):
-        self.extra_dims_names = np.array(extra_dims_names, dtype=str)
+        if len(extra_dims_names):
+            self.extra_dims_names = np.asarray(extra_dims_names, dtype=str)
+        else:
+            self.extra_dims_names = EMPTY_EXTRA_DIMS_NAMES
 
         if input_array is None and dtype is None:
             raise ValueError("Either input_array or dtype must be given")
@@ -61,19 +73,24 @@ class DynamicArray:
                 assert self.extra_dims_names is not None
                 assert len(extra_dims) == len(self.extra_dims_names)
 
+            # order='F' makes extra-dimension column slices (data[:, i])
+            # contiguous, which pays off when reductions over the agent
+            # axis are the hot loops
             if fill_value is not None:
-                self._data = np.full(shape, fill_value, dtype=dtype)
+                self._data = np.full(shape, fill_value, dtype=dtype, order=order)
             else:
-                self._data = np.empty(shape, dtype=dtype)
+                self._data = np.empty(shape, dtype=dtype, order=order)
             self._n = n
 
+        self._view = self._data[: self._n]
+
     @property
     def data(self):
-        return self._data[: self.n]
+        return self._view
 
     @data.setter
     def data(self, value):
-        self._data[: self.n] = value
+        self._view[...] = value
 
     @property
     def max_n(self):
@@ -96,20 +113,21 @@ class DynamicArray:
         if value > self.max_n:
             raise ValueError("n cannot exceed max_n")
         self._n = value
+        self._view = self._data[:value]
 
     def __array_finalize__(self, obj):
         if obj is None:
             return
 
     def __array__(self, dtype=None):
-        return np.asarray(self._data[: self.n], dtype=dtype)
+        return np.asarray(self._view, dtype=dtype)
 
     def __array_interface__(self):
         return self._data.__array_interface__()
 
     def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
         modified_inputs = tuple(
-            input_.data if isinstance(input_, DynamicArray) else input_
+            input_._view if isinstance(input_, DynamicArray) else input_
             for input_ in inputs
         )
         result = self._data.__array_ufunc__(ufunc, method, *modified_inputs, **kwargs)
@@ -120,191 +138,200 @@ class DynamicArray:
         else:
             return self.__class__(result, max_n=self._data.shape[0])
 
+    # types tuple passed to ndarray.__array_function__; a constant, since
+    # the arguments are always unwrapped to plain ndarrays first
+    _ndarray_types = (np.ndarray,)
+
     def __array_function__(self, func, types, args, kwargs):
-        # Explicitly call __array_function__ of the underlying NumPy array
         modified_args = tuple(
-            arg.data if isinstance(arg, DynamicArray) else arg for arg in args
-        )
-        modified_types = tuple(
-            type(arg.data) if isinstance(arg, DynamicArray) else type(arg)
-            for arg in args
+            arg._view if isinstance(arg, DynamicArray) else arg for arg in args
         )
         return self._data.__array_function__(
-            func, modified_types, modified_args, kwargs
+            func, self._ndarray_types, modified_args, kwargs
         )
 
     def __setitem__(self, key, value):
-        self.data.__setitem__(key, value)
+        self._view.__setitem__(key, value)
 
     def __getitem__(self, key):
-        return self.data.__getitem__(key)
+        return self._view.__getitem__(key)
 
     def __repr__(self):
-        return "DynamicArray(" + self.data.__str__() + ")"
+        return "DynamicArray(" + self._view.__str__() + ")"
 
     def __str__(self):
-        return self.data.__str__()
+        return self._view.__str__()
 
     def __len__(self):
         return self._n
 
     def __getattr__(self, name):
-        if name in (
-            "_data",
-            "data",
-            "_n",
-            "n",
-            "_extra_dims_names",
-            "extra_dims_names",
-        ):
-            return super().__getattr__(name)
-        else:
-            return getattr(self.data, name)
-
-    def __setattr__(self, name, value):
-        if name in (
-            "_data",
-            "data",
-            "_n",
-            "n",
-            "_extra_dims_names",
-            "extra_dims_names",
-        ):
-            super().__setattr__(name, value)
-        else:
-            setattr(self.data, name, value)
+        # Only called when normal attribute lookup fails: forwards ndarray
+        # attributes and methods (.sum, .reshape, .dtype, ...) to the
+        # active view. Slot names are never forwarded, so a missing slot
+        # (e.g. during unpickling) raises instead of recursing.
+        if name in DynamicArray.__slots__:
+            raise AttributeError(name)
+        return getattr(self._view, name)
 
     def __getstate__(self):
-        return self.data.__getstate__()
+        return self._view.__getstate__()
 
     def __setstate__(self, state):
-        self.data.__setstate__(state)
+        self._view.__setstate__(state)
 
     def __sizeof__(self):
-        return self.data.__sizeof__()
-
-    def _perform_operation(self, other, operation: str, inplace: bool = False):
-        if isinstance(other, DynamicArray):
-            other = other._data[: other._n]
-        fn = getattr(self.data, operation)
-        if other is None:
-            args = ()
+        return self._view.__sizeof__()
+
+    def _wrap_result(self, result):
+        # Fast path for wrapping operation results: keeps the reserve
+        # capacity (max_n) of this array, but skips the argument
+        # validation in __init__.
+        max_n = self._data.shape[0]
+        if result.ndim == 1:
+            shape = max_n
         else:
-            args = (other,)
-        result = fn(*args)
+            shape = (max_n, *result.shape[1:])
+        data = np.empty_like(result, shape=shape)
+        data[: result.shape[0]] = result
+        new = self.__class__.__new__(self.__class__)
+        new._data = data
+        new._n = result.shape[0]
+        new._extra_dims_names = self._extra_dims_names
+        new._view = data[: new._n]
+        return new
+
+    def _perform_operation(
+        self, ufunc, other=None, reflected: bool = False, inplace: bool = False
+    ):
+        data = self._view
+        if isinstance(other, DynamicArray):
+            other = other._view
         if inplace:
-            self.data = result
+            # writing through out= avoids a temporary; unsafe casting
+            # reproduces the cast an assignment into the buffer would do
+            # (e.g. /= on an integer array keeps truncating)
+            ufunc(data, other, out=data, casting="unsafe")
             return self
+        if other is None:
+            result = ufunc(data)
+        elif reflected:
+            result = ufunc(other, data)
         else:
-            return self.__class__(result, max_n=self._data.shape[0])
+            result = ufunc(data, other)
+        return self._wrap_result(result)
 
     def __add__(self, other):
-        return self._perform_operation(other, "__add__")
+        return self._perform_operation(np.add, other)
 
     def __radd__(self, other):
-        return self._perform_operation(other, "__radd__")
+        return self._perform_operation(np.add, other, reflected=True)
 
     def __iadd__(self, other):
-        return self._perform_operation(other, "__add__", inplace=True)
+        return self._perform_operation(np.add, other, inplace=True)
 
     def __sub__(self, other):
-        return self._perform_operation(other, "__sub__")
+        return self._perform_operation(np.subtract, other)
 
     def __rsub__(self, other):
-        return self._perform_operation(other, "__rsub__")
+        return self._perform_operation(np.subtract, other, reflected=True)
 
     def __isub__(self, other):
-        return self._perform_operation(other, "__sub__", inplace=True)
+        return self._perform_operation(np.subtract, other, inplace=True)
 
     def __mul__(self, other):
-        return self._perform_operation(other, "__mul__")
+        return self._perform_operation(np.multiply, other)
 
     def __rmul__(self, other):
-        return self._perform_operation(other, "__rmul__")
+        return self._perform_operation(np.multiply, other, reflected=True)
 
     def __imul__(self, other):
-        return self._perform_operation(other, "__mul__", inplace=True)
+        return self._perform_operation(np.multiply, other, inplace=True)
 
     def __truediv__(self, other):
-        return self._perform_operation(other, "__truediv__")
+        return self._perform_operation(np.true_divide, other)
 
     def __rtruediv__(self, other):
-        return self._perform_operation(other, "__rtruediv__")
+        return self._perform_operation(np.true_divide, other, reflected=True)
 
     def __itruediv__(self, other):
-        return self._perform_operation(other, "__truediv__", inplace=True)
+        return self._perform_operation(np.true_divide, other, inplace=True)
 
     def __floordiv__(self, other):
-        return self._perform_operation(other, "__floordiv__")
+        return self._perform_operation(np.floor_divide, other)
 
     def __rfloordiv__(self, other):
-        return self._perform_operation(other, "__rfloordiv__")
+        return self._perform_operation(np.floor_divide, other, reflected=True)
 
     def __ifloordiv__(self, other):
-        return self._perform_operation(other, "__floordiv__", inplace=True)
+        return self._perform_operation(np.floor_divide, other, inplace=True)
 
     def __mod__(self, other):
-        return self._perform_operation(other, "__mod__")
+        return self._perform_operation(np.mod, other)
 
     def __rmod__(self, other):
-        return self._perform_operation(other, "__rmod__")
+        return self._perform_operation(np.mod, other, reflected=True)
 
     def __imod__(self, other):
-        return self._perform_operation(other, "__mod__", inplace=True)
+        return self._perform_operation(np.mod, other, inplace=True)
 
     def __pow__(self, other):
-        return self._perform_operation(other, "__pow__")
+        return self._perform_operation(np.power, other)
 
     def __rpow__(self, other):
-        return self._perform_operation(other, "__rpow__")
+        return self._perform_operation(np.power, other, reflected=True)
 
     def __ipow__(self, other):
-        return self._perform_operation(other, "__pow__", inplace=True)
+        return self._perform_operation(np.power, other, inplace=True)
 
-    def _compare(self, value: object, operation: str) -> bool:
+    def _compare(self, value: object, ufunc) -> bool:
+        # Comparison results are transient masks that feed straight into
+        # boolean indexing; returning them unwrapped avoids allocating a
+        # max_n-sized DynamicArray per comparison
         if isinstance(value, DynamicArray):
-            return self.__class__(
-                getattr(self.data, operation)(value.data), max_n=self._data.shape[0]
-            )
-        return getattr(self.data, operation)(value)
+            value = value._view
+        return ufunc(self._view, value)
 
     def __eq__(self, value: object) -> bool:
-        return self._compare(value, "__eq__")
+        return self._compare(value, np.equal)
 
     def __ne__(self, value: object) -> bool:
-        return self._compare(value, "__ne__")
+        return self._compare(value, np.not_equal)
 
     def __gt__(self, value: object) -> bool:
-        return self._compare(value, "__gt__")
+        return self._compare(value, np.greater)
 
     def __ge__(self, value: object) -> bool:
-        return self._compare(value, "__ge__")
+        return self._compare(value, np.greater_equal)
 
     def __lt__(self, value: object) -> bool:
-        return self._compare(value, "__lt__")
+        return self._compare(value, np.less)
 
     def __le__(self, value: object) -> bool:
-        return self._compare(value, "__le__")
+        return self._compare(value, np.less_equal)
 
     def __and__(self, other):
-        return self._perform_operation(other, "__and__")
+        return self._perform_operation(np.bitwise_and, other)
 
     def __or__(self, other):
-        return self._perform_operation(other, "__or__")
+        return self._perform_operation(np.bitwise_or, other)
 
     def __neg__(self):
-        return self._perform_operation(None, "__neg__")
+        return self._perform_operation(np.negative)
 
     def __pos__(self):
-        return self._perform_operation(None, "__pos__")
+        return self._perform_operation(np.positive)
 
     def __invert__(self):
-        return self._perform_operation(None, "__invert__")
+        return self._perform_operation(np.invert)
 
     def save(self, path):
-        np.savez_compressed(
+        # Uncompressed on purpose: checkpoints are written every spinup and
+        # DEFLATE is single-threaded, so compression would dominate the
+        # save/load time for large agent arrays.
+        np.savez(
             path.with_suffix(".storearray.npz"),
-            **{slot: getattr(self, slot) for slot in self.__slots__},
+            **{slot: getattr(self, slot) for slot in self._serialized_slots},
         )
 
     @classmethod
@@ -312,8 +339,9 @@ class DynamicArray:
         assert path.suffixes == [".storearray", ".npz"]
         with np.load(path) as data:
             obj = cls.__new__(cls)
-            for slot in cls.__slots__:
+            for slot in cls._serialized_slots:
                 setattr(obj, slot, data[slot])
+            obj._view = obj._data[: obj._n]
             return obj
 
 
@@ -321,21 +349,59 @@ class Bucket:
     def __init__(self):
         pass
 
+    def allocate_columns(self, names, n, max_n, dtype=np.float32, fill_value=None):
+        """Allocates several same-dtype agent attributes in one block.
+
+        Each name becomes a regular DynamicArray attribute of the bucket,
+        but all of them share a single Fortran-ordered (max_n, K) backing
+        buffer, so attributes that are updated together stay close in
+        memory. Saving still serializes each attribute separately (the
+        columns are copied on save), so the fused layout is an in-memory
+        optimization only and restored arrays are independent.
+
+        Args:
+            names: Attribute names, one per column.
+            n: Initial number of agents.
+            max_n: Maximum number of agents.
+            dtype: Shared dtype of all columns.
+            fill_value: Optional value to initialize the block with.
+
+        Returns:
+            The created DynamicArrays, in the order of names.
+        """
+        block = np.empty((max_n, len(names)), dtype=dtype, order="F")
+        if fill_value is not None:
+            block[:] = fill_value
+        arrays = []
+        for i, name in enumerate(names):
+            array = DynamicArray.__new__(DynamicArray)
+            array._data = block[:, i]
+            array._n = n
+            array._extra_dims_names = EMPTY_EXTRA_DIMS_NAMES
+            array._view = array._data[:n]
+            setattr(self, name, array)
+            arrays.append(array)
+        return arrays
+
+    _allowed_value_types = (
+        DynamicArray,
+        int,
+        float,
+        np.ndarray,
+        list,
+        gpd.GeoDataFrame,
+        pd.DataFrame,
+        str,
+        dict,
+        datetime,
+    )
+    # exact-type lookups short-circuit the isinstance walk for the
+    # overwhelmingly common case of an exact type match
+    _exact_value_types = frozenset(_allowed_value_types)
+
     def __setattr__(self, name, value):
-        assert isinstance(
-            value,
-            (
-                DynamicArray,
-                int,
-                float,
-                np.ndarray,
-                list,
-                gpd.GeoDataFrame,
-                pd.DataFrame,
-                str,
-                dict,
-                datetime,
-            ),
+        assert type(value) in Bucket._exact_value_types or isinstance(
+            value, Bucket._allowed_value_types
         )
         super().__setattr__(name, value)
 
@@ -345,9 +411,7 @@ class Bucket:
             if isinstance(value, DynamicArray):
                 value.save(path / name)
             elif isinstance(value, np.ndarray):
-                np.savez_compressed(
-                    (path / name).with_suffix(".array.npz"), value=value
-                )
+                np.savez((path / name).with_suffix(".array.npz"), value=value)
             elif isinstance(value, gpd.GeoDataFrame):
                 value.to_parquet((path / name).with_suffix(".geoparquet"))
             elif isinstance(value, pd.DataFrame):
@@ -436,16 +500,26 @@ class Store:
             path = self.path
 
         shutil.rmtree(path, ignore_errors=True)
-        for name, bucket in self.buckets.items():
-            bucket.save(path / name)
+        path.mkdir(parents=True, exist_ok=True)
+        # buckets write to separate folders, so their file writes can
+        # overlap in a thread pool
+        with ThreadPoolExecutor() as executor:
+            list(
+                executor.map(
+                    lambda item: item[1].save(path / item[0]), self.buckets.items()
+                )
+            )
 
     def load(self, path=None):
         if path is None:
             path = self.path
 
-        for bucket_folder in path.iterdir():
-            bucket = Bucket().load(bucket_folder)
+        bucket_folders = list(path.iterdir())
+        with ThreadPoolExecutor() as executor:
+            buckets = list(executor.map(lambda f: Bucket().load(f), bucket_folders))
 
+        # attach the buckets to the model on the main thread
+        for bucket_folder, bucket in zip(bucket_folders, buckets):
             self.buckets[bucket_folder.name] = bucket
 
             split_name = bucket_folder.name.split(".")
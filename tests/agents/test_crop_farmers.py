@@ -7,9 +7,11 @@ from geb.agents.crop_farmers import (
     withdraw_channel,
     withdraw_reservoir,
     advance_crop_rotation_year,
+    gev_sf,
 )
 
 import numpy as np
+from scipy.stats import genextreme
 
 
 def test_cumulative_mean():
@@ -437,3 +439,20 @@ def test_advance_crop_rotation_year():
     assert np.array_equal(
         current_crop_calendar_rotation_year_index, np.array([0, 0, 1, 0, 1])
     )
+
+
+def test_gev_sf():
+    rng = np.random.default_rng(42)
+    x = rng.normal(size=100).astype(np.float32)
+    shape = rng.uniform(-0.5, 0.5, 100).astype(np.float32)
+    loc = rng.normal(size=100).astype(np.float32)
+    scale = rng.uniform(0.5, 2.0, 100).astype(np.float32)
+
+    # near-zero shape must follow the Gumbel limit
+    shape[:10] = 0.0
+
+    np.testing.assert_allclose(
+        gev_sf(x, shape, loc, scale),
+        genextreme.sf(x, shape, loc, scale),
+        atol=1e-6,
+    )
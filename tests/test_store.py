@@ -2,7 +2,7 @@ import pytest
 import os
 import numpy as np
 
-from geb.store import DynamicArray
+from geb.store import Bucket, DynamicArray
 from .testconfig import tmp_folder
 
 
@@ -253,6 +253,32 @@ def test_reduce_ufunc(array):
     assert result == 15
 
 
+def test_allocate_columns():
+    bucket = Bucket()
+    a, b = bucket.allocate_columns(
+        ["a", "b"], n=3, max_n=10, dtype=np.float32, fill_value=0
+    )
+    assert bucket.a is a
+    assert a.n == 3
+    assert a.max_n == 10
+    assert a.dtype == np.float32
+
+    # the columns share one backing block but do not alias each other
+    assert np.shares_memory(a._data, b._data) is False
+    assert np.shares_memory(a._data.base, b._data.base)
+    a[:] = 1
+    np.testing.assert_array_equal(b.data, np.zeros(3, dtype=np.float32))
+
+    # columns behave as regular DynamicArrays
+    a.n = 4
+    a[3] = 5
+    np.testing.assert_array_equal(a.data, np.array([1, 1, 1, 5], dtype=np.float32))
+    result = a + 1
+    np.testing.assert_array_equal(
+        result.data, np.array([2, 2, 2, 6], dtype=np.float32)
+    )
+
+
 def test_save_and_restore(array):
     array.save(tmp_folder / "test")
     array2 = DynamicArray.load(tmp_folder / "test.storearray.npz")